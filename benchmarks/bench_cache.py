@@ -0,0 +1,71 @@
+"""Compare a recommendation cache hit with scoring the catalog from scratch.
+
+Run from the repository root:
+    python -m benchmarks.bench_cache --models 2000 --runs 5
+
+Both paths go through ChooseAI.get_all_recommendations in a temporary directory holding a
+synthetic catalog. A miss loads the catalog, builds the feature table, scores every category
+and stores the result; a hit computes the keys and decodes the stored rankings without
+touching the catalog. Exits with status 1 when the rankings differ.
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import tempfile
+import time
+from benchmarks.bench_scoring import CATEGORIES, reference_system_info
+from benchmarks.synthetic_catalog import make_synthetic_catalog, write_catalog_db
+from chooseAI.chooseAI import ChooseAI
+from chooseAI.parse_ollama import init_db
+
+
+def timed_recommendations(use_cache: bool, load: bool):
+    """Seconds for one get_all_recommendations call from a fresh app, and its rankings"""
+    app = ChooseAI(use_cache=use_cache)
+    app.system_info = reference_system_info()
+    app.engine  # Created up front so both paths exclude the NumPy import
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        if load:
+            app.fetch_models()
+        results = app.get_all_recommendations(CATEGORIES)
+        elapsed = time.perf_counter() - start
+    rankings = {c: [(r["model"]["name"], r["total_score"]) for r in recs] for c, recs in results.items()}
+    return elapsed, rankings, app.feature_table is not None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            write_catalog_db(make_synthetic_catalog(args.models), init_db())
+            miss = [timed_recommendations(use_cache=False, load=True) for _ in range(args.runs)]
+            timed_recommendations(use_cache=True, load=False)  # Fills the cache
+            hit = [timed_recommendations(use_cache=True, load=False) for _ in range(args.runs)]
+        finally:
+            os.chdir(cwd)
+
+    if any(loaded for _, _, loaded in hit):
+        raise SystemExit("A cache hit loaded the catalog")
+    if hit[0][1] != miss[0][1]:
+        raise SystemExit("Cached rankings differ from freshly scored ones")
+
+    miss_s = statistics.median(s for s, _, _ in miss)
+    hit_s = statistics.median(s for s, _, _ in hit)
+    print(f"Catalog size:            {args.models:,} models, {len(CATEGORIES)} categories, {args.runs} runs (median)")
+    print(f"Load, build and score:   {miss_s * 1000:10.1f} ms")
+    print(f"Cache hit:               {hit_s * 1000:10.1f} ms")
+    print(f"Speedup:                 {miss_s / hit_s:10.1f}x")
+    print("Rankings match.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Measure how catalog loading and scoring scale with the size of the model catalog.
+
+Run from the repository root:
+    python -m benchmarks.bench_scaling --sizes 1000 10000 100000 1000000
+    python -m benchmarks.bench_scaling --save-baseline benchmarks/baseline_scaling.json
+    python -m benchmarks.bench_scaling --compare benchmarks/baseline_scaling.json
+
+For every catalog size a synthetic catalog is written to a temporary database and timed
+through each engine path:
+
+    load     get_all_models() reading the database
+    build    building the feature table (vectorized path only)
+    score    ranking every category, top-k selection included
+    top_k    selecting the best k of n scores on their own
+    memory   peak traced allocations (MB) of load, build and score
+
+The scalar path is skipped above --max-scalar-models; it takes minutes at 1M models.
+Timings are medians of --runs repeats. Memory is traced in a separate pass, because
+tracemalloc slows the code it traces. --compare exits with status 1 when a timing or
+memory figure exceeds the baseline by more than --tolerance.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from benchmarks.bench_scoring import CATEGORIES, reference_system_info
+from benchmarks.synthetic_catalog import make_synthetic_catalog, write_catalog_db
+from chooseAI import parse_ollama
+from chooseAI.recommendation_engine import ModelRecommendationEngine
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BASELINE_VERSION = 1
+# Stages whose timings are too small to compare reliably (ms)
+NOISE_FLOOR_MS = 10.0
+# Peak-memory growth smaller than this is allocator noise, however large in relative terms (MB)
+NOISE_FLOOR_MB = 1.0
+
+
+def median_ms(func: Callable, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def peak_mb(func: Callable):
+    """Peak memory traced while func runs, and its result"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2 ** 20, result
+
+
+def scalar_rank_all(engine, system_info: Dict, models: List[Dict], top: int) -> Dict[str, List[Dict]]:
+    return {category: engine.recommend_models(system_info, models, category, top) for category in CATEGORIES}
+
+
+def scalar_top_k(scores: List[float], top: int) -> List[Dict]:
+    """The scalar path's selection: sort every scored recommendation, keep the first k"""
+    recommendations = [{"total_score": s} for s in scores]
+    recommendations.sort(key=lambda x: x["total_score"], reverse=True)
+    return recommendations[:top]
+
+
+def bench_size(n: int, runs: int, top: int, max_scalar_models: int, seed: int) -> Dict:
+    engine = ModelRecommendationEngine()
+    system_info = reference_system_info()
+    catalog = make_synthetic_catalog(n, seed=seed)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # DB_FILE is relative to the working directory, as in the CLI
+        os.chdir(directory)
+        try:
+            conn = parse_ollama.init_db()
+            write_catalog_db(catalog, conn)
+            conn.close()
+            del catalog
+
+            load_mb, models = peak_mb(parse_ollama.get_all_models)
+            load_ms = median_ms(parse_ollama.get_all_models, runs)
+        finally:
+            os.chdir(cwd)
+
+    build_mb, table = peak_mb(lambda: engine.build_feature_table(models))
+    rng = random.Random(seed)
+    scores = [rng.random() for _ in range(n)]
+    score_array = np.array(scores)
+    mask = np.ones(n, dtype=bool)
+
+    vectorized_score_mb, _ = peak_mb(lambda: engine.recommend_all(system_info, table, CATEGORIES, top))
+    result = {
+        "models": n,
+        "load_ms": load_ms,
+        "load_mb": load_mb,
+        "vectorized": {
+            "build_ms": median_ms(lambda: engine.build_feature_table(models), runs),
+            "build_mb": build_mb,
+            "score_ms": median_ms(lambda: engine.recommend_all(system_info, table, CATEGORIES, top), runs),
+            "score_mb": vectorized_score_mb,
+            "top_k_ms": median_ms(lambda: engine._top_k(score_array, mask, top), runs),
+        },
+        "scalar": None,
+    }
+
+    if n <= max_scalar_models:
+        scalar_score_mb, _ = peak_mb(lambda: scalar_rank_all(engine, system_info, models, top))
+        result["scalar"] = {
+            "score_ms": median_ms(lambda: scalar_rank_all(engine, system_info, models, top), runs),
+            "score_mb": scalar_score_mb,
+            "top_k_ms": median_ms(lambda: scalar_top_k(scores, top), runs),
+        }
+    del models, table
+    gc.collect()
+    return result
+
+
+def environment() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": os.cpu_count(),
+        "sqlite": sqlite3.sqlite_version,
+    }
+
+
+def flatten(result: Dict) -> Dict[str, float]:
+    """Metric name -> value for one catalog size, e.g. 'vectorized.score_ms'"""
+    metrics = {"load_ms": result["load_ms"], "load_mb": result["load_mb"]}
+    for path in ("vectorized", "scalar"):
+        for key, value in (result[path] or {}).items():
+            metrics[f"{path}.{key}"] = value
+    return metrics
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """Metrics that got worse than the baseline by more than tolerance (a fraction)"""
+    regressions = []
+    previous = {r["models"]: flatten(r) for r in baseline["results"]}
+    for result in results:
+        before = previous.get(result["models"])
+        if before is None:
+            continue
+        for metric, value in flatten(result).items():
+            old = before.get(metric)
+            if not old or (metric.endswith("_ms") and max(old, value) < NOISE_FLOOR_MS):
+                continue
+            if metric.endswith("_mb") and value - old < NOISE_FLOOR_MB:
+                continue
+            if value > old * (1 + tolerance):
+                regressions.append(f"{result['models']:,} models {metric}: {old:.1f} -> {value:.1f} "
+                                   f"({value / old - 1:+.0%})")
+    return regressions
+
+
+def format_row(result: Dict, baseline: Optional[Dict]) -> str:
+    def cell(value: Optional[float], metric: str) -> str:
+        if value is None:
+            return f"{'-':>10}"
+        text = f"{value:10.1f}"
+        old = baseline.get(metric) if baseline else None
+        return text + (f" ({value / old - 1:+4.0%})" if old else "")
+
+    metrics = flatten(result)
+    columns = ["load_ms", "load_mb", "vectorized.build_ms", "vectorized.build_mb", "vectorized.score_ms",
+               "vectorized.score_mb", "vectorized.top_k_ms", "scalar.score_ms", "scalar.score_mb", "scalar.top_k_ms"]
+    lines = [f"{result['models']:,} models"]
+    lines += [f"  {column:<22}{cell(metrics.get(column), column)}" for column in columns]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-scalar-models", type=int, default=20_000)
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results as a baseline file")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a baseline written by --save-baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown or memory growth over the baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != BASELINE_VERSION:
+            raise SystemExit(f"{args.compare} was written by an incompatible version of this benchmark")
+        if baseline.get("environment") != environment():
+            print(f"⚠️  Baseline was recorded on a different environment: {baseline.get('environment')}",
+                  file=sys.stderr)
+    baseline_by_size = {r["models"]: flatten(r) for r in baseline["results"]} if baseline else {}
+
+    results = []
+    print(f"Categories: {len(CATEGORIES)}, top {args.top}, median of {args.runs} runs")
+    for n in args.sizes:
+        result = bench_size(n, args.runs, args.top, args.max_scalar_models, args.seed)
+        results.append(result)
+        print(format_row(result, baseline_by_size.get(n)), flush=True)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": BASELINE_VERSION,
+                "environment": environment(),
+                "top": args.top,
+                "recorded_at": time.time(),
+                "results": results,
+            }, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            raise SystemExit("Regressions against baseline:\n  " + "\n  ".join(regressions))
+        print(f"No regressions beyond {args.tolerance:.0%} of the baseline.")
+
+
+if __name__ == "__main__":
+    main()
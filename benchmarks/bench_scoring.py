@@ -0,0 +1,68 @@
+"""Compare the scalar and vectorized recommendation paths on a synthetic catalog.
+
+Run from the repository root:
+    python -m benchmarks.bench_scoring --models 100000
+"""
+import argparse
+import time
+from benchmarks.synthetic_catalog import make_synthetic_catalog
+from chooseAI.recommendation_engine import ModelRecommendationEngine
+from chooseAI.models.cpu import CPUInfo
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.models.ram import RAMInfo
+from chooseAI.models.storage import StorageInfo
+
+CATEGORIES = ["general llm", "code", "vision", "embedding"]
+
+
+def reference_system_info() -> dict:
+    return {
+        "cpu": CPUInfo(name="Benchmark CPU", physical_cores=8, logical_cores=16, clock_speed_ghz=3.6),
+        "gpu": GPUInfo(name="Benchmark GPU", vram_gb=8.0),
+        "ram": RAMInfo(total_gb=32.0),
+        "storage": StorageInfo(total_gb=1000.0)
+    }
+
+
+def ranking(recommendations: list) -> list:
+    return [(id(r["model"]), r["total_score"]) for r in recommendations]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=100_000)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = ModelRecommendationEngine()
+    system_info = reference_system_info()
+    models = make_synthetic_catalog(args.models)
+
+    start = time.perf_counter()
+    scalar = {
+        category: engine.recommend_models(system_info, models, category, args.top) for category in CATEGORIES
+    }
+    scalar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = engine.build_feature_table(models)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = engine.recommend_all(system_info, table, CATEGORIES, args.top)
+    vectorized_s = time.perf_counter() - start
+
+    for category in CATEGORIES:
+        if ranking(scalar[category]) != ranking(vectorized[category]):
+            raise SystemExit(f"Ranking mismatch for {category}")
+
+    print(f"Catalog size:            {args.models:,} models, {len(CATEGORIES)} categories, top {args.top}")
+    print(f"Scalar recommend_models: {scalar_s * 1000:10.1f} ms")
+    print(f"Feature table build:     {build_s * 1000:10.1f} ms (once per catalog)")
+    print(f"Vectorized recommend_all:{vectorized_s * 1000:10.1f} ms")
+    print(f"Speedup (scoring only):  {scalar_s / vectorized_s:10.1f}x")
+    print("Rankings match.")
+
+
+if __name__ == "__main__":
+    main()
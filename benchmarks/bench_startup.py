@@ -0,0 +1,87 @@
+"""Measure CLI startup: import time and time to the first recommendation.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup --runs 5
+
+Every run starts a fresh interpreter. The catalog database must already exist (no
+scraping is timed) and one untimed warm-up run fills the hardware cache, so the numbers
+reflect a repeat invocation. The recommendation cache is disabled, so every run loads the
+catalog, builds the feature table and scores each category, and the catalog database is
+only read. The local Ollama inventory is not queried. Exits with status 1 when a median
+exceeds its budget.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from chooseAI.parse_ollama import DB_FILE
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CATALOG_DIR = os.path.join(REPO_ROOT, "chooseAI")
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+"""
+
+FIRST_RECOMMENDATION_SNIPPET = """
+import contextlib, io, os, sys, time
+start = time.perf_counter()
+from chooseAI.chooseAI import ChooseAI
+os.chdir(sys.argv[1])
+app = ChooseAI(use_cache=False)
+with contextlib.redirect_stdout(io.StringIO()):
+    app.fetch_system_info()
+    app.fetch_hardware_benchmark()
+    app.fetch_models()
+    app.get_all_recommendations([category_type for _, category_type in app.categories])
+print(time.perf_counter() - start)
+"""
+
+
+def time_snippet(snippet: str, *args: str) -> float:
+    """Seconds reported by a snippet run in a fresh interpreter from the repository root"""
+    result = subprocess.run(
+        [sys.executable, "-c", snippet, *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--catalog-dir", default=DEFAULT_CATALOG_DIR,
+                        help=f"Directory containing {DB_FILE} (the CLI reads it from the working directory)")
+    parser.add_argument("--max-import-ms", type=float, default=120.0)
+    parser.add_argument("--max-first-recommendation-ms", type=float, default=1000.0)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.catalog_dir, DB_FILE)):
+        raise SystemExit(f"No {DB_FILE} in {args.catalog_dir}; run the CLI once to build the catalog")
+
+    time_snippet(FIRST_RECOMMENDATION_SNIPPET, args.catalog_dir)  # Warm-up: fills the hardware cache
+
+    import_s = statistics.median(time_snippet(IMPORT_SNIPPET) for _ in range(args.runs))
+    first_s = statistics.median(
+        time_snippet(FIRST_RECOMMENDATION_SNIPPET, args.catalog_dir) for _ in range(args.runs)
+    )
+
+    failures = []
+    if import_s * 1000 > args.max_import_ms:
+        failures.append(f"import {import_s * 1000:.1f} ms > {args.max_import_ms:g} ms")
+    if first_s * 1000 > args.max_first_recommendation_ms:
+        failures.append(f"first recommendation {first_s * 1000:.1f} ms > {args.max_first_recommendation_ms:g} ms")
+
+    print(f"Runs:                    {args.runs} (median)")
+    print(f"Import main:             {import_s * 1000:10.1f} ms (budget {args.max_import_ms:g} ms)")
+    print(f"First recommendation:    {first_s * 1000:10.1f} ms (budget {args.max_first_recommendation_ms:g} ms)")
+    if failures:
+        raise SystemExit("Startup regression: " + "; ".join(failures))
+    print("Within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import json
+import random
+from typing import Dict, List
+
+PARAMETER_SIZES = [0.5, 1, 1.5, 2, 3, 4, 7, 8, 12, 14, 27, 32, 34, 70, 72, 110, 405]
+MODEL_TYPES = ["general llm", "code", "vision", "embedding", "speech", "other"]
+TYPE_WEIGHTS = [0.45, 0.15, 0.12, 0.08, 0.03, 0.17]
+CAPABILITIES = ["tools", "thinking", "vision", "embedding", "instruct", "chat", "math", "multilingual"]
+
+
+def make_synthetic_catalog(n: int, seed: int = 0) -> List[Dict]:
+    """Generate a catalog shaped like get_all_models() output with realistic distributions"""
+    rng = random.Random(seed)
+    models = []
+    for i in range(n):
+        sizes = sorted(rng.sample(PARAMETER_SIZES, rng.randint(1, 5)))
+        # A minority of models carry their size in the name, as in "qwen2.5-coder-7b"
+        name = f"model-{i}-{sizes[0]:g}b" if rng.random() < 0.2 else f"model-{i}"
+        # Pull counts are heavy-tailed: most models are rarely pulled, a few dominate
+        pulls = int(rng.lognormvariate(9, 2.5)) if rng.random() > 0.05 else None
+        tags = rng.sample(CAPABILITIES, rng.randint(0, 3))
+        models.append({
+            "name": name,
+            "description": f"Synthetic model {i} for " + ", ".join(tags or ["chat"]),
+            "metadata": {
+                "sizes": [{"value": float(s), "unit": "b"} for s in sizes],
+                "tags": tags,
+                "updated": f"{rng.randint(1, 52)} weeks ago",
+                "type": rng.choices(MODEL_TYPES, TYPE_WEIGHTS)[0],
+            },
+            "stats": {
+                "pulls": pulls,
+            }
+        })
+    return models
+
+
+def write_catalog_db(models: List[Dict], conn):
+    """Insert a synthetic catalog into a database created by parse_ollama.init_db"""
+    conn.executemany(
+        "INSERT INTO models (name, description, sizes, tags, pulls, updated, type) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            (m["name"], m["description"], json.dumps(m["metadata"]["sizes"]), json.dumps(m["metadata"]["tags"]),
+             m["stats"]["pulls"], m["metadata"]["updated"], m["metadata"]["type"])
+            for m in models
+        )
+    )
+    conn.commit()
@@ -0,0 +1,151 @@
+import os
+import sqlite3
+import time
+from typing import Dict, List
+from chooseAI.models.calibration_result import CalibrationResult
+from chooseAI.models.installed_model import InstalledModel
+from chooseAI.ollama_client import OllamaClient
+from chooseAI.parse_ollama import DB_FILE
+
+# Fixed workload so results are comparable across models and runs
+CALIBRATION_PROMPT = (
+    "Explain in three short paragraphs how a hash map works, "
+    "including how collisions are handled and what the average lookup cost is."
+)
+CALIBRATION_OPTIONS = {"num_predict": 128, "temperature": 0, "seed": 42}
+
+
+def init_calibration_db(conn=None):
+    conn = conn or sqlite3.connect(DB_FILE)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS calibration_results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        fingerprint TEXT NOT NULL,
+        model TEXT NOT NULL,
+        parameter_size TEXT,
+        load_s REAL,
+        prompt_tps REAL,
+        generation_tps REAL,
+        measured_at REAL
+    )
+    """)
+    conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_calibration_fingerprint
+    ON calibration_results(fingerprint, model, measured_at)
+    """)
+    conn.commit()
+    return conn
+
+
+def _tokens_per_sec(count: int, duration_ns: int) -> float:
+    if not count or not duration_ns:
+        return 0.0
+    return count / (duration_ns / 1e9)
+
+
+def measure_model(client: OllamaClient, model: InstalledModel, fingerprint: str, cold: bool = True) -> CalibrationResult:
+    """
+    Run the calibration prompt once and convert Ollama's timing fields into rates
+
+    A cold run unloads the model first so load_duration covers a full load, and unloads it
+    again afterwards unless it was loaded before, so calibrating many models does not leave
+    them all resident.
+    """
+    try:
+        if cold:
+            client.unload(model.name)
+        response = client.generate(model.name, CALIBRATION_PROMPT, CALIBRATION_OPTIONS)
+    except Exception as e:
+        return CalibrationResult(
+            model=model.name,
+            fingerprint=fingerprint,
+            load_s=0.0,
+            prompt_tokens_per_sec=0.0,
+            generation_tokens_per_sec=0.0,
+            parameter_size=model.parameter_size,
+            measured_at=time.time(),
+            error=f"Calibration failed: {str(e)}"
+        )
+    finally:
+        if cold and not model.loaded:
+            try:
+                client.unload(model.name)
+            except Exception:
+                pass  # The measurement stands; Ollama evicts the model after keep_alive anyway
+
+    return CalibrationResult(
+        model=model.name,
+        fingerprint=fingerprint,
+        load_s=response.get("load_duration", 0) / 1e9,
+        prompt_tokens_per_sec=_tokens_per_sec(response.get("prompt_eval_count"), response.get("prompt_eval_duration")),
+        generation_tokens_per_sec=_tokens_per_sec(response.get("eval_count"), response.get("eval_duration")),
+        parameter_size=model.parameter_size,
+        measured_at=time.time()
+    )
+
+
+def record_result(conn, result: CalibrationResult):
+    conn.execute("""
+        INSERT INTO calibration_results
+            (fingerprint, model, parameter_size, load_s, prompt_tps, generation_tps, measured_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (
+        result.fingerprint,
+        result.model,
+        result.parameter_size,
+        result.load_s,
+        result.prompt_tokens_per_sec,
+        result.generation_tokens_per_sec,
+        result.measured_at
+    ))
+    conn.commit()
+
+
+def calibrate_models(models: List[InstalledModel], fingerprint: str,
+                     client: OllamaClient = None, conn=None, cold: bool = True) -> List[CalibrationResult]:
+    """Measure each installed model on this hardware and store successful results"""
+    client = client or OllamaClient()
+    own_conn = conn is None
+    conn = init_calibration_db(conn)
+    results = []
+    try:
+        for model in models:
+            result = measure_model(client, model, fingerprint, cold=cold)
+            if not result.error:
+                record_result(conn, result)
+            results.append(result)
+    finally:
+        if own_conn:
+            conn.close()
+    return results
+
+
+def load_measurements(fingerprint: str, conn=None) -> Dict[str, CalibrationResult]:
+    """Latest measurement per model for a hardware fingerprint"""
+    if conn is None and not os.path.exists(DB_FILE):
+        return {}  # Creating the file here would make fetch_models skip the first scrape
+    own_conn = conn is None
+    conn = init_calibration_db(conn)
+    try:
+        rows = conn.execute("""
+            SELECT model, parameter_size, load_s, prompt_tps, generation_tps, MAX(measured_at)
+            FROM calibration_results
+            WHERE fingerprint = ?
+            GROUP BY model
+        """, (fingerprint,)).fetchall()
+    finally:
+        if own_conn:
+            conn.close()
+
+    return {
+        r[0]: CalibrationResult(
+            model=r[0],
+            fingerprint=fingerprint,
+            parameter_size=r[1],
+            load_s=r[2],
+            prompt_tokens_per_sec=r[3],
+            generation_tokens_per_sec=r[4],
+            measured_at=r[5]
+        )
+        for r in rows
+    }
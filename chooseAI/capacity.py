@@ -0,0 +1,135 @@
+import math
+from typing import List, Optional
+from chooseAI.models.capacity_plan import CapacityPlan
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.models.memory_footprint import MemoryFootprint
+from chooseAI.models.throughput import HardwareRates, OffloadPlan
+from chooseAI.memory_estimator import GIB, estimate_kv_cache_bytes, estimate_memory_footprint
+from chooseAI.throughput import gpu_layer_capacity, plan_offload, usable_vram_gb
+
+# Parallel slots tried per model; Ollama gains little beyond this on a single host
+MAX_PARALLEL = 64
+# Stop adding slots once one more raises request capacity by less than this fraction
+MIN_SLOT_GAIN = 0.01
+
+
+def max_loaded_copies(footprint: MemoryFootprint, offload: OffloadPlan, gpus: Optional[List[GPUInfo]],
+                      usable_ram_gb: float) -> int:
+    """
+    Copies of a model that stay resident at once if each gets the same split as the first
+
+    VRAM and RAM are separate pools: a copy planned entirely on the GPUs needs GPU room for
+    every extra copy, so spare system RAM does not add copies, and the reverse.
+
+    Args:
+        footprint: Memory footprint of one copy
+        offload: Layer split of one copy
+        gpus: GPUs the split refers to
+        usable_ram_gb: System RAM the model may use
+
+    Returns:
+        At least 1 (the copy the plan was made for)
+    """
+    _, _, layer_gb = gpu_layer_capacity(footprint, None)
+    free_vram = {g.index: usable_vram_gb(g) for g in (gpus or [])}
+    limits = [
+        free_vram.get(index, 0.0) / (layers * layer_gb + footprint.overhead_gb)
+        for index, layers in zip(offload.gpu_indices, offload.gpu_layers)
+    ]
+    if offload.cpu_gb:
+        limits.append(usable_ram_gb / offload.cpu_gb)
+    return max(1, math.floor(min(limits))) if limits else 1
+
+
+def plan_capacity(parameters_b: float,
+                  rates: HardwareRates,
+                  gpus: Optional[List[GPUInfo]],
+                  usable_ram_gb: float,
+                  request_rate: float,
+                  context_length: int,
+                  prompt_tokens: int,
+                  output_tokens: int,
+                  quant_bits: float = None,
+                  kv_cache_bits: float = 16.0,
+                  max_latency_s: float = None) -> Optional[CapacityPlan]:
+    """
+    Find the fewest parallel slots that serve request_rate, or the most a host can serve
+
+    Ollama gives every parallel slot its own context_length KV cache, so each slot adds
+    memory and can push layers off the GPUs. Batched decoding reads the weights once per
+    step for all slots plus every slot's own KV cache, until compute (the prompt-eval rate)
+    becomes the bound. Prompts are evaluated one request at a time.
+
+    Args:
+        parameters_b: Parameter count in billions
+        rates: CPU bandwidth and compute
+        gpus: GPUs available for offloading
+        usable_ram_gb: System RAM the model may use
+        request_rate: Target requests per second
+        context_length: Context window of every slot
+        prompt_tokens: Average prompt length of a request
+        output_tokens: Average generated tokens of a request
+        quant_bits: Bits per weight (defaults to Q4_K_M)
+        kv_cache_bits: Bits per KV cache element
+        max_latency_s: Slowest acceptable end-to-end request time (optional)
+
+    Returns:
+        CapacityPlan, or None if a single slot does not fit in memory or within max_latency_s
+    """
+    if request_rate <= 0:
+        raise ValueError("request_rate must be positive")
+
+    kv_slot_gb = estimate_kv_cache_bytes(parameters_b, context_length, kv_cache_bits) / GIB
+    # A request attends to its prompt plus, on average, half of its answer
+    kv_read_gb = estimate_kv_cache_bytes(parameters_b, prompt_tokens + output_tokens / 2, kv_cache_bits) / GIB
+
+    best = None
+    single_stream = None
+    limited_by = "max_parallel"
+    for slots in range(1, MAX_PARALLEL + 1):
+        footprint = estimate_memory_footprint(
+            parameters_b, quant_bits=quant_bits, context_length=context_length * slots, kv_cache_bits=kv_cache_bits
+        )
+        offload, generation_s, prompt_s = plan_offload(footprint, rates, gpus)
+        if offload.cpu_layers and offload.cpu_gb > usable_ram_gb:
+            limited_by = "memory"
+            break
+
+        step_s = max(generation_s * (1 + slots * kv_read_gb / footprint.weights_gb), slots * prompt_s)
+        prefill_s = prompt_tokens * prompt_s
+        latency_s = prefill_s + output_tokens * step_s
+        if max_latency_s is not None and latency_s > max_latency_s:
+            limited_by = "latency"
+            break
+        requests_per_sec = 1.0 / (prefill_s + output_tokens * step_s / slots)
+        if single_stream is None:
+            single_stream = 1.0 / step_s
+
+        if best is not None and requests_per_sec < best.max_requests_per_sec * (1 + MIN_SLOT_GAIN):
+            limited_by = "compute"
+            break
+        best = CapacityPlan(
+            context_length=context_length,
+            kv_cache_per_slot_gb=kv_slot_gb,
+            num_parallel=slots,
+            max_loaded_models=max_loaded_copies(footprint, offload, gpus, usable_ram_gb),
+            memory_gb=footprint.total_gb,
+            single_stream_tokens_per_sec=single_stream,
+            per_request_tokens_per_sec=1.0 / step_s,
+            aggregate_tokens_per_sec=slots / step_s,
+            latency_s=latency_s,
+            max_requests_per_sec=requests_per_sec,
+            target_requests_per_sec=request_rate,
+            hosts_needed=1,
+            limited_by=limited_by,
+            offload=offload
+        )
+        if best.meets_target:
+            limited_by = "target"
+            break
+
+    if best is None:
+        return None
+    best.limited_by = limited_by
+    best.hosts_needed = max(1, math.ceil(request_rate / best.max_requests_per_sec))
+    return best
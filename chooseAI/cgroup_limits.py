@@ -0,0 +1,119 @@
+import os
+from typing import Dict, List, Optional
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+# cgroup v1 reports "no limit" as a page-aligned LONG_MAX
+UNLIMITED_THRESHOLD = 1 << 60
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_int(path: str) -> Optional[int]:
+    value = _read(path)
+    if value is None or value == "max":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def parse_proc_cgroup(text: str) -> Dict[str, str]:
+    """Map controller name ('' for the v2 unified hierarchy) to this process's cgroup path"""
+    paths = {}
+    for line in text.splitlines():
+        parts = line.split(":", 2)
+        if len(parts) != 3:
+            continue
+        _, controllers, path = parts
+        for controller in controllers.split(",") if controllers else [""]:
+            paths[controller] = path
+    return paths
+
+
+def _candidate_dirs(base: str, path: str) -> List[str]:
+    """The process's cgroup directory and its ancestors; limits of any ancestor apply too"""
+    dirs = []
+    path = path.strip("/")
+    while True:
+        directory = os.path.join(base, path) if path else base
+        if os.path.isdir(directory):
+            dirs.append(directory)
+        if not path:
+            break
+        path = os.path.dirname(path)
+    return dirs
+
+
+class CgroupLimits:
+    """Memory and CPU limits of the cgroup (v1 or v2) this process runs in"""
+
+    def __init__(self, root: str = CGROUP_ROOT, proc_cgroup: str = "/proc/self/cgroup"):
+        self.root = root
+        self.paths = parse_proc_cgroup(_read(proc_cgroup) or "")
+        self.is_v2 = os.path.exists(os.path.join(root, "cgroup.controllers"))
+
+    def _dirs(self, controller: str) -> List[str]:
+        if self.is_v2:
+            return _candidate_dirs(self.root, self.paths.get("", "/"))
+        return _candidate_dirs(os.path.join(self.root, controller), self.paths.get(controller, "/"))
+
+    def memory_limit_bytes(self) -> Optional[int]:
+        """Tightest memory limit on this process, or None when unlimited"""
+        name = "memory.max" if self.is_v2 else "memory.limit_in_bytes"
+        limits = [
+            limit for limit in (_read_int(os.path.join(d, name)) for d in self._dirs("memory"))
+            if limit is not None and 0 < limit < UNLIMITED_THRESHOLD
+        ]
+        return min(limits) if limits else None
+
+    def memory_working_set_bytes(self) -> Optional[int]:
+        """Memory charged to this cgroup minus reclaimable page cache, as the OOM killer sees it"""
+        dirs = self._dirs("memory")
+        if not dirs:
+            return None
+        directory = dirs[0]
+        usage = _read_int(os.path.join(directory, "memory.current" if self.is_v2 else "memory.usage_in_bytes"))
+        if usage is None:
+            return None
+
+        inactive_file = 0
+        for line in (_read(os.path.join(directory, "memory.stat")) or "").splitlines():
+            key, _, value = line.partition(" ")
+            if key in ("inactive_file", "total_inactive_file"):
+                inactive_file = int(value)
+                break
+        return max(0, usage - inactive_file)
+
+    def cpu_quota(self) -> Optional[float]:
+        """CPUs' worth of time this process may use (e.g. 2.5), or None when unlimited"""
+        quotas = []
+        for directory in self._dirs("cpu"):
+            if self.is_v2:
+                value = _read(os.path.join(directory, "cpu.max"))
+                if not value:
+                    continue
+                quota, _, period = value.partition(" ")
+                if quota == "max":
+                    continue
+                quota, period = int(quota), int(period or 100000)
+            else:
+                quota = _read_int(os.path.join(directory, "cpu.cfs_quota_us"))
+                period = _read_int(os.path.join(directory, "cpu.cfs_period_us"))
+                if quota is None or quota <= 0 or not period:
+                    continue
+            quotas.append(quota / period)
+        return min(quotas) if quotas else None
+
+
+def cpu_affinity_count() -> Optional[int]:
+    """CPUs this process is allowed to run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return None
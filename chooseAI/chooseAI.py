@@ -1,18 +1,45 @@
 import platform
-import os
-from typing import Optional
-from chooseAI.recommendation_engine import ModelRecommendationEngine
-from chooseAI.parse_ollama import fetch_models, get_all_models
+import sys
+from typing import TYPE_CHECKING, Optional
+from chooseAI.parse_ollama import catalog_exists, fetch_models, get_all_models, search_models
 from chooseAI.systemInfo import SystemInformation
+from chooseAI.inventory import ModelInventory
+from chooseAI.fingerprint import hardware_fingerprint
+from chooseAI.calibration import calibrate_models, load_measurements
+from chooseAI.storage_benchmark import get_storage_benchmark, load_cached_storage_benchmark
+from chooseAI.tracing import span, traced
+
+if TYPE_CHECKING:
+    from chooseAI.recommendation_engine import ModelRecommendationEngine
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration in seconds as a short human-readable string"""
+    if seconds < 1:
+        return "<1s"
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
 
 
 class ChooseAI:
     """Main class to handle AI model recommendations"""
 
-    def __init__(self):
+    def __init__(self, min_tokens_per_sec: float = None, run_benchmark: bool = False,
+                 refresh_hardware: bool = False, use_cache: bool = True):
         self.system_info = None
         self.models = None
-        self.engine = ModelRecommendationEngine()
+        self.feature_table = None
+        self.inventory = None
+        self._engine = None
+        self.min_tokens_per_sec = min_tokens_per_sec
+        self.run_benchmark = run_benchmark
+        self.refresh_hardware = refresh_hardware
+        self.use_cache = use_cache
+        self.benchmark = None
+        self.storage_benchmark = None
         self.categories = [
             ("General/Chat", "general llm"),
             ("Code/Programming", "code"),
@@ -20,6 +47,14 @@ class ChooseAI:
             ("Embedding", "embedding")
         ]
 
+    @property
+    def engine(self) -> "ModelRecommendationEngine":
+        """Recommendation engine, created on first use so search and calibrate never load NumPy"""
+        if self._engine is None:
+            from chooseAI.recommendation_engine import ModelRecommendationEngine
+            self._engine = ModelRecommendationEngine()
+        return self._engine
+
     def get_system_info_handler(self) -> SystemInformation:
         """Get the appropriate system info handler"""
         current_os = platform.system().lower()
@@ -35,16 +70,94 @@ class ChooseAI:
         else:
             raise OSError(f"Unsupported operating system: {current_os}")
 
+    @traced
     def fetch_system_info(self):
         """Fetch and store system information"""
         try:
             print("📊 Analyzing your system...")
             system_handler = self.get_system_info_handler()
-            self.system_info = system_handler.get_system_info()
+            self.system_info = system_handler.get_system_info(use_cache=not self.refresh_hardware)
+            total_s = self.system_info["probe_timings"]["total"]
+            cached = ", ".join(self.system_info["cached_probes"])
+            if cached:
+                print(f"⏱️  Hardware probed in {total_s:.2f}s ({cached} from cache)")
+            else:
+                print(f"⏱️  Hardware probed in {total_s:.2f}s")
         except Exception as e:
             print(f"❌ Error getting system information: {e}")
             raise
 
+    @traced
+    def fetch_hardware_benchmark(self):
+        """Use measured bandwidth/compute for this host (probing first if requested)"""
+        from chooseAI.micro_benchmark import benchmark_to_rates, get_benchmark, load_cached_benchmark
+
+        fingerprint = hardware_fingerprint(self.system_info)
+        if self.run_benchmark:
+            print("📏 Measuring memory bandwidth and compute (a few seconds)...")
+            self.benchmark = get_benchmark(fingerprint, refresh=True,
+                                           l3_cache_kb=self.system_info["cpu"].l3_cache_kb,
+                                           available_ram_gb=self.system_info["ram"].available_gb)
+        else:
+            self.benchmark = load_cached_benchmark(fingerprint)
+
+        if self.benchmark:
+            self.engine.hardware_rates = benchmark_to_rates(self.benchmark)
+
+        try:
+            if self.run_benchmark:
+                print("📏 Measuring disk read speed of the models directory...")
+                self.storage_benchmark = get_storage_benchmark(fingerprint, refresh=True)
+            else:
+                self.storage_benchmark = load_cached_storage_benchmark(fingerprint)
+        except OSError as e:
+            print(f"⚠️  Could not measure disk read speed: {e}")
+
+        if self.storage_benchmark and self.storage_benchmark.read_mb_s > 0:
+            self.engine.disk_read_mb_s = self.storage_benchmark.read_mb_s
+
+    @traced
+    def fetch_calibration(self):
+        """Load speeds measured by earlier calibration runs on this hardware"""
+        try:
+            self.engine.measurements = load_measurements(hardware_fingerprint(self.system_info))
+        except Exception as e:
+            print(f"⚠️  Could not load calibration results: {e}")
+            return
+        if self.engine.measurements:
+            print(f"📐 Using measured speeds for {len(self.engine.measurements)} calibrated models")
+
+    def calibrate(self, model_names: list = None, cold: bool = True):
+        """Measure real load time and tokens/sec of installed models and store them"""
+        self.fetch_system_info()
+        self.fetch_inventory()
+        if self.inventory.error:
+            return []
+
+        candidates = self.inventory.installed()
+        if model_names:
+            wanted = set(model_names)
+            candidates = [m for m in candidates if m.name in wanted or m.name.split(":")[0] in wanted]
+        if not candidates:
+            print("❌ No installed models to calibrate.")
+            return []
+
+        print(f"📐 Calibrating {len(candidates)} models (this loads each model once)...")
+        results = calibrate_models(candidates, hardware_fingerprint(self.system_info), cold=cold)
+
+        print("=" * 60)
+        print("CALIBRATION RESULTS")
+        print("=" * 60)
+        for result in results:
+            if result.error:
+                print(f"❌ {result.model}: {result.error}")
+                continue
+            print(f"✅ {result.model}")
+            print(f"   Load: {result.load_s:.1f}s | Prompt: {result.prompt_tokens_per_sec:.0f} tokens/sec | "
+                  f"Generation: {result.generation_tokens_per_sec:.1f} tokens/sec")
+        return results
+
+    @traced
     def display_system_info(self):
         """Display system information in a formatted way"""
         print("=" * 60)
@@ -59,56 +172,157 @@ class ChooseAI:
         print(f"🖥️  CPU: {cpu.name}")
         if cpu.physical_cores:
             print(f"   Cores: {cpu.physical_cores} physical, {cpu.logical_cores} logical")
+        if cpu.effective_cores and cpu.effective_cores < cpu.physical_cores:
+            limits = []
+            if cpu.cpu_quota:
+                limits.append(f"quota {cpu.cpu_quota:g} CPUs")
+            if cpu.affinity_cores:
+                limits.append(f"affinity {cpu.affinity_cores} CPUs")
+            print(f"   Usable: {cpu.effective_cores} cores ({', '.join(limits)})")
         if cpu.clock_speed_ghz:
             print(f"   Clock Speed: {cpu.clock_speed_ghz} GHz")
+        if cpu.isa_features:
+            print(f"   Instructions: {', '.join(cpu.isa_features)}")
+        if cpu.numa_nodes > 1:
+            nodes = ", ".join(f"{cpus} CPUs/{memory:g} GB" for cpus, memory in zip(cpu.numa_cpus, cpu.numa_memory_gb))
+            print(f"   NUMA: {cpu.numa_nodes} nodes ({nodes})")
+        if cpu.l3_cache_kb or cpu.l2_cache_kb:
+            caches = [f"{level} {size / 1024:g} MB" for level, size in (("L2", cpu.l2_cache_kb), ("L3", cpu.l3_cache_kb)) if size]
+            print(f"   Cache: {', '.join(caches)}")
+        if self.benchmark:
+            print(f"   Measured: {self.benchmark.memory_bandwidth_gb_s:.1f} GB/s memory over "
+                  f"{self.benchmark.threads} threads ({self.benchmark.single_core_bandwidth_gb_s:.1f} GB/s on one), "
+                  f"{self.benchmark.fp32_gflops:.0f} GFLOPS fp32")
         if cpu.error:
             print(f"   ⚠️  Warning: {cpu.error}")
 
-        print(f"\n🎮 GPU: {gpu.name}")
-        if gpu.vram_gb > 0:
-            print(f"   VRAM: {gpu.vram_gb} GB")
-        if gpu.error:
-            print(f"   ⚠️  Warning: {gpu.error}")
+        for gpu in self.system_info.get("gpus") or [gpu]:
+            label = f"GPU {gpu.index}" if len(self.system_info.get("gpus") or []) > 1 else "GPU"
+            print(f"\n🎮 {label}: {gpu.name}")
+            if gpu.vram_gb > 0:
+                free = f" ({gpu.free_vram_gb} GB free)" if gpu.free_vram_gb is not None else ""
+                print(f"   VRAM: {gpu.vram_gb} GB{free}")
+            if gpu.error:
+                print(f"   ⚠️  Warning: {gpu.error}")
 
         print(f"\n💾 RAM: {ram.total_gb} GB")
+        if ram.limit_gb is not None:
+            print(f"   Container limit: {ram.limit_gb} GB")
+        if ram.available_gb is not None:
+            print(f"   Available: {ram.available_gb} GB")
         if ram.error:
             print(f"   ⚠️  Warning: {ram.error}")
 
         print(f"\n💿 Storage: {storage.total_gb} GB")
+        if storage.free_gb is not None:
+            print(f"   Free: {storage.free_gb} GB ({storage.path})")
+        if self.storage_benchmark:
+            cache_note = " (page cache not bypassed)" if self.storage_benchmark.method == "cached" else ""
+            print(f"   Measured: {self.storage_benchmark.read_mb_s:.0f} MB/s sequential read{cache_note}")
         if storage.error:
             print(f"   ⚠️  Warning: {storage.error}")
 
         print()
 
-    def fetch_models(self):
-        """Fetch and store model information"""
-        if not os.path.exists("ollama_models.db"):
+    @traced
+    def fetch_models(self, load: bool = True):
+        """Fetch and store model information
+
+        Args:
+            load: Also load the catalog and build the feature table; run() defers this until a
+                category misses the recommendation cache
+        """
+        if not catalog_exists():
             print("📥 Fetching latest model information from Ollama...")
             try:
-                fetch_models()
+                with span("scrape_catalog"):
+                    fetch_models()
                 print("✅ Model database updated successfully!")
             except Exception as e:
                 print(f"❌ Error fetching models: {e}")
                 raise
+        if load:
+            self.load_models()
+
+    def load_models(self):
+        """Load the catalog from the database and build the feature table"""
         try:
-            self.models = get_all_models()
+            with span("load_catalog"):
+                self.models = get_all_models()
+            with span("build_feature_table", models=len(self.models)):
+                self.feature_table = self.engine.build_feature_table(self.models)
             print(f"📋 Found {len(self.models)} models in database")
         except Exception as e:
             print(f"❌ Error loading models: {e}")
             raise
 
+    @traced
+    def fetch_inventory(self):
+        """Fetch models already installed in the local Ollama instance"""
+        self.inventory = ModelInventory().refresh()
+        if self.inventory.error:
+            print(f"⚠️  Could not read installed models: {self.inventory.error}")
+        else:
+            loaded = len(self.inventory.loaded())
+            print(f"📦 Found {len(self.inventory.installed())} installed models ({loaded} loaded)")
+
     def get_recommendations(self, category_type: str, max_results: int = 5):
         """Generate recommendations for a specific category"""
+        return self.get_all_recommendations([category_type], max_results).get(category_type, [])
+
+    @traced
+    def get_all_recommendations(self, category_types: list, max_results: int = 5) -> dict:
+        """Generate recommendations for several categories in one scoring pass, reusing cached rankings"""
+        cache, keys, results = None, {}, {}
+        if self.use_cache:
+            try:
+                from chooseAI.recommendation_cache import RecommendationCache, recommendation_key
+                cache = RecommendationCache()
+                for category_type in category_types:
+                    with span("cache_lookup", category=category_type):
+                        keys[category_type] = recommendation_key(
+                            self.system_info, self.engine, category_type, max_results,
+                            self.inventory, self.min_tokens_per_sec, cache.catalog_version
+                        )
+                        cached = cache.get(keys[category_type])
+                    if cached is not None:
+                        results[category_type] = cached
+            except Exception as e:
+                print(f"⚠️  Recommendation cache unavailable: {e}")
+                cache = None
+
+        missing = [t for t in category_types if t not in results]
         try:
-            return self.engine.recommend_models(
-                system_info=self.system_info,
-                models=self.models,
-                preferred_type=category_type,
-                max_results=max_results
-            )
+            if missing:
+                if self.feature_table is None:
+                    self.load_models()
+                with span("score", categories=", ".join(missing)):
+                    results.update(self.engine.recommend_all(
+                        system_info=self.system_info,
+                        table=self.feature_table,
+                        preferred_types=missing,
+                        max_results=max_results,
+                        inventory=self.inventory,
+                        min_tokens_per_sec=self.min_tokens_per_sec
+                    ))
         except Exception as e:
-            print(f"❌ Error generating recommendations for {category_type}: {e}")
-            return []
+            print(f"❌ Error generating recommendations for {', '.join(missing)}: {e}")
+            return results
+
+        if cache:
+            try:
+                with span("cache_store", categories=len(missing)):
+                    for category_type in missing:
+                        cache.put(keys[category_type], category_type, results.get(category_type, []))
+                    lifetime = cache.lifetime_stats()
+                lookups = lifetime["hits"] + lifetime["misses"]
+                print(f"💾 Recommendation cache: {cache.hits} hits, {cache.misses} misses "
+                      f"({lifetime['hits'] / lookups:.0%} hit rate over {lookups} lookups)")
+            except Exception as e:
+                print(f"⚠️  Could not update recommendation cache: {e}")
+            finally:
+                cache.close()
+        return results
 
     def display_recommendations(self, recommendations, category: str):
         """Display model recommendations in a formatted way"""
@@ -135,9 +349,137 @@ class ChooseAI:
 
             emoji = emoji_map.get(compatibility, "⚪")
 
-            print(f"{i}. {emoji} {model['name'].split(" ")[0]} ({compatibility})")
+            print(f"{i}. {emoji} {model['name'].split(' ')[0]} ({compatibility})")
             print(f"   Score: {rec['total_score']:.2f}/1.0 | Size: {rec['model_size']}")
+
+            throughput = rec.get("throughput")
+            if throughput:
+                source = " measured" if rec.get("measurement") else ""
+                print(f"   ⚡ ~{throughput.generation_tokens_per_sec:.1f} tokens/sec{source} "
+                      f"(prompt ~{throughput.prompt_tokens_per_sec:.0f} tokens/sec)")
+
+            offload = throughput.offload if throughput else None
+            if offload and offload.num_gpu:
+                split = ", ".join(f"GPU {i}: {n}" for i, n in zip(offload.gpu_indices, offload.gpu_layers))
+                if offload.cpu_layers:
+                    split += f", CPU: {offload.cpu_layers}"
+                print(f"   🧩 num_gpu={offload.num_gpu}/{offload.total_layers} layers ({split})")
+                if offload.speed_penalty >= 0.01:
+                    print(f"      ~{offload.speed_penalty:.0%} slower than running fully in VRAM")
+
+            runtime = rec.get("runtime")
+            if runtime:
+                options = ", ".join(f"{key}={value}" for key, value in runtime.options().items())
+                print(f"   ⚙️  Ollama options: {options}")
+                if runtime.launch_prefix:
+                    print(f"      Start the server pinned to NUMA node {runtime.numa_node}: "
+                          f"{runtime.launch_prefix} ollama serve")
+
+            installed = rec.get("installed")
+            if installed:
+                status = "loaded" if installed.loaded else "installed"
+                print(f"   📦 {installed.name} {status} ({installed.quantization or 'unknown quant'}, "
+                      f"{installed.size_bytes / 1e9:.1f} GB)")
+
+            ttfa = rec.get("time_to_first_answer")
+            if ttfa and installed and installed.loaded:
+                print(f"   ⏱️  Ready now (cold load ~{format_duration(ttfa['cold_load_s'])})")
+            elif ttfa:
+                print(f"   ⏱️  Ready in ~{format_duration(ttfa['total_s'])} "
+                      f"(download {format_duration(ttfa['download_s'])}, load {format_duration(ttfa['load_s'])})")
+            print()
+
+    def search(self, query: str, max_results: int = 10):
+        """Search the model catalog and display ranked matches"""
+        if not catalog_exists():
+            self.fetch_models()
+
+        results = search_models(query, limit=max_results)
+        if not results:
+            print(f"❌ No models found for \"{query}\".")
+            return results
+
+        print("=" * 60)
+        print(f"SEARCH RESULTS - {query}")
+        print("=" * 60)
+
+        for i, model in enumerate(results, 1):
+            sizes = ", ".join(
+                f"{s['value']:g}{s['unit']}" for s in model["metadata"]["sizes"]
+                if isinstance(s.get("value"), (int, float))
+            )
+            print(f"{i}. {model['name'].split()[0]} ({model['metadata']['type']})")
+            print(f"   Relevance: {model['rank']:.2f} | Sizes: {sizes or 'unknown'} | Pulls: {model['stats']['pulls'] or 0:,}")
+            print()
+        return results
+
+    def fleet(self, input_path: str, output_path: str = "-", categories: list = None, max_results: int = 5,
+              workers: int = None, input_format: str = None, output_format: str = None):
+        """Score the catalog for every host profile in a file (see chooseAI.fleet)"""
+        from chooseAI.fleet import run_fleet
+
+        stats = run_fleet(input_path, output_path, categories=categories, max_results=max_results,
+                          workers=workers, min_tokens_per_sec=self.min_tokens_per_sec,
+                          input_format=input_format, output_format=output_format)
+        # Progress goes to stderr so results can stream to stdout
+        print(f"🚚 {stats['hosts']} hosts, {stats['profiles_scored']} distinct profiles scored, "
+              f"{stats['errors']} errors", file=sys.stderr)
+        return stats
+
+    def capacity(self, request_rate: float, category_type: str = "general llm", context_length: int = None,
+                 prompt_tokens: int = None, output_tokens: int = 256, max_latency_s: float = None,
+                 max_results: int = 5):
+        """Size this host for serving request_rate requests/sec of a model type"""
+        self.fetch_system_info()
+        self.fetch_hardware_benchmark()
+        self.fetch_models()
+        self.fetch_inventory()
+
+        def recommend(latency_limit):
+            return self.engine.recommend_capacity(
+                self.system_info, self.feature_table, category_type, request_rate,
+                context_length=context_length, prompt_tokens=prompt_tokens, output_tokens=output_tokens,
+                max_latency_s=latency_limit, max_results=max_results, inventory=self.inventory
+            )
+
+        try:
+            recommendations = recommend(max_latency_s)
+            # Tell a latency limit apart from models that do not fit at all
+            unlimited = recommend(None) if not recommendations and max_latency_s is not None else []
+        except Exception as e:
+            print(f"❌ Error planning capacity: {e}")
+            return []
+        if unlimited:
+            fastest = min(unlimited, key=lambda rec: rec["capacity"].latency_s)
+            print(f"❌ No {category_type} model answers within {max_latency_s:g}s; the fastest, "
+                  f"{fastest['model']['name'].split(' ')[0]} ({fastest['model_size']}), "
+                  f"needs ~{fastest['capacity'].latency_s:.1f}s per request.")
+            return recommendations
+        if not recommendations:
+            print(f"❌ No {category_type} models fit this host.")
+            return recommendations
+
+        print("=" * 60)
+        print(f"CAPACITY PLAN - {request_rate:g} requests/sec, {category_type.upper()}")
+        print("=" * 60)
+
+        for i, rec in enumerate(recommendations, 1):
+            plan = rec["capacity"]
+            status = "meets target" if plan.meets_target else f"needs {plan.hosts_needed} hosts like this"
+            print(f"{i}. {rec['model']['name'].split(' ')[0]} ({rec['model_size']}, {status})")
+            print(f"   Capacity: ~{plan.max_requests_per_sec:.2f} requests/sec with {plan.num_parallel} parallel "
+                  f"(limited by {plan.limited_by}), ~{plan.latency_s:.1f}s per request")
+            print(f"   ⚡ ~{plan.aggregate_tokens_per_sec:.1f} tokens/sec total, "
+                  f"~{plan.per_request_tokens_per_sec:.1f} per request "
+                  f"(~{plan.single_stream_tokens_per_sec:.1f} when alone)")
+            print(f"   🧠 KV cache: {plan.kv_cache_per_slot_gb:.2f} GB per slot at {plan.context_length} tokens, "
+                  f"{plan.memory_gb:.1f} GB per loaded copy")
+            if plan.offload and plan.offload.num_gpu:
+                print(f"   🧩 num_gpu={plan.offload.num_gpu}/{plan.offload.total_layers} layers")
+            settings = " ".join(f"{key}={value}" for key, value in plan.environment().items())
+            print(f"   ⚙️  {settings} ollama serve")
             print()
+        return recommendations
 
     def run(self):
         """Main execution method"""
@@ -146,16 +488,21 @@ class ChooseAI:
 
         # Fetch and display system info
         self.fetch_system_info()
+        self.fetch_hardware_benchmark()
         self.display_system_info()
+        self.fetch_calibration()
 
-        # Fetch models
-        self.fetch_models()
+        # Fetch models; with the cache on, the catalog is only loaded if a category misses
+        self.fetch_models(load=not self.use_cache)
+        self.fetch_inventory()
 
-        # Generate and display recommendations for each category
+        # Score every category in one pass, then display each
+        all_recommendations = self.get_all_recommendations([t for _, t in self.categories])
         for category_name, category_type in self.categories:
             print(f"\n🔍 Analyzing models for {category_name}...")
-            recommendations = self.get_recommendations(category_type)
-            self.display_recommendations(recommendations, category_name)
+            recommendations = all_recommendations.get(category_type, [])
+            with span("display_recommendations", category=category_type):
+                self.display_recommendations(recommendations, category_name)
 
         print("\n🚀 Ready to run your chosen model with Ollama!")
         print("   Example: ollama run <model_name>")
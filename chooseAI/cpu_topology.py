@@ -0,0 +1,108 @@
+import os
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+CPU_SYSFS = "/sys/devices/system/cpu"
+NODE_SYSFS = "/sys/devices/system/node"
+
+# /proc/cpuinfo flags (x86 "flags", ARM "Features") that matter to llama.cpp kernels, by display name
+ISA_FEATURES = [
+    ("AVX", {"avx"}),
+    ("AVX2", {"avx2"}),
+    ("FMA", {"fma"}),
+    ("F16C", {"f16c"}),
+    ("AVX-512", {"avx512f"}),
+    ("AVX-512 VNNI", {"avx512_vnni"}),
+    ("AVX-VNNI", {"avx_vnni"}),
+    ("AVX-512 BF16", {"avx512_bf16"}),
+    ("AMX", {"amx_int8", "amx_tile"}),
+    ("NEON", {"asimd", "neon"}),
+    ("DOTPROD", {"asimddp"}),
+    ("SVE", {"sve"}),
+]
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def parse_cpu_flags(cpuinfo_text: str) -> Set[str]:
+    """Feature flags of the first processor listed in /proc/cpuinfo"""
+    for line in cpuinfo_text.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() in ("flags", "Features"):
+            return set(value.split())
+    return set()
+
+
+def cpu_flags(path: str = "/proc/cpuinfo") -> Set[str]:
+    return parse_cpu_flags(_read(path) or "")
+
+
+def isa_features(flags: Set[str]) -> List[str]:
+    """Display names of the SIMD/matrix extensions present in a flag set"""
+    return [name for name, required in ISA_FEATURES if required <= flags]
+
+
+def parse_cpu_list(text: str) -> List[int]:
+    """Expand a sysfs CPU list such as '0-3,8-11' into CPU numbers"""
+    cpus = []
+    for part in (text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.extend(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+def parse_cache_size_kb(text: str) -> Optional[int]:
+    """Convert a sysfs cache size such as '32K' or '30M' to KiB"""
+    match = re.fullmatch(r"(\d+)\s*([KMG])", (text or "").strip().upper())
+    if not match:
+        return None
+    return int(match.group(1)) * {"K": 1, "M": 1024, "G": 1024 * 1024}[match.group(2)]
+
+
+def numa_topology(root: str = NODE_SYSFS) -> Tuple[List[int], List[float]]:
+    """(logical CPUs per NUMA node, memory GiB per node); empty lists when sysfs has no node information"""
+    if not os.path.isdir(root):
+        return [], []
+
+    nodes = sorted(
+        int(entry[4:]) for entry in os.listdir(root) if entry.startswith("node") and entry[4:].isdigit()
+    )
+    cpus, memory = [], []
+    for node in nodes:
+        directory = os.path.join(root, f"node{node}")
+        cpus.append(len(parse_cpu_list(_read(os.path.join(directory, "cpulist")))))
+        total_kb = 0
+        for line in (_read(os.path.join(directory, "meminfo")) or "").splitlines():
+            if "MemTotal:" in line:
+                total_kb = int(line.split("MemTotal:")[1].split()[0])
+                break
+        memory.append(round(total_kb / (1024 ** 2), 2))
+    return cpus, memory
+
+
+def cache_sizes_kb(root: str = CPU_SYSFS, cpu: int = 0) -> Dict[str, int]:
+    """Per-level data/unified cache sizes seen by one CPU, e.g. {'L1': 48, 'L2': 2048, 'L3': 61440}"""
+    directory = os.path.join(root, f"cpu{cpu}", "cache")
+    sizes = {}
+    if not os.path.isdir(directory):
+        return sizes
+    for entry in sorted(os.listdir(directory)):
+        if not entry.startswith("index"):
+            continue
+        index = os.path.join(directory, entry)
+        if _read(os.path.join(index, "type")) == "Instruction":
+            continue
+        level = _read(os.path.join(index, "level"))
+        size = parse_cache_size_kb(_read(os.path.join(index, "size")))
+        if level and size:
+            sizes[f"L{level}"] = size
+    return sizes
@@ -0,0 +1,239 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from chooseAI.feature_table import ModelFeatureTable
+from chooseAI.inventory import ModelInventory
+from chooseAI.parse_ollama import connect_readonly, fetch_models, get_all_models, search_models
+from chooseAI.serialization import recommendation_to_dict, system_info_to_dict, to_jsonable
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Largest request head accepted; requests carry no meaningful body
+MAX_HEADER_BYTES = 16 * 1024
+
+STATUS_TEXT = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+@dataclass(frozen=True)
+class DaemonSnapshot:
+    """Everything a request needs; replaced as a whole, never mutated, so readers see one consistent state"""
+    system_info: Dict
+    models: List[Dict]
+    table: ModelFeatureTable
+    inventory: Optional[ModelInventory]
+    catalog_loaded_at: float
+    live_refreshed_at: float
+
+
+class RecommendationDaemon:
+    """
+    Serve recommendations as JSON over HTTP from state kept in memory
+
+    Hardware, catalog and feature table are loaded once. Live facts (installed models,
+    available RAM and disk) are refreshed every live_refresh_s and the catalog is
+    re-scraped every catalog_refresh_s; both build a new snapshot off the event loop and
+    swap it in, so requests never wait on probing or scraping.
+    """
+
+    def __init__(self, app, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 catalog_refresh_s: float = 6 * 3600, live_refresh_s: float = 30.0):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.catalog_refresh_s = catalog_refresh_s
+        self.live_refresh_s = live_refresh_s
+        self.snapshot: Optional[DaemonSnapshot] = None
+        self.refresh_error: Optional[str] = None
+        self._catalog_lock = asyncio.Lock()
+        # Strong references to fire-and-forget tasks, which the event loop only holds weakly
+        self._background_tasks = set()
+
+    def load_initial_snapshot(self):
+        """Probe hardware and load the catalog the same way the CLI does"""
+        self.app.fetch_system_info()
+        self.app.fetch_hardware_benchmark()
+        self.app.fetch_calibration()
+        self.app.fetch_models()
+        self.app.fetch_inventory()
+        now = time.time()
+        self.snapshot = DaemonSnapshot(
+            system_info=self.app.system_info,
+            models=self.app.models,
+            table=self.app.feature_table,
+            inventory=None if self.app.inventory.error else self.app.inventory,
+            catalog_loaded_at=now,
+            live_refreshed_at=now
+        )
+
+    def _load_live(self) -> Tuple[Dict, Optional[ModelInventory]]:
+        system_info = self.app.get_system_info_handler().get_system_info()
+        inventory = ModelInventory().refresh()
+        return system_info, None if inventory.error else inventory
+
+    def _load_catalog(self) -> Tuple[List[Dict], ModelFeatureTable]:
+        fetch_models()
+        models = get_all_models()
+        return models, self.app.engine.build_feature_table(models)
+
+    async def refresh_live(self):
+        system_info, inventory = await asyncio.get_running_loop().run_in_executor(None, self._load_live)
+        self.snapshot = replace(self.snapshot, system_info=system_info, inventory=inventory,
+                                live_refreshed_at=time.time())
+
+    async def refresh_catalog(self):
+        if self._catalog_lock.locked():
+            return  # A refresh is already running
+        async with self._catalog_lock:
+            try:
+                models, table = await asyncio.get_running_loop().run_in_executor(None, self._load_catalog)
+            except Exception as e:
+                self.refresh_error = f"Catalog refresh failed: {str(e)}"
+                return
+            self.snapshot = replace(self.snapshot, models=models, table=table, catalog_loaded_at=time.time())
+            self.refresh_error = None
+
+    async def _every(self, interval_s: float, refresh):
+        while True:
+            await asyncio.sleep(interval_s)
+            try:
+                await refresh()
+            except Exception as e:
+                self.refresh_error = f"Refresh failed: {str(e)}"
+
+    def recommend(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        snapshot = self.snapshot
+        category_types = query.get("type") or [t for _, t in self.app.categories]
+        limit = int(query.get("limit", ["5"])[0])
+        min_tps = float(query["min_tps"][0]) if "min_tps" in query else self.app.min_tokens_per_sec
+        results = self.app.engine.recommend_all(
+            system_info=snapshot.system_info,
+            table=snapshot.table,
+            preferred_types=category_types,
+            max_results=limit,
+            inventory=snapshot.inventory,
+            min_tokens_per_sec=min_tps
+        )
+        return {
+            "catalog_loaded_at": snapshot.catalog_loaded_at,
+            "recommendations": {
+                category: [recommendation_to_dict(r) for r in recs] for category, recs in results.items()
+            }
+        }
+
+    def search(self, text: str, limit: int) -> List[Dict]:
+        """Runs in an executor: search over a read-only connection, so it never contends with a catalog write"""
+        conn = connect_readonly()
+        try:
+            return search_models(text, limit=limit, conn=conn)
+        finally:
+            conn.close()
+
+    async def route(self, method: str, target: str) -> Tuple[int, Any]:
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if url.path == "/refresh":
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            task = asyncio.get_running_loop().create_task(self.refresh_catalog())
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            return 202, {"status": "refreshing"}
+        if method != "GET":
+            return 405, {"error": "use GET"}
+
+        if url.path == "/health":
+            snapshot = self.snapshot
+            return 200, {
+                "status": "ok",
+                "catalog_models": len(snapshot.models),
+                "catalog_loaded_at": snapshot.catalog_loaded_at,
+                "live_refreshed_at": snapshot.live_refreshed_at,
+                "refreshing": self._catalog_lock.locked(),
+                "refresh_error": self.refresh_error
+            }
+        if url.path == "/system":
+            return 200, system_info_to_dict(self.snapshot.system_info)
+        if url.path == "/recommendations":
+            return 200, self.recommend(query)
+        if url.path == "/search":
+            if not query.get("q"):
+                return 400, {"error": "missing q"}
+            limit = query.get("limit", ["10"])[0]
+            if not limit.isdigit() or int(limit) < 1:
+                return 400, {"error": "limit must be a positive integer"}
+            results = await asyncio.get_running_loop().run_in_executor(None, self.search, query["q"][0], int(limit))
+            return 200, {"results": to_jsonable(results)}
+        return 404, {"error": f"no route for {url.path}"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                lines = head.decode("latin-1").split("\r\n")
+                request_line = lines[0].split()
+                headers = {}
+                for line in lines[1:]:
+                    key, _, value = line.partition(":")
+                    if key:
+                        headers[key.strip().lower()] = value.strip()
+                body_length = int(headers.get("content-length") or 0)
+                if body_length:
+                    await reader.readexactly(body_length)
+
+                if len(request_line) != 3:
+                    status, payload = 400, {"error": "malformed request line"}
+                else:
+                    try:
+                        status, payload = await self.route(request_line[0].upper(), request_line[1])
+                    except ValueError as e:
+                        status, payload = 400, {"error": str(e)}
+                    except Exception as e:
+                        status, payload = 500, {"error": str(e)}
+
+                keep_alive = (len(request_line) == 3 and request_line[2] == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                body = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def serve(self):
+        if self.snapshot is None:
+            self.load_initial_snapshot()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port, limit=MAX_HEADER_BYTES)
+        tasks = [
+            asyncio.create_task(self._every(self.live_refresh_s, self.refresh_live)),
+            asyncio.create_task(self._every(self.catalog_refresh_s, self.refresh_catalog)),
+        ]
+        print(f"🛰️  Serving recommendations on http://{self.host}:{self.port} "
+              f"(/recommendations, /search, /system, /health, POST /refresh)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def run_daemon(app, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, catalog_refresh_s: float = 6 * 3600):
+    daemon = RecommendationDaemon(app, host=host, port=port, catalog_refresh_s=catalog_refresh_s)
+    try:
+        asyncio.run(daemon.serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,57 @@
+from typing import Dict, List
+import numpy as np
+
+
+class ModelFeatureTable:
+    """Columnar view of a model catalog, built once and reused for every scoring pass"""
+
+    def __init__(self, models: List[Dict], size_extractor):
+        self.models = models
+        n = len(models)
+
+        sizes = []
+        types = []
+        families = []
+        pulls = np.zeros(n, dtype=np.float64)
+        valid = np.ones(n, dtype=bool)
+        skip_large = np.zeros(n, dtype=bool)
+
+        for i, model in enumerate(models):
+            try:
+                metadata = model.get("metadata", {})
+                name = model["name"]
+                model_size = size_extractor(name, metadata.get("sizes", []))
+                model_type = metadata.get("type", "").lower()
+                model_pulls = model.get("stats", {}).get("pulls", 0)
+                pulls[i] = float(model_pulls or 0)
+                if model_pulls is not None and not isinstance(model_pulls, (int, float)):
+                    raise TypeError("pulls must be numeric")
+            except Exception:
+                # Mirrors the scalar path, which skips models that raise while scoring
+                sizes.append("unknown")
+                types.append("")
+                families.append("")
+                valid[i] = False
+                continue
+
+            sizes.append(model_size)
+            types.append(model_type)
+            families.append(name.split()[0].lower() if name.split() else "")
+            if model_size == "unknown" and any(x in name.lower() for x in ["70b", "65b", "180b"]):
+                skip_large[i] = True
+
+        self.size_labels, self.size_codes = np.unique(np.array(sizes, dtype=object).astype(str), return_inverse=True)
+        self.type_labels, self.type_codes = np.unique(np.array(types, dtype=object).astype(str), return_inverse=True)
+        self.pulls = pulls
+        self.valid = valid & ~skip_large
+
+        self.family_rows: Dict[str, List[int]] = {}
+        for i, family in enumerate(families):
+            if family and self.valid[i]:
+                self.family_rows.setdefault(family, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def model_size(self, row: int) -> str:
+        return str(self.size_labels[self.size_codes[row]])
@@ -0,0 +1,47 @@
+import hashlib
+import json
+import os
+import platform
+from typing import Dict
+
+
+def boot_id() -> str:
+    """Identifier that changes on every reboot (hardware can only change across reboots)"""
+    try:
+        with open("/proc/sys/kernel/random/boot_id", "r") as f:
+            return f.read().strip()
+    except OSError:
+        pass
+    try:
+        import psutil
+        return str(int(psutil.boot_time()))
+    except Exception:
+        return "unknown"
+
+
+def host_key() -> str:
+    """Cheap fingerprint of the host that needs no hardware probing"""
+    parts = {
+        "boot": boot_id(),
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "cpus": os.cpu_count(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def hardware_fingerprint(system_info: Dict) -> str:
+    """Stable hash of the host and its hardware, used to key per-host caches and measurements"""
+    cpu = system_info.get("cpu")
+    gpus = system_info.get("gpus") or [system_info.get("gpu")]
+    ram = system_info.get("ram")
+    parts = {
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "cpu": [cpu.name, cpu.physical_cores, cpu.logical_cores] if cpu else None,
+        "gpu": [[gpu.name, gpu.vram_gb] for gpu in gpus if gpu],
+        "ram_gb": round(ram.total_gb) if ram else None,
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()[:16]
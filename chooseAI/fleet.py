@@ -0,0 +1,256 @@
+import csv
+import hashlib
+import json
+import sys
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+from chooseAI.models.cpu import CPUInfo
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.models.ram import RAMInfo
+from chooseAI.models.storage import StorageInfo
+from chooseAI.parse_ollama import catalog_exists, fetch_models, get_all_models
+from chooseAI.serialization import recommendation_to_dict, system_info_to_dict
+
+DEFAULT_CATEGORIES = ["general llm", "code", "vision", "embedding"]
+# Results of this many distinct profiles are kept for later duplicates; older ones are rescored if seen again
+RESULT_CACHE_SIZE = 10_000
+# Hosts read ahead of the oldest unwritten one; bounds memory and the number of queued profiles
+READ_AHEAD = 256
+
+CSV_OUTPUT_COLUMNS = [
+    "host", "profile", "category", "rank", "model", "size", "score", "compatibility",
+    "generation_tokens_per_sec", "num_gpu", "num_thread", "error"
+]
+
+# Worker state, set once per process by _init_worker
+_engine = None
+_table = None
+
+
+def _build(cls, data: Dict):
+    """Dataclass from a dict, ignoring keys the class does not know (e.g. derived fields)"""
+    names = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def profile_from_dict(data: Dict) -> Dict:
+    """system_info dict (as get_system_info returns) from a serialized profile such as GET /system returns"""
+    gpus = [_build(GPUInfo, g) for g in data.get("gpus") or ([data["gpu"]] if data.get("gpu") else [])]
+    if not gpus:
+        gpus = [GPUInfo(name="No GPU detected", vram_gb=0.0)]
+    return {
+        "cpu": _build(CPUInfo, data["cpu"]),
+        "gpu": gpus[0],
+        "gpus": gpus,
+        "ram": _build(RAMInfo, data["ram"]),
+        "storage": _build(StorageInfo, data.get("storage") or {"total_gb": 0.0}),
+    }
+
+
+def _number(value: str, cast=float):
+    return cast(value) if value not in (None, "") else None
+
+
+def profile_from_csv_row(row: Dict[str, str]) -> Dict:
+    """Serialized profile from a flat CSV row; multiple GPUs are ';'-separated in gpu_name and vram_gb"""
+    gpu_names = [n for n in (row.get("gpu_name") or "").split(";") if n]
+    vrams = [v for v in (row.get("vram_gb") or "").split(";") if v]
+    return {
+        "cpu": {
+            "name": row.get("cpu_name") or "Unknown",
+            "physical_cores": _number(row.get("physical_cores"), int),
+            "logical_cores": _number(row.get("logical_cores"), int),
+            "clock_speed_ghz": _number(row.get("clock_speed_ghz")),
+            "isa_features": (row.get("isa_features") or "").split(),
+        },
+        "gpus": [
+            {"name": name, "vram_gb": float(vram), "index": i} for i, (name, vram) in enumerate(zip(gpu_names, vrams))
+        ],
+        "ram": {
+            "total_gb": float(row["ram_gb"]),
+            "available_gb": _number(row.get("ram_available_gb")),
+            "limit_gb": _number(row.get("ram_limit_gb")),
+        },
+        "storage": {
+            "total_gb": _number(row.get("storage_gb")) or 0.0,
+            "free_gb": _number(row.get("storage_free_gb")),
+        },
+    }
+
+
+def read_profiles(stream: TextIO, input_format: str) -> Iterator[Tuple[str, Optional[Dict], Optional[str]]]:
+    """Yield (host, serialized profile, parse error) for every host in a JSONL or CSV stream"""
+    if input_format == "csv":
+        for i, row in enumerate(csv.DictReader(stream)):
+            host = row.get("host") or f"row-{i + 1}"
+            try:
+                yield host, profile_from_csv_row(row), None
+            except (KeyError, ValueError) as e:
+                yield host, None, f"Invalid profile: {str(e)}"
+        return
+
+    for i, line in enumerate(stream):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield f"line-{i + 1}", None, f"Invalid JSON: {str(e)}"
+            continue
+        if not isinstance(data, dict):
+            yield f"line-{i + 1}", None, f"Invalid profile: expected a JSON object, got {type(data).__name__}"
+            continue
+        yield data.get("host") or f"line-{i + 1}", data, None
+
+
+def profile_key(profile: Dict) -> str:
+    """Hash of the hardware alone, so hosts with identical profiles share one scoring run"""
+    hardware = system_info_to_dict(profile_from_dict(profile))
+    return hashlib.sha1(json.dumps(hardware, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _init_worker(models: List[Dict]):
+    global _engine, _table
+    from chooseAI.recommendation_engine import ModelRecommendationEngine
+    _engine = ModelRecommendationEngine()
+    _table = _engine.build_feature_table(models)
+
+
+def _score_profile(profile: Dict, categories: List[str], max_results: int,
+                   min_tokens_per_sec: Optional[float]) -> Dict:
+    """Runs in a worker: rank the catalog for one hardware profile"""
+    results = _engine.recommend_all(
+        profile_from_dict(profile), _table, categories, max_results, min_tokens_per_sec=min_tokens_per_sec
+    )
+    return {category: [recommendation_to_dict(r) for r in recs] for category, recs in results.items()}
+
+
+class FleetWriter:
+    """Streams per-host results as JSON lines or as one CSV row per recommendation"""
+
+    def __init__(self, stream: TextIO, output_format: str):
+        self.stream = stream
+        self.output_format = output_format
+        self.csv = None
+        if output_format == "csv":
+            self.csv = csv.DictWriter(stream, fieldnames=CSV_OUTPUT_COLUMNS)
+            self.csv.writeheader()
+
+    def write(self, host: str, key: Optional[str], results: Optional[Dict], error: Optional[str] = None):
+        if not self.csv:
+            record = {"host": host, "profile": key}
+            record.update({"error": error} if error else {"recommendations": results})
+            self.stream.write(json.dumps(record) + "\n")
+            return
+
+        if error:
+            self.csv.writerow({"host": host, "profile": key, "error": error})
+            return
+        for category, recommendations in results.items():
+            for rank, rec in enumerate(recommendations, 1):
+                options = rec["ollama_options"] or {}
+                self.csv.writerow({
+                    "host": host,
+                    "profile": key,
+                    "category": category,
+                    "rank": rank,
+                    "model": rec["name"],
+                    "size": rec["size"],
+                    "score": round(rec["score"], 4),
+                    "compatibility": rec["compatibility"],
+                    "generation_tokens_per_sec": round(rec["generation_tokens_per_sec"] or 0.0, 2),
+                    "num_gpu": options.get("num_gpu"),
+                    "num_thread": options.get("num_thread"),
+                })
+
+
+def format_for(path: str, explicit: Optional[str] = None) -> str:
+    if explicit:
+        return explicit
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def load_catalog() -> List[Dict]:
+    if not catalog_exists():
+        fetch_models()
+    return get_all_models()
+
+
+def run_fleet(input_path: str, output_path: str, categories: List[str] = None, max_results: int = 5,
+              workers: int = None, min_tokens_per_sec: float = None, models: List[Dict] = None,
+              input_format: str = None, output_format: str = None) -> Dict[str, int]:
+    """
+    Score the catalog against every host profile in a file and stream the results
+
+    Identical hardware profiles are scored once. Hosts are written in input order; at most
+    READ_AHEAD hosts are held in memory while their profiles are being scored.
+
+    Args:
+        input_path: JSONL (one GET /system-style object per line, plus "host") or CSV profiles; '-' for stdin
+        output_path: JSONL or CSV output; '-' for stdout
+        categories: Model types to rank for
+        max_results: Recommendations per category
+        workers: Worker processes (defaults to the CPU count)
+        min_tokens_per_sec: Drop models predicted to generate slower than this
+        models: Catalog to score (defaults to the local database)
+        input_format / output_format: 'jsonl' or 'csv' (default: from the file extension)
+
+    Returns:
+        Counts of hosts, distinct profiles scored and hosts with errors
+    """
+    categories = categories or DEFAULT_CATEGORIES
+    models = models if models is not None else load_catalog()
+    stats = {"hosts": 0, "profiles_scored": 0, "errors": 0}
+
+    source = sys.stdin if input_path == "-" else open(input_path, "r", newline="", encoding="utf-8")
+    sink = sys.stdout if output_path == "-" else open(output_path, "w", newline="", encoding="utf-8")
+    try:
+        writer = FleetWriter(sink, format_for(output_path, output_format))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(models,)) as pool:
+            cache: "OrderedDict[str, Tuple[Optional[Dict], Optional[str]]]" = OrderedDict()
+            in_flight = {}
+            waiting = deque()
+
+            def flush_oldest():
+                host, key, error = waiting.popleft()
+                results = None
+                if error is None:
+                    if key not in cache:
+                        # (results, error) of the scoring run; failures are cached too, so duplicates share them
+                        try:
+                            cache[key] = (in_flight.pop(key).result(), None)
+                        except Exception as e:
+                            cache[key] = (None, f"Scoring failed: {str(e)}")
+                        if len(cache) > RESULT_CACHE_SIZE:
+                            cache.popitem(last=False)
+                    cache.move_to_end(key)
+                    results, error = cache[key]
+                if error:
+                    stats["errors"] += 1
+                writer.write(host, key, results, error)
+
+            for host, profile, error in read_profiles(source, format_for(input_path, input_format)):
+                stats["hosts"] += 1
+                key = None
+                if error is None:
+                    try:
+                        key = profile_key(profile)
+                    except (KeyError, TypeError, ValueError) as e:
+                        error = f"Invalid profile: {str(e)}"
+                if error is None and key not in cache and key not in in_flight:
+                    in_flight[key] = pool.submit(_score_profile, profile, categories, max_results, min_tokens_per_sec)
+                    stats["profiles_scored"] += 1
+                waiting.append((host, key, error))
+                if len(waiting) >= READ_AHEAD:
+                    flush_oldest()
+
+            while waiting:
+                flush_oldest()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return stats
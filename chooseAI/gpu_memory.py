@@ -0,0 +1,29 @@
+import subprocess
+from typing import Dict, Optional
+
+NVIDIA_SMI_QUERY = ["nvidia-smi", "--query-gpu=index,memory.free", "--format=csv,noheader,nounits"]
+
+
+def parse_nvidia_free_vram(output: str) -> Dict[int, float]:
+    """Map GPU index to free VRAM (GiB) from nvidia-smi CSV output ('0, 20480' per line, MiB)"""
+    free = {}
+    for line in output.splitlines():
+        parts = [p.strip() for p in line.split(",")]
+        if len(parts) != 2:
+            continue
+        try:
+            free[int(parts[0])] = round(float(parts[1]) / 1024, 2)
+        except ValueError:
+            continue
+    return free
+
+
+def nvidia_free_vram_gb(timeout: float = 5.0) -> Optional[Dict[int, float]]:
+    """Free VRAM per NVIDIA GPU index, or None if nvidia-smi is missing or fails"""
+    try:
+        result = subprocess.run(NVIDIA_SMI_QUERY, capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return parse_nvidia_free_vram(result.stdout) or None
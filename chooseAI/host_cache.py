@@ -0,0 +1,34 @@
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+
+def cache_dir() -> str:
+    """Per-user cache directory for host-specific results"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "chooseAI")
+
+
+def load_json_cache(name: str) -> Optional[Any]:
+    """Load a JSON cache file, returning None if it is missing or unreadable"""
+    try:
+        with open(os.path.join(cache_dir(), name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json_cache(name: str, data: Any):
+    """Atomically write a JSON cache file so concurrent runs never see a partial file"""
+    directory = cache_dir()
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, os.path.join(directory, name))
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
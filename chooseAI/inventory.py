@@ -0,0 +1,76 @@
+from typing import Dict, List, Optional
+from chooseAI.models.installed_model import InstalledModel
+from chooseAI.ollama_client import OllamaClient
+from chooseAI.memory_estimator import parse_parameter_size
+
+
+def matches_catalog_model(name: str, parameter_size: Optional[str], model_name: str, model_size: str) -> bool:
+    """Whether a local model such as 'gemma3:4b' is a variant of a catalog model and size"""
+    family = model_name.split()[0].lower() if model_name else ""
+    wanted = parse_parameter_size(model_size)
+    if not family or wanted is None:
+        return False
+
+    base, _, tag = name.lower().partition(":")
+    if base != family:
+        return False
+
+    size = parse_parameter_size(tag) or parse_parameter_size(parameter_size)
+    return size is not None and abs(size - wanted) <= max(0.15 * wanted, 0.1)
+
+
+class ModelInventory:
+    """Models installed in (and loaded by) the local Ollama instance"""
+
+    def __init__(self, client: OllamaClient = None):
+        self.client = client or OllamaClient()
+        self.models: Dict[str, InstalledModel] = {}
+        self.error: Optional[str] = None
+
+    def refresh(self) -> "ModelInventory":
+        """Query the Ollama API for installed and loaded models"""
+        try:
+            installed = self.client.list_models()
+            running = {m.get("name") or m.get("model"): m for m in self.client.list_running()}
+        except Exception as e:
+            self.models = {}
+            self.error = f"Failed to query local Ollama: {str(e)}"
+            return self
+
+        models = {}
+        for entry in installed:
+            name = entry.get("name") or entry.get("model")
+            if not name:
+                continue
+            details = entry.get("details") or {}
+            loaded = running.get(name)
+            models[name] = InstalledModel(
+                name=name,
+                size_bytes=entry.get("size", 0),
+                parameter_size=details.get("parameter_size"),
+                quantization=details.get("quantization_level"),
+                loaded=loaded is not None,
+                size_vram_bytes=(loaded or {}).get("size_vram", 0)
+            )
+
+        self.models = models
+        self.error = None
+        return self
+
+    def find(self, model_name: str, model_size: str) -> Optional[InstalledModel]:
+        """Find an installed variant of a catalog model with a matching parameter size"""
+        best = None
+        for installed in self.models.values():
+            if not matches_catalog_model(installed.name, installed.parameter_size, model_name, model_size):
+                continue
+
+            # Prefer a variant that is already loaded
+            if best is None or (installed.loaded and not best.loaded):
+                best = installed
+        return best
+
+    def installed(self) -> List[InstalledModel]:
+        return list(self.models.values())
+
+    def loaded(self) -> List[InstalledModel]:
+        return [m for m in self.models.values() if m.loaded]
@@ -1,10 +1,14 @@
 # linux_system_information.py
 import platform
 import psutil
-import cpuinfo
-import GPUtil
 import shutil
 import sys
+from dataclasses import replace
+from typing import Dict, List, Optional
+from chooseAI.cgroup_limits import CgroupLimits, cpu_affinity_count
+from chooseAI.cpu_topology import cache_sizes_kb, cpu_flags, isa_features, numa_topology
+from chooseAI.ollama_paths import existing_ancestor, ollama_models_dir
+from chooseAI.gpu_memory import nvidia_free_vram_gb
 from chooseAI.systemInfo import SystemInformation
 from chooseAI.models.cpu import CPUInfo
 from chooseAI.models.gpu import GPUInfo
@@ -15,16 +19,27 @@ from chooseAI.models.storage import StorageInfo
 class LinuxSystemInformation(SystemInformation):
     def get_cpu(self) -> CPUInfo:
         try:
-            name = platform.processor() or cpuinfo.get_cpu_info().get("brand_raw", "Unknown")
+            name = platform.processor()
+            if not name:
+                import cpuinfo  # Slow to import, so only when the platform gives no name
+                name = cpuinfo.get_cpu_info().get("brand_raw", "Unknown")
             physical_cores = psutil.cpu_count(logical=False)
             logical_cores = psutil.cpu_count(logical=True)
             clock_speed_ghz = round(psutil.cpu_freq().max / 1000, 2) if psutil.cpu_freq() else 0.0
 
+            numa_cpus, numa_memory_gb = numa_topology()
+            caches = cache_sizes_kb()
+
             return CPUInfo(
                 name=name,
                 physical_cores=physical_cores,
                 logical_cores=logical_cores,
-                clock_speed_ghz=clock_speed_ghz
+                clock_speed_ghz=clock_speed_ghz,
+                isa_features=isa_features(cpu_flags()),
+                numa_cpus=numa_cpus,
+                numa_memory_gb=numa_memory_gb,
+                l2_cache_kb=caches.get("L2"),
+                l3_cache_kb=caches.get("L3")
             )
         except Exception as e:
             return CPUInfo(
@@ -36,31 +51,67 @@ class LinuxSystemInformation(SystemInformation):
             )
 
     def get_gpu(self) -> GPUInfo:
+        return self.get_gpus()[0]
+
+    def get_gpus(self) -> List[GPUInfo]:
         try:
+            import GPUtil  # Slow to import; skipped entirely when GPUs come from the cache
             gpus = GPUtil.getGPUs()
             if gpus:
-                gpu = gpus[0]
-                return GPUInfo(
-                    name=gpu.name,
-                    vram_gb=round(gpu.memoryTotal / 1024, 2)
-                )
+                return [
+                    GPUInfo(
+                        name=gpu.name,
+                        vram_gb=round(gpu.memoryTotal / 1024, 2),
+                        free_vram_gb=round(gpu.memoryFree / 1024, 2),
+                        index=i
+                    )
+                    for i, gpu in enumerate(gpus)
+                ]
             else:
-                return GPUInfo(
+                return [GPUInfo(
                     name="No GPU detected",
                     vram_gb=0.0
-                )
+                )]
         except Exception as e:
-            return GPUInfo(
+            return [GPUInfo(
                 name="Unknown",
                 vram_gb=0.0,
                 error=f"Failed to retrieve GPU info: {str(e)}"
+            )]
+
+    def get_free_vram_gb(self) -> Optional[Dict[int, float]]:
+        return nvidia_free_vram_gb()
+
+    def apply_live_limits(self, cpu: CPUInfo) -> CPUInfo:
+        try:
+            return replace(
+                cpu,
+                cpu_quota=CgroupLimits().cpu_quota(),
+                affinity_cores=cpu_affinity_count()
             )
+        except Exception:
+            return cpu
 
     def get_ram(self) -> RAMInfo:
         try:
-            total_memory = psutil.virtual_memory().total
+            memory = psutil.virtual_memory()
+            total_memory = memory.total
+            available = memory.available
+            limit = None
+
+            # Inside a container the cgroup limit, not the node's RAM, decides when we get OOM-killed
+            cgroup = CgroupLimits()
+            cgroup_limit = cgroup.memory_limit_bytes()
+            if cgroup_limit is not None and cgroup_limit < total_memory:
+                limit = cgroup_limit
+                working_set = cgroup.memory_working_set_bytes()
+                if working_set is not None:
+                    available = min(available, max(0, cgroup_limit - working_set))
+
             return RAMInfo(
-                total_gb=round(total_memory / (1024 ** 3), 2)
+                total_gb=round(total_memory / (1024 ** 3), 2),
+                available_gb=round(available / (1024 ** 3), 2),
+                limit_gb=round(limit / (1024 ** 3), 2) if limit is not None else None
             )
         except Exception as e:
             return RAMInfo(
@@ -70,9 +121,13 @@ class LinuxSystemInformation(SystemInformation):
 
     def get_storage(self) -> StorageInfo:
         try:
-            total, _, _ = shutil.disk_usage("/")
+            # Models are downloaded into the Ollama models directory, which may be its own volume
+            path = existing_ancestor(ollama_models_dir())
+            total, _, free = shutil.disk_usage(path)
             return StorageInfo(
-                total_gb=round(total / (1024 ** 3), 2)
+                total_gb=round(total / (1024 ** 3), 2),
+                free_gb=round(free / (1024 ** 3), 2),
+                path=path
             )
         except Exception as e:
             return StorageInfo(
@@ -1,8 +1,6 @@
 # macOS_system_information.py
 import platform
 import psutil
-import cpuinfo
-import GPUtil
 import shutil
 import sys
 from chooseAI.systemInfo import SystemInformation
@@ -15,7 +13,10 @@ from chooseAI.models.storage import StorageInfo
 class MacOSSystemInformation(SystemInformation):
     def get_cpu(self) -> CPUInfo:
         try:
-            name = platform.processor() or cpuinfo.get_cpu_info().get("brand_raw", "Unknown")
+            name = platform.processor()
+            if not name:
+                import cpuinfo  # Slow to import, so only when the platform gives no name
+                name = cpuinfo.get_cpu_info().get("brand_raw", "Unknown")
             physical_cores = psutil.cpu_count(logical=False)
             logical_cores = psutil.cpu_count(logical=True)
             clock_speed_ghz = round(psutil.cpu_freq().max / 1000, 2) if psutil.cpu_freq() else 0.0
@@ -37,6 +38,7 @@ class MacOSSystemInformation(SystemInformation):
 
     def get_gpu(self) -> GPUInfo:
         try:
+            import GPUtil  # Slow to import; skipped entirely when GPUs come from the cache
             gpus = GPUtil.getGPUs()
             if gpus:
                 gpu = gpus[0]
@@ -0,0 +1,113 @@
+import math
+import re
+from typing import Optional
+from chooseAI.models.memory_footprint import MemoryFootprint
+
+GIB = 1024 ** 3
+
+# Effective bits per weight of common GGUF quantizations, including block scales
+QUANTIZATION_BITS = {
+    "Q2_K": 3.35,
+    "Q3_K_S": 3.5,
+    "Q3_K_M": 3.91,
+    "Q3_K_L": 4.27,
+    "Q4_0": 4.55,
+    "Q4_1": 5.0,
+    "Q4_K_S": 4.58,
+    "Q4_K_M": 4.85,
+    "Q5_0": 5.54,
+    "Q5_1": 6.0,
+    "Q5_K_S": 5.54,
+    "Q5_K_M": 5.69,
+    "Q6_K": 6.56,
+    "Q8_0": 8.5,
+    "F16": 16.0,
+    "BF16": 16.0,
+    "F32": 32.0,
+}
+DEFAULT_QUANTIZATION = "Q4_K_M"
+
+# (parameters in billions, transformer layers, KV width = kv_heads * head_dim) of typical
+# open models; architectures in between are interpolated on log(parameters)
+ARCHITECTURE_ANCHORS = [
+    (0.5, 24, 128),
+    (1.0, 16, 512),
+    (3.0, 28, 1024),
+    (8.0, 32, 1024),
+    (14.0, 48, 1024),
+    (32.0, 64, 1024),
+    (70.0, 80, 1024),
+    (405.0, 126, 1024),
+]
+
+
+def parse_parameter_size(value: str) -> Optional[float]:
+    """Parse sizes such as '8.0B', '567M', a '7b' tag or a mixture-of-experts '8x7b' into billions"""
+    if not value:
+        return None
+    match = re.search(r"(?:(\d+)x)?(\d+(?:\.\d+)?)\s*([bm])", value.lower())
+    if not match:
+        return None
+    size = float(match.group(2))
+    if match.group(3) == "m":
+        size /= 1000
+    # All experts stay resident in memory, so a MoE model costs its total parameter count
+    if match.group(1):
+        size *= int(match.group(1))
+    return size
+
+
+def quantization_bits(quantization: str = None) -> float:
+    """Bits per weight for an Ollama quantization level, defaulting to Q4_K_M"""
+    if quantization and quantization.upper() in QUANTIZATION_BITS:
+        return QUANTIZATION_BITS[quantization.upper()]
+    return QUANTIZATION_BITS[DEFAULT_QUANTIZATION]
+
+
+def estimate_architecture(parameters_b: float) -> tuple[float, float]:
+    """Estimate (layers, KV width) for a model with the given parameter count"""
+    if parameters_b <= ARCHITECTURE_ANCHORS[0][0]:
+        return float(ARCHITECTURE_ANCHORS[0][1]), float(ARCHITECTURE_ANCHORS[0][2])
+    for (p0, l0, w0), (p1, l1, w1) in zip(ARCHITECTURE_ANCHORS, ARCHITECTURE_ANCHORS[1:]):
+        if parameters_b <= p1:
+            t = (math.log(parameters_b) - math.log(p0)) / (math.log(p1) - math.log(p0))
+            return l0 + t * (l1 - l0), w0 + t * (w1 - w0)
+    return float(ARCHITECTURE_ANCHORS[-1][1]), float(ARCHITECTURE_ANCHORS[-1][2])
+
+
+def estimate_kv_cache_bytes(parameters_b: float, context_length: int, kv_cache_bits: float = 16.0) -> float:
+    """Bytes of K and V cache needed to hold context_length tokens"""
+    layers, kv_width = estimate_architecture(parameters_b)
+    return 2 * layers * kv_width * context_length * kv_cache_bits / 8
+
+
+def estimate_memory_footprint(parameters_b: float,
+                              quant_bits: float = None,
+                              context_length: int = 4096,
+                              kv_cache_bits: float = 16.0,
+                              runtime_overhead_gb: float = 0.5,
+                              overhead_fraction: float = 0.05) -> MemoryFootprint:
+    """
+    Estimate the resident memory of a model served by Ollama
+
+    Args:
+        parameters_b: Parameter count in billions
+        quant_bits: Bits per weight (defaults to Q4_K_M)
+        context_length: Context window the KV cache is sized for
+        kv_cache_bits: Bits per KV cache element (16 for the default f16 cache)
+        runtime_overhead_gb: Fixed runtime cost (CUDA/Metal context, scratch buffers)
+        overhead_fraction: Compute graph buffers as a fraction of the weights
+
+    Returns:
+        MemoryFootprint with sizes in GiB
+    """
+    quant_bits = quant_bits or quantization_bits()
+    weights_gb = parameters_b * 1e9 * quant_bits / 8 / GIB
+    kv_cache_gb = estimate_kv_cache_bytes(parameters_b, context_length, kv_cache_bits) / GIB
+    return MemoryFootprint(
+        parameters_b=parameters_b,
+        weights_gb=weights_gb,
+        kv_cache_gb=kv_cache_gb,
+        overhead_gb=runtime_overhead_gb + overhead_fraction * weights_gb,
+        context_length=context_length
+    )
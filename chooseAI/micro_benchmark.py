@@ -0,0 +1,156 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, fields
+from typing import Callable, Dict, Optional
+import numpy as np
+from chooseAI.models.hardware_benchmark import HardwareBenchmark
+from chooseAI.models.throughput import HardwareRates
+from chooseAI.host_cache import load_json_cache, save_json_cache
+from chooseAI.throughput import BANDWIDTH_EFFICIENCY, COMPUTE_EFFICIENCY
+
+CACHE_FILE = "hardware_benchmark.json"
+
+# The bandwidth test streams several times the last-level cache through DRAM (L3 assumed when unknown)
+BANDWIDTH_LLC_MULTIPLE = 8
+DEFAULT_L3_CACHE_KB = 32 * 1024
+# Hard limits on the bandwidth buffers of all threads together
+BANDWIDTH_MIN_TOTAL_MB = 64
+BANDWIDTH_MAX_TOTAL_MB = 1024
+# Never take more than this share of the RAM currently available (e.g. under a container limit)
+BANDWIDTH_MAX_RAM_FRACTION = 0.1
+# Smallest per-thread buffer; fewer threads run when the total is too small for all of them
+BANDWIDTH_MIN_BUFFER_MB = 1
+
+
+def available_threads() -> int:
+    """CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _repeat(func: Callable[[], None], budget_s: float) -> tuple[int, float]:
+    """Run func until the time budget is used up; returns (iterations, elapsed seconds)"""
+    func()  # Warm up caches and page in buffers
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < budget_s:
+        func()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+    return iterations, elapsed
+
+
+def _in_parallel(make_worker: Callable[[], Callable[[], float]], threads: int) -> float:
+    """Run one worker per thread at the same time and sum their rates"""
+    workers = [make_worker() for _ in range(threads)]
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(lambda worker: worker(), workers))
+
+
+def _bandwidth_worker(size_mb: float, budget_s: float) -> Callable[[], float]:
+    src = np.ones(int(size_mb * 1024 * 1024) // 8, dtype=np.float64)
+    dst = np.empty_like(src)
+
+    def run() -> float:
+        iterations, elapsed = _repeat(lambda: np.copyto(dst, src), budget_s)
+        return 2 * src.nbytes * iterations / elapsed / 1e9  # Read + write
+    return run
+
+
+def bandwidth_working_set_mb(l3_cache_kb: int = None, available_ram_gb: float = None) -> float:
+    """Total size of the bandwidth buffers: several times the LLC, within hard and RAM limits"""
+    total_mb = BANDWIDTH_LLC_MULTIPLE * (l3_cache_kb or DEFAULT_L3_CACHE_KB) / 1024
+    total_mb = min(max(total_mb, BANDWIDTH_MIN_TOTAL_MB), BANDWIDTH_MAX_TOTAL_MB)
+    if available_ram_gb:
+        total_mb = min(total_mb, available_ram_gb * 1024 * BANDWIDTH_MAX_RAM_FRACTION)
+    return total_mb
+
+
+def measure_gemm_gflops(n: int = 1024, budget_s: float = 0.5) -> float:
+    """fp32 matrix multiply throughput through NumPy's BLAS (uses all cores)"""
+    a = np.random.rand(n, n).astype(np.float32)
+    b = np.random.rand(n, n).astype(np.float32)
+    iterations, elapsed = _repeat(lambda: a @ b, budget_s)
+    return 2 * n ** 3 * iterations / elapsed / 1e9
+
+
+def run_micro_benchmark(threads: int = None, budget_s: float = 0.4, l3_cache_kb: int = None,
+                        available_ram_gb: float = None) -> HardwareBenchmark:
+    """
+    Measure sustained memory bandwidth and matmul throughput
+
+    Takes a few seconds; every measurement runs for about budget_s. The bandwidth buffers
+    of all threads together stay within bandwidth_working_set_mb, so a many-core host or a
+    memory-limited container is not pushed into swap.
+
+    Args:
+        threads: Threads for the all-core bandwidth run (defaults to the CPUs available to this process)
+        budget_s: Time spent on each measurement
+        l3_cache_kb: Last-level cache size, to size the bandwidth buffers beyond it
+        available_ram_gb: RAM currently available, bounding the bandwidth buffers
+
+    Returns:
+        HardwareBenchmark with the measured rates
+    """
+    threads = threads or available_threads()
+    total_mb = bandwidth_working_set_mb(l3_cache_kb, available_ram_gb)
+    # Every thread copies between a source and a destination buffer
+    threads = max(1, min(threads, int(total_mb / (2 * BANDWIDTH_MIN_BUFFER_MB))))
+    start = time.perf_counter()
+
+    single_bandwidth = _bandwidth_worker(total_mb / 2, budget_s)()
+    all_bandwidth = _in_parallel(lambda: _bandwidth_worker(total_mb / (2 * threads), budget_s), threads)
+
+    return HardwareBenchmark(
+        memory_bandwidth_gb_s=max(single_bandwidth, all_bandwidth),
+        single_core_bandwidth_gb_s=single_bandwidth,
+        fp32_gflops=measure_gemm_gflops(budget_s=budget_s),
+        threads=threads,
+        duration_s=time.perf_counter() - start,
+        measured_at=time.time()
+    )
+
+
+def load_cached_benchmark(fingerprint: str) -> Optional[HardwareBenchmark]:
+    """Previously measured results for this host, if any"""
+    entry = (load_json_cache(CACHE_FILE) or {}).get(fingerprint)
+    if not entry:
+        return None
+    try:
+        # Entries from older versions may carry fields that are no longer measured
+        names = {f.name for f in fields(HardwareBenchmark)}
+        return HardwareBenchmark(**{k: v for k, v in entry.items() if k in names})
+    except TypeError:
+        return None  # Written by an incompatible version
+
+
+def save_cached_benchmark(benchmark: HardwareBenchmark):
+    cache: Dict = load_json_cache(CACHE_FILE) or {}
+    cache[benchmark.fingerprint] = asdict(benchmark)
+    save_json_cache(CACHE_FILE, cache)
+
+
+def get_benchmark(fingerprint: str, refresh: bool = False, l3_cache_kb: int = None,
+                  available_ram_gb: float = None) -> HardwareBenchmark:
+    """Return cached results for this host, running the probe when missing or refresh is set"""
+    if not refresh:
+        cached = load_cached_benchmark(fingerprint)
+        if cached:
+            return cached
+    benchmark = run_micro_benchmark(l3_cache_kb=l3_cache_kb, available_ram_gb=available_ram_gb)
+    benchmark.fingerprint = fingerprint
+    save_cached_benchmark(benchmark)
+    return benchmark
+
+
+def benchmark_to_rates(benchmark: HardwareBenchmark) -> HardwareRates:
+    """CPU rates from measured numbers instead of the spec heuristic"""
+    # Measured rates are already sustained rates; undo the efficiency the predictor applies to peaks
+    return HardwareRates(
+        cpu_bandwidth_gb_s=benchmark.memory_bandwidth_gb_s / BANDWIDTH_EFFICIENCY,
+        cpu_gflops=benchmark.fp32_gflops / COMPUTE_EFFICIENCY,
+        source="benchmark"
+    )
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class CalibrationResult:
+    model: str
+    fingerprint: str
+    load_s: float
+    prompt_tokens_per_sec: float
+    generation_tokens_per_sec: float
+    parameter_size: Optional[str] = None
+    measured_at: float = 0.0
+    error: Optional[str] = None
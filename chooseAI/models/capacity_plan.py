@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Dict
+from chooseAI.models.throughput import OffloadPlan
+
+@dataclass
+class CapacityPlan:
+    context_length: int
+    kv_cache_per_slot_gb: float
+    # Ollama's OLLAMA_NUM_PARALLEL and OLLAMA_MAX_LOADED_MODELS
+    num_parallel: int
+    max_loaded_models: int
+    # Resident memory of one loaded copy with num_parallel slots
+    memory_gb: float
+    single_stream_tokens_per_sec: float
+    per_request_tokens_per_sec: float
+    aggregate_tokens_per_sec: float
+    latency_s: float
+    max_requests_per_sec: float
+    target_requests_per_sec: float
+    # Hosts like this one needed to reach the target
+    hosts_needed: int
+    # Why there are not more slots: "target" (met), "memory", "compute", "latency" or "max_parallel"
+    limited_by: str
+    offload: OffloadPlan = None
+
+    @property
+    def meets_target(self) -> bool:
+        return self.max_requests_per_sec >= self.target_requests_per_sec
+
+    def environment(self) -> Dict[str, str]:
+        """Environment variables to start `ollama serve` with"""
+        return {
+            "OLLAMA_NUM_PARALLEL": str(self.num_parallel),
+            "OLLAMA_MAX_LOADED_MODELS": str(self.max_loaded_models),
+            "OLLAMA_CONTEXT_LENGTH": str(self.context_length),
+        }
@@ -1,9 +1,30 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 @dataclass
 class CPUInfo:
     name: str
     physical_cores: Optional[int]
     logical_cores: Optional[int]
     clock_speed_ghz: Optional[float]
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    cpu_quota: Optional[float] = None
+    affinity_cores: Optional[int] = None
+    # SIMD/matrix extensions, e.g. ['AVX2', 'FMA', 'AVX-512', 'AMX']; empty when unknown
+    isa_features: List[str] = field(default_factory=list)
+    # Logical CPUs and memory (GiB) of each NUMA node; empty when unknown
+    numa_cpus: List[int] = field(default_factory=list)
+    numa_memory_gb: List[float] = field(default_factory=list)
+    l2_cache_kb: Optional[int] = None
+    l3_cache_kb: Optional[int] = None
+
+    @property
+    def numa_nodes(self) -> int:
+        return max(1, len(self.numa_cpus))
+
+    @property
+    def effective_cores(self) -> Optional[int]:
+        """Physical cores this process can actually keep busy under quota and affinity limits"""
+        cores = [c for c in (self.physical_cores, self.affinity_cores) if c]
+        if self.cpu_quota:
+            cores.append(max(1, int(self.cpu_quota)))
+        return min(cores) if cores else None
@@ -5,4 +5,6 @@ from typing import Optional
 class GPUInfo:
     name: str
     vram_gb: float
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    free_vram_gb: Optional[float] = None
+    index: int = 0
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass
+class HardwareBenchmark:
+    memory_bandwidth_gb_s: float
+    single_core_bandwidth_gb_s: float
+    fp32_gflops: float
+    threads: int
+    duration_s: float
+    fingerprint: str = ""
+    measured_at: float = 0.0
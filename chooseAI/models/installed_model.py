@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class InstalledModel:
+    name: str
+    size_bytes: int
+    parameter_size: Optional[str] = None
+    quantization: Optional[str] = None
+    loaded: bool = False
+    size_vram_bytes: int = 0
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+@dataclass
+class MemoryFootprint:
+    parameters_b: float
+    weights_gb: float
+    kv_cache_gb: float
+    overhead_gb: float
+    context_length: int
+
+    @property
+    def total_gb(self) -> float:
+        return self.weights_gb + self.kv_cache_gb + self.overhead_gb
@@ -4,4 +4,13 @@ from typing import Optional
 @dataclass
 class RAMInfo:
     total_gb: float
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    available_gb: Optional[float] = None
+    limit_gb: Optional[float] = None
+
+    @property
+    def effective_gb(self) -> float:
+        """Memory this process may use at most: the total, capped by any cgroup limit"""
+        if self.limit_gb is not None:
+            return min(self.total_gb, self.limit_gb)
+        return self.total_gb
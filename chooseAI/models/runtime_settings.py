@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+@dataclass
+class RuntimeSettings:
+    num_thread: int
+    num_gpu: Optional[int] = None
+    # Spread threads and memory over all NUMA nodes (Ollama's numa option)
+    numa: bool = False
+    # Pin the Ollama server to this NUMA node instead
+    numa_node: Optional[int] = None
+
+    def options(self) -> Dict:
+        """Ollama request options, as passed to /api/generate or set in a Modelfile"""
+        options = {"num_thread": self.num_thread}
+        if self.num_gpu is not None:
+            options["num_gpu"] = self.num_gpu
+        if self.numa:
+            options["numa"] = True
+        return options
+
+    @property
+    def launch_prefix(self) -> Optional[str]:
+        """Command to start `ollama serve` under when pinning to a NUMA node"""
+        if self.numa_node is None:
+            return None
+        return f"numactl --cpunodebind={self.numa_node} --membind={self.numa_node}"
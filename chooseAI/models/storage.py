@@ -1,8 +1,9 @@
-
 from dataclasses import dataclass
 from typing import Optional
 
 @dataclass
 class StorageInfo:
     total_gb: float
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    free_gb: Optional[float] = None
+    path: Optional[str] = None
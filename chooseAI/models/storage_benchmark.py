@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+@dataclass
+class StorageBenchmark:
+    path: str
+    read_mb_s: float
+    bytes_read: int
+    # How the page cache was bypassed: "direct" (O_DIRECT), "fadvise", "nocache" (macOS) or "cached"
+    method: str
+    duration_s: float
+    fingerprint: str = ""
+    measured_at: float = 0.0
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass
+class HardwareRates:
+    cpu_bandwidth_gb_s: float
+    cpu_gflops: float
+    source: str = "heuristic"
+
+@dataclass
+class OffloadPlan:
+    total_layers: int
+    gpu_layers: List[int] = field(default_factory=list)
+    gpu_indices: List[int] = field(default_factory=list)
+    cpu_layers: int = 0
+    cpu_gb: float = 0.0
+    # How much slower than running entirely in the fastest GPU's VRAM (0 when that is the plan)
+    speed_penalty: float = 0.0
+
+    @property
+    def num_gpu(self) -> int:
+        """Layers offloaded to GPUs, i.e. Ollama's num_gpu option"""
+        return sum(self.gpu_layers)
+
+    @property
+    def gpu_fraction(self) -> float:
+        return self.num_gpu / self.total_layers if self.total_layers else 0.0
+
+@dataclass
+class ThroughputEstimate:
+    prompt_tokens_per_sec: float
+    generation_tokens_per_sec: float
+    gpu_fraction: float
+    offload: OffloadPlan = None
@@ -0,0 +1,66 @@
+import os
+from urllib.parse import urlsplit
+
+DEFAULT_OLLAMA_HOST = "http://127.0.0.1:11434"
+DEFAULT_OLLAMA_PORT = 11434
+
+
+def resolve_ollama_host(host: str = None) -> str:
+    """Resolve the Ollama base URL from an explicit host or OLLAMA_HOST"""
+    host = (host or os.environ.get("OLLAMA_HOST") or DEFAULT_OLLAMA_HOST).strip().rstrip("/")
+    if "://" not in host:
+        # Like Ollama itself: a bare host ("0.0.0.0", "localhost") means its default port, while
+        # an explicit scheme keeps that scheme's own default (80/443, e.g. behind a proxy)
+        host = f"http://{host}"
+        parts = urlsplit(host)
+        if parts.port is None:
+            host = f"http://{parts.netloc}:{DEFAULT_OLLAMA_PORT}{parts.path}"
+    return host
+
+
+class OllamaClient:
+    """Small client for the local Ollama REST API backed by a pooled session"""
+
+    def __init__(self, host: str = None, timeout: float = 5.0, pool_size: int = 4):
+        self.base_url = resolve_ollama_host(host)
+        self.timeout = timeout
+
+        # requests is only imported once something actually talks to Ollama
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _get(self, path: str) -> dict:
+        resp = self.session.get(f"{self.base_url}{path}", timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _post(self, path: str, payload: dict, timeout: float = None) -> dict:
+        resp = self.session.post(f"{self.base_url}{path}", json=payload, timeout=timeout or self.timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def list_models(self) -> list[dict]:
+        """Models installed locally (GET /api/tags)"""
+        return self._get("/api/tags").get("models", [])
+
+    def list_running(self) -> list[dict]:
+        """Models currently loaded in memory (GET /api/ps)"""
+        return self._get("/api/ps").get("models", [])
+
+    def generate(self, model: str, prompt: str, options: dict = None, timeout: float = 600.0) -> dict:
+        """Run a non-streaming completion (POST /api/generate), including timing fields"""
+        payload = {"model": model, "prompt": prompt, "stream": False}
+        if options:
+            payload["options"] = options
+        return self._post("/api/generate", payload, timeout=timeout)
+
+    def unload(self, model: str):
+        """Evict a model from memory so the next request measures a cold load"""
+        self._post("/api/generate", {"model": model, "keep_alive": 0}, timeout=60.0)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,30 @@
+import os
+
+# Where Ollama keeps models for a user install and for the Linux system service
+DEFAULT_MODEL_DIRS = [
+    os.path.join(os.path.expanduser("~"), ".ollama", "models"),
+    "/usr/share/ollama/.ollama/models",
+    "/var/lib/ollama/.ollama/models",
+]
+
+
+def ollama_models_dir() -> str:
+    """Directory Ollama stores models in (OLLAMA_MODELS wins, then the first default that exists)"""
+    configured = os.environ.get("OLLAMA_MODELS")
+    if configured:
+        return configured
+    for directory in DEFAULT_MODEL_DIRS:
+        if os.path.isdir(directory):
+            return directory
+    return DEFAULT_MODEL_DIRS[0]
+
+
+def existing_ancestor(path: str) -> str:
+    """Closest existing directory, so free space can be measured before Ollama creates its directory"""
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
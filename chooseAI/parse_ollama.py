@@ -1,9 +1,8 @@
-import requests
-from bs4 import BeautifulSoup
 import sqlite3
 import re
 import json
 import os
+from urllib.request import pathname2url
 
 DB_FILE = "ollama_models.db"
 
@@ -57,10 +56,110 @@ def init_db():
         type TEXT
     )
     """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_models_pulls ON models(pulls)")
+    init_search_index(conn)
+    init_catalog_version(conn)
     conn.commit()
     return conn
 
+def connect_readonly():
+    """Read-only connection to the catalog; it never takes a write lock, so it cannot block a refresh"""
+    return sqlite3.connect(f"file:{pathname2url(os.path.abspath(DB_FILE))}?mode=ro", uri=True)
+
+def catalog_exists() -> bool:
+    """Whether the catalog has been scraped; other features may create the database file first"""
+    if not os.path.exists(DB_FILE):
+        return False
+    conn = connect_readonly()
+    try:
+        return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'models'").fetchone() is not None
+    finally:
+        conn.close()
+
+def init_catalog_version(conn):
+    """Create a counter that triggers bump whenever catalog content changes, so caches can key on it"""
+    cur = conn.cursor()
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS catalog_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    """)
+    cur.execute("INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 0)")
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS models_version_insert AFTER INSERT ON models BEGIN
+        UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS models_version_delete AFTER DELETE ON models BEGIN
+        UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+    END
+    """)
+    # Re-scrapes upsert every row; only real changes count ("updated" is relative text that drifts daily)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS models_version_update AFTER UPDATE ON models
+    WHEN old.name IS NOT new.name OR old.description IS NOT new.description OR old.sizes IS NOT new.sizes
+        OR old.tags IS NOT new.tags OR old.pulls IS NOT new.pulls OR old.type IS NOT new.type
+    BEGIN
+        UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+    END
+    """)
+
+def get_catalog_version(conn=None) -> int:
+    own_conn = conn is None
+    conn = conn or sqlite3.connect(DB_FILE)
+    try:
+        init_catalog_version(conn)
+        conn.commit()
+        return conn.execute("SELECT version FROM catalog_version WHERE id = 1").fetchone()[0]
+    finally:
+        if own_conn:
+            conn.close()
+
+def init_search_index(conn):
+    """Create the FTS5 index over the catalog and the triggers that keep it in sync"""
+    cur = conn.cursor()
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='models_fts'")
+    exists = cur.fetchone() is not None
+
+    cur.execute("""
+    CREATE VIRTUAL TABLE IF NOT EXISTS models_fts USING fts5(
+        name, description, tags, type,
+        content='models', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS models_fts_insert AFTER INSERT ON models BEGIN
+        INSERT INTO models_fts(rowid, name, description, tags, type)
+        VALUES (new.id, new.name, new.description, new.tags, new.type);
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS models_fts_delete AFTER DELETE ON models BEGIN
+        INSERT INTO models_fts(models_fts, rowid, name, description, tags, type)
+        VALUES ('delete', old.id, old.name, old.description, old.tags, old.type);
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS models_fts_update AFTER UPDATE ON models BEGIN
+        INSERT INTO models_fts(models_fts, rowid, name, description, tags, type)
+        VALUES ('delete', old.id, old.name, old.description, old.tags, old.type);
+        INSERT INTO models_fts(rowid, name, description, tags, type)
+        VALUES (new.id, new.name, new.description, new.tags, new.type);
+    END
+    """)
+
+    # Databases created before the index existed need a one-off backfill
+    if not exists:
+        cur.execute("INSERT INTO models_fts(models_fts) VALUES ('rebuild')")
+
 def fetch_models(url="https://ollama.com/library"):
+    # Scraping libraries are only needed when the catalog is (re)built
+    import requests
+    from bs4 import BeautifulSoup
+
     resp = requests.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, "html.parser")
@@ -122,6 +221,21 @@ def fetch_models(url="https://ollama.com/library"):
     conn.commit()
     conn.close()
 
+def _row_to_model(r) -> dict:
+    return {
+        "name": r[0],
+        "description": r[1],
+        "metadata": {
+            "sizes": json.loads(r[2]) if r[2] else [],
+            "tags": json.loads(r[3]) if r[3] else [],
+            "updated": r[5],
+            "type": r[6],
+        },
+        "stats": {
+            "pulls": r[4],
+        }
+    }
+
 def get_all_models():
     conn = sqlite3.connect(DB_FILE)
     cur = conn.cursor()
@@ -129,23 +243,101 @@ def get_all_models():
     rows = cur.fetchall()
     conn.close()
 
+    return [_row_to_model(r) for r in rows]
+
+# Words that carry no meaning for the index ("find small code models supporting tools")
+SEARCH_STOPWORDS = {
+    "a", "an", "the", "and", "or", "for", "with", "that", "which", "can", "to", "of", "in",
+    "find", "show", "list", "get", "search", "me", "i", "want", "need", "good", "best",
+    "model", "models", "llm", "llms", "support", "supports", "supporting", "using", "use",
+}
+
+# Size words mapped to a parameter range in billions, [low, high) so adjacent buckets do not overlap
+SEARCH_SIZE_WORDS = {
+    "tiny": (0, 3),
+    "small": (0, 8),
+    "medium": (8, 34),
+    "large": (34, None),
+    "big": (34, None),
+    "huge": (70, None),
+}
+
+def parse_search_query(query: str) -> tuple[list[str], tuple[float, float | None] | None]:
+    """Split a free-text query into index terms and an optional parameter-size range"""
+    terms = []
+    size_range = None
+    for word in re.findall(r"[\w.]+", query.lower()):
+        if word in SEARCH_SIZE_WORDS:
+            size_range = SEARCH_SIZE_WORDS[word]
+        elif word not in SEARCH_STOPWORDS:
+            terms.append(word)
+    return terms, size_range
+
+def search_models(query: str, limit: int = 10, conn=None) -> list[dict]:
+    """
+    Ranked full-text search over model name, description, tags and type
+
+    Every term has to match; if no model matches them all, any term may match instead.
+    """
+    terms, size_range = parse_search_query(query)
+
+    own_conn = conn is None
+    if own_conn:
+        conn = init_db()
+    try:
+        quoted = ['"' + t.replace('"', '""') + '"' for t in terms]
+        rows = _search_rows(conn, " AND ".join(quoted), size_range, limit)
+        if not rows and len(quoted) > 1:
+            rows = _search_rows(conn, " OR ".join(quoted), size_range, limit)
+    finally:
+        if own_conn:
+            conn.close()
+
     result = []
     for r in rows:
-        result.append({
-            "name": r[0],
-            "description": r[1],
-            "metadata": {
-                "sizes": json.loads(r[2]) if r[2] else [],
-                "tags": json.loads(r[3]) if r[3] else [],
-                "updated": r[5],
-                "type": r[6],
-            },
-            "stats": {
-                "pulls": r[4],
-            }
-        })
+        model = _row_to_model(r)
+        model["rank"] = -r[7] or 0.0
+        result.append(model)
     return result
 
+def _search_rows(conn, match: str, size_range: tuple[float, float | None] | None, limit: int) -> list[tuple]:
+    where = []
+    params = []
+    if match:
+        where.append("models_fts MATCH ?")
+        params.append(match)
+    if size_range:
+        low, high = size_range
+        size_clause = "json_extract(s.value, '$.unit') = 'b' AND json_extract(s.value, '$.value') >= ?"
+        params.append(low)
+        if high is not None:
+            size_clause += " AND json_extract(s.value, '$.value') < ?"
+            params.append(high)
+        where.append(f"EXISTS (SELECT 1 FROM json_each(m.sizes) s WHERE {size_clause})")
+
+    if match:
+        sql = """
+            SELECT m.name, m.description, m.sizes, m.tags, m.pulls, m.updated, m.type,
+                   bm25(models_fts, 10.0, 1.0, 5.0, 5.0) AS rank
+            FROM models_fts JOIN models m ON m.id = models_fts.rowid
+        """
+        order = "ORDER BY rank, m.pulls DESC"
+    else:
+        sql = """
+            SELECT m.name, m.description, m.sizes, m.tags, m.pulls, m.updated, m.type, 0.0 AS rank
+            FROM models m
+        """
+        order = "ORDER BY m.pulls DESC"
+
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" {order} LIMIT ?"
+    params.append(limit)
+
+    cur = conn.cursor()
+    cur.execute(sql, params)
+    return cur.fetchall()
+
 if __name__ == "__main__":
     fetch_models()
     print(json.dumps(get_all_models(), ensure_ascii=False, indent=2))
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import sqlite3
+import time
+from typing import Dict, List, Optional
+from chooseAI.models.calibration_result import CalibrationResult
+from chooseAI.models.installed_model import InstalledModel
+from chooseAI.models.runtime_settings import RuntimeSettings
+from chooseAI.models.throughput import OffloadPlan, ThroughputEstimate
+from chooseAI.parse_ollama import DB_FILE, get_catalog_version
+from chooseAI.serialization import system_info_to_dict, to_jsonable
+
+# Bump when the stored layout or the meaning of scores changes
+CACHE_SCHEMA_VERSION = 2
+# Newest entries kept; older ones (other hardware states, weights, flags) are pruned on insert
+MAX_CACHE_ENTRIES = 64
+# Live figures vary a little between runs; they are rounded to these steps (GB) for the key
+LIVE_ROUNDING_GB = {"available_gb": 0.5, "free_gb": 5.0, "free_vram_gb": 0.5}
+
+
+def init_recommendation_cache(conn=None):
+    conn = conn or sqlite3.connect(DB_FILE)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS recommendation_cache (
+        key TEXT PRIMARY KEY,
+        category TEXT NOT NULL,
+        catalog_version INTEGER NOT NULL,
+        results TEXT NOT NULL,
+        created_at REAL
+    )
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS recommendation_cache_stats (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        hits INTEGER NOT NULL DEFAULT 0,
+        misses INTEGER NOT NULL DEFAULT 0
+    )
+    """)
+    conn.execute("INSERT OR IGNORE INTO recommendation_cache_stats (id) VALUES (1)")
+    conn.commit()
+    return conn
+
+
+def _round_live(value):
+    """Round live RAM/disk/VRAM figures inside a serialized hardware profile"""
+    if isinstance(value, dict):
+        return {
+            k: round(v / LIVE_ROUNDING_GB[k]) * LIVE_ROUNDING_GB[k]
+            if k in LIVE_ROUNDING_GB and isinstance(v, (int, float)) else _round_live(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_round_live(v) for v in value]
+    return value
+
+
+def recommendation_key(system_info: Dict, engine, category: str, max_results: int,
+                       inventory=None, min_tokens_per_sec: float = None, catalog_version: int = 0) -> str:
+    """Stable hash of everything a ranking depends on"""
+    inputs = {
+        "schema": CACHE_SCHEMA_VERSION,
+        "hardware": _round_live(system_info_to_dict(system_info)),
+        # Weights, footprint/speed assumptions, measured rates and calibration results
+        "engine": to_jsonable(vars(engine)),
+        "inventory": sorted(
+            [m.name, m.parameter_size, m.loaded, m.size_bytes] for m in inventory.installed()
+        ) if inventory else [],
+        "category": category,
+        "max_results": max_results,
+        "min_tokens_per_sec": min_tokens_per_sec,
+        "catalog_version": catalog_version,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def encode_recommendation(rec: Dict) -> Dict:
+    """JSON form of a recommendation; the catalog entry is stored whole so a hit never loads the catalog"""
+    throughput = rec.get("throughput")
+    return {
+        "model": rec["model"],
+        "total_score": float(rec["total_score"]),
+        "scores": to_jsonable(rec["scores"]),
+        "model_size": rec["model_size"],
+        "compatibility": rec["compatibility"],
+        "installed": to_jsonable(rec.get("installed")),
+        "throughput": to_jsonable(throughput),
+        "measurement": to_jsonable(rec.get("measurement")),
+        "time_to_first_answer": rec.get("time_to_first_answer"),
+        "runtime": to_jsonable(rec.get("runtime")),
+    }
+
+
+def decode_recommendation(data: Dict) -> Dict:
+    throughput = None
+    if data.get("throughput"):
+        offload = data["throughput"].get("offload")
+        throughput = ThroughputEstimate(**{
+            **data["throughput"], "offload": OffloadPlan(**offload) if offload else None
+        })
+    return {
+        "model": data["model"],
+        "total_score": data["total_score"],
+        "scores": data["scores"],
+        "model_size": data["model_size"],
+        "compatibility": data["compatibility"],
+        "installed": InstalledModel(**data["installed"]) if data.get("installed") else None,
+        "throughput": throughput,
+        "measurement": CalibrationResult(**data["measurement"]) if data.get("measurement") else None,
+        "time_to_first_answer": data.get("time_to_first_answer"),
+        "runtime": RuntimeSettings(**data["runtime"]) if data.get("runtime") else None,
+    }
+
+
+class RecommendationCache:
+    """Ranked results stored in the catalog database, keyed by recommendation_key"""
+
+    def __init__(self, conn=None):
+        self.conn = init_recommendation_cache(conn)
+        self.catalog_version = get_catalog_version(self.conn)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        row = self.conn.execute("SELECT results FROM recommendation_cache WHERE key = ?", (key,)).fetchone()
+        results = None
+        if row:
+            try:
+                results = [decode_recommendation(r) for r in json.loads(row[0])]
+            except (TypeError, ValueError, KeyError):
+                results = None  # Written by an incompatible version; recompute and overwrite
+
+        if results is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return results
+
+    def put(self, key: str, category: str, recommendations: List[Dict]):
+        self.conn.execute("""
+            INSERT OR REPLACE INTO recommendation_cache (key, category, catalog_version, results, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (key, category, self.catalog_version,
+              json.dumps([encode_recommendation(r) for r in recommendations]), time.time()))
+        # Entries for an older catalog can never be hit again
+        self.conn.execute("DELETE FROM recommendation_cache WHERE catalog_version != ?", (self.catalog_version,))
+        self.conn.execute("""
+            DELETE FROM recommendation_cache WHERE key NOT IN (
+                SELECT key FROM recommendation_cache ORDER BY created_at DESC, rowid DESC LIMIT ?
+            )
+        """, (MAX_CACHE_ENTRIES,))
+
+    def lifetime_stats(self) -> Dict[str, int]:
+        """Stored counters plus this run's lookups, which are only written on close"""
+        hits, misses = self.conn.execute(
+            "SELECT hits, misses FROM recommendation_cache_stats WHERE id = 1"
+        ).fetchone()
+        return {"hits": hits + self.hits, "misses": misses + self.misses}
+
+    def close(self):
+        """Write this run's counters and new entries in one transaction"""
+        if self.hits or self.misses:
+            self.conn.execute(
+                "UPDATE recommendation_cache_stats SET hits = hits + ?, misses = misses + ? WHERE id = 1",
+                (self.hits, self.misses)
+            )
+        self.conn.commit()
+        self.conn.close()
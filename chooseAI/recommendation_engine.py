@@ -1,23 +1,42 @@
 # chooseAI/recommendation_engine.py
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 import json
+import math
 import re
 from chooseAI.models.cpu import CPUInfo
 from chooseAI.models.gpu import GPUInfo
 from chooseAI.models.ram import RAMInfo
 from chooseAI.models.storage import StorageInfo
+from chooseAI.models.installed_model import InstalledModel
+from chooseAI.models.memory_footprint import MemoryFootprint
+from chooseAI.models.throughput import HardwareRates, ThroughputEstimate
+from chooseAI.throughput import (
+    estimate_hardware_rates, gpu_layer_capacity, has_discrete_gpu, predict_throughput, usable_vram_gb
+)
+from chooseAI.models.calibration_result import CalibrationResult
+from chooseAI.models.capacity_plan import CapacityPlan
+from chooseAI.models.runtime_settings import RuntimeSettings
+from chooseAI.runtime_tuning import pinned_numa_node, recommend_runtime_settings
+from chooseAI.capacity import plan_capacity
+from chooseAI.inventory import ModelInventory, matches_catalog_model
+from chooseAI.memory_estimator import (
+    DEFAULT_QUANTIZATION, GIB, estimate_memory_footprint, parse_parameter_size, quantization_bits
+)
+from chooseAI.feature_table import ModelFeatureTable
+from chooseAI.tracing import span
+import numpy as np
 
 
 class ModelRecommendationEngine:
     def __init__(self):
-        self.model_requirements = {
-            "1b": {"min_ram": 2, "min_vram": 1, "recommended_ram": 4},
-            "3b": {"min_ram": 4, "min_vram": 2, "recommended_ram": 8},
-            "7b": {"min_ram": 8, "min_vram": 4, "recommended_ram": 16},
-            "13b": {"min_ram": 16, "min_vram": 8, "recommended_ram": 32},
-            "34b": {"min_ram": 32, "min_vram": 16, "recommended_ram": 64},
-            "70b": {"min_ram": 64, "min_vram": 32, "recommended_ram": 128}
-        }
+        # Memory footprint assumptions: Ollama defaults to Q4_K_M weights, an f16 KV cache
+        # and a 4096-token context; ram_reserve_gb is left for the OS and other processes
+        self.default_quantization_bits = quantization_bits(DEFAULT_QUANTIZATION)
+        self.context_length = 4096
+        self.kv_cache_bits = 16.0
+        self.ram_reserve_gb = 1.5
+        # Space left free on the models disk after a download
+        self.disk_reserve_gb = 2.0
 
         # Priority weights for different criteria
         self.weights = {
@@ -27,13 +46,29 @@ class ModelRecommendationEngine:
             "type_match": 0.1
         }
 
+        # Generation speed that counts as fully responsive for interactive use
+        self.target_tokens_per_sec = 40.0
+        # Measured rates replace the spec-based heuristic when set
+        self.hardware_rates: Optional[HardwareRates] = None
+        # Calibration runs on this hardware, keyed by local model name; these beat any prediction
+        self.measurements: Dict[str, CalibrationResult] = {}
+
+        # Installed models avoid a download, loaded ones also avoid a cold load
+        self.installed_boost = 0.1
+        self.loaded_boost = 0.15
+
+        # Assumptions for time-to-first-answer estimates; a storage benchmark replaces the disk rate
+        self.download_mb_s = 25.0
+        self.disk_read_mb_s = 500.0
+
     def extract_model_size(self, model_name: str, sizes: List[Dict]) -> str:
         """Extract model parameter size from name or sizes list"""
         # Try to extract from model name first
-        name_match = re.search(r'(\d+(?:\.\d+)?)b', model_name.lower())
+        name_match = re.search(r'(\d+x)?(\d+(?:\.\d+)?)b', model_name.lower())
         if name_match:
-            size_val = float(name_match.group(1))
-            return f"{int(size_val)}b" if size_val.is_integer() else f"{size_val}b"
+            experts = name_match.group(1) or ""
+            size_val = float(name_match.group(2))
+            return f"{experts}{int(size_val)}b" if size_val.is_integer() else f"{experts}{size_val}b"
 
         # Try to extract from sizes list
         if sizes:
@@ -44,63 +79,115 @@ class ModelRecommendationEngine:
 
         return "unknown"
 
-    def calculate_memory_score(self, model_size: str, ram_gb: float, vram_gb: float) -> float:
-        """Calculate how well the model fits in available memory"""
-        if model_size not in self.model_requirements:
+    def estimate_footprint(self, model_size: str) -> Optional[MemoryFootprint]:
+        """Estimate resident memory for a model size at the engine's quantization and context length"""
+        params_b = parse_parameter_size(model_size)
+        if params_b is None:
+            return None
+        return estimate_memory_footprint(
+            params_b,
+            quant_bits=self.default_quantization_bits,
+            context_length=self.context_length,
+            kv_cache_bits=self.kv_cache_bits
+        )
+
+    def calculate_memory_score(self, model_size: str, ram_gb: float, vram_gb: float,
+                               gpus: List[GPUInfo] = None, available_ram_gb: float = None) -> float:
+        """Calculate how well the model fits in available memory, allowing layers to be split across GPUs and RAM"""
+        footprint = self.estimate_footprint(model_size)
+        if footprint is None:
             return 0.5  # Default score for unknown sizes
 
-        req = self.model_requirements[model_size]
-
-        # Check if minimum requirements are met
-        if ram_gb < req["min_ram"]:
-            return 0.1  # Very low score if minimum RAM not met
+        if gpus is None:
+            gpus = [GPUInfo(name="GPU", vram_gb=vram_gb)] if vram_gb > 0 else []
+        layers, gpu_layers, layer_gb = gpu_layer_capacity(footprint, gpus)
+        total_vram_gb = sum(usable_vram_gb(g) for g in gpus if has_discrete_gpu(g))
 
         # Prefer GPU if available and sufficient
-        if vram_gb >= req.get("min_vram", 0):
-            if vram_gb >= req["min_vram"] * 1.5:
+        if gpu_layers >= layers:
+            if total_vram_gb >= footprint.total_gb * 1.5:
                 return 1.0  # Excellent fit
             else:
                 return 0.8  # Good fit
 
-        # Fall back to RAM
-        if ram_gb >= req["recommended_ram"]:
-            return 0.7
-        elif ram_gb >= req["min_ram"] * 1.5:
-            return 0.6
+        # Layers that do not fit on the GPUs stay in RAM, which must keep room for the OS
+        # so the model does not end up swapping (or, in a container, being OOM-killed)
+        required_gb = (layers - gpu_layers) * layer_gb + footprint.overhead_gb
+        usable_ram_gb = self.usable_ram_gb(ram_gb, available_ram_gb)
+        if usable_ram_gb < required_gb:
+            return 0.1  # Very low score if the model does not fit
+        if usable_ram_gb >= required_gb * 2:
+            score = 0.7
+        elif usable_ram_gb >= required_gb * 1.5:
+            score = 0.6
         else:
-            return 0.3
+            score = 0.3
+
+        # Partial offload: the larger the GPU share, the closer to a full GPU fit
+        return score + (0.8 - score) * (gpu_layers / layers) * 0.5
+
+    def usable_ram_gb(self, ram_gb: float, available_ram_gb: float = None) -> float:
+        """System RAM a model may fill: ram_reserve_gb stays free, and no more than is currently available"""
+        usable_ram_gb = ram_gb - self.ram_reserve_gb
+        if available_ram_gb is not None:
+            usable_ram_gb = min(usable_ram_gb, available_ram_gb)
+        return usable_ram_gb
+
+    def get_hardware_rates(self, cpu_info: CPUInfo) -> HardwareRates:
+        """CPU bandwidth and compute used for throughput predictions"""
+        return self.hardware_rates or estimate_hardware_rates(cpu_info)
+
+    def predict_throughput(self, cpu_info: CPUInfo, gpu_info: GPUInfo, model_size: str,
+                           gpus: List[GPUInfo] = None) -> Optional[ThroughputEstimate]:
+        """Predict prompt-eval and generation tokens/sec of a model under its best GPU/CPU layer split"""
+        footprint = self.estimate_footprint(model_size)
+        if footprint is None:
+            return None
+        gpus = gpus or [gpu_info]
+        throughput = predict_throughput(footprint, self.get_hardware_rates(cpu_info), gpus)
+
+        # A model pinned to one NUMA node (see recommend_runtime_settings) gets that node's local bandwidth
+        if self.hardware_rates is None and cpu_info.numa_nodes > 1:
+            node = pinned_numa_node(cpu_info, throughput.offload)
+            if node is not None:
+                pinned = predict_throughput(footprint, estimate_hardware_rates(cpu_info, node), gpus)
+                if pinned_numa_node(cpu_info, pinned.offload) == node:
+                    throughput = pinned
+        return throughput
+
+    def calculate_performance_score(self, cpu_info: CPUInfo, gpu_info: GPUInfo, model_size: str,
+                                    gpus: List[GPUInfo] = None,
+                                    throughput: Optional[ThroughputEstimate] = None) -> float:
+        """Calculate expected responsiveness from the predicted generation speed"""
+        if throughput is None:
+            throughput = self.predict_throughput(cpu_info, gpu_info, model_size, gpus)
+        if throughput is None:
+            return 0.5  # Default score for unknown sizes
 
-    def calculate_performance_score(self, cpu_info: CPUInfo, gpu_info: GPUInfo, model_size: str) -> float:
-        score = 0.0
+        return self.performance_score_from_tps(throughput.generation_tokens_per_sec)
 
-        # CPU contribution
-        if cpu_info.physical_cores:
-            if cpu_info.physical_cores >= 8:
-                score += 0.3
-            elif cpu_info.physical_cores >= 4:
-                score += 0.2
-            else:
-                score += 0.1
-
-        # Clock speed
-        if cpu_info.clock_speed_ghz:
-            if cpu_info.clock_speed_ghz >= 3.0:
-                score += 0.2
-            elif cpu_info.clock_speed_ghz >= 2.5:
-                score += 0.15
-            else:
-                score += 0.1
-
-        # GPU  (if available)
-        if gpu_info.vram_gb > 0 and "No GPU" not in gpu_info.name:
-            if gpu_info.vram_gb >= 8:
-                score += 0.5  # Excellent GPU
-            elif gpu_info.vram_gb >= 4:
-                score += 0.3  # Good GPU
-            else:
-                score += 0.1  # Basic GPU
+    def performance_score_from_tps(self, tokens_per_sec: float) -> float:
+        """Map generation speed to 0-1; logarithmic, since doubling matters more at 2 tok/s than at 40"""
+        return min(1.0, math.log2(1 + tokens_per_sec) / math.log2(1 + self.target_tokens_per_sec))
 
-        return min(score, 1.0)
+    def find_measurement(self, model_name: str, model_size: str) -> Optional[CalibrationResult]:
+        """Most recent calibration of a variant of this catalog model on this hardware"""
+        best = None
+        for measurement in self.measurements.values():
+            if not matches_catalog_model(measurement.model, measurement.parameter_size, model_name, model_size):
+                continue
+            if best is None or measurement.measured_at > best.measured_at:
+                best = measurement
+        return best
+
+    def measured_throughput(self, measurement: CalibrationResult,
+                            predicted: ThroughputEstimate = None) -> ThroughputEstimate:
+        return ThroughputEstimate(
+            prompt_tokens_per_sec=measurement.prompt_tokens_per_sec,
+            generation_tokens_per_sec=measurement.generation_tokens_per_sec,
+            gpu_fraction=predicted.gpu_fraction if predicted else 0.0,
+            offload=predicted.offload if predicted else None
+        )
 
     def calculate_popularity_score(self, pulls: int) -> float:
         """Calculate popularity score based on number of pulls"""
@@ -131,11 +218,85 @@ class ModelRecommendationEngine:
         else:
             return 0.3
 
+    def estimate_model_bytes(self, model_size: str) -> int:
+        """Estimate the download size of a model at the default quantization"""
+        footprint = self.estimate_footprint(model_size)
+        if footprint is None:
+            return 0
+        return int(footprint.weights_gb * GIB)
+
+    def recommend_runtime_settings(self, cpu_info: CPUInfo, model_size: str,
+                                   throughput: ThroughputEstimate = None,
+                                   gpus: List[GPUInfo] = None) -> RuntimeSettings:
+        """Ollama num_thread / num_gpu / NUMA settings for running a model on this machine"""
+        footprint = self.estimate_footprint(model_size)
+        return recommend_runtime_settings(
+            cpu_info,
+            throughput.offload if throughput else None,
+            footprint.total_gb if footprint else 0.0,
+            has_gpu=gpus is None or any(has_discrete_gpu(g) for g in gpus)
+        )
+
+    def plan_capacity(self, system_info: Dict[str, Any], model_size: str, request_rate: float,
+                      context_length: int = None, prompt_tokens: int = None, output_tokens: int = 256,
+                      max_latency_s: float = None) -> Optional[CapacityPlan]:
+        """Parallel slots, loaded-model limit and aggregate tokens/sec for serving a model at request_rate"""
+        params_b = parse_parameter_size(model_size)
+        if params_b is None:
+            return None
+        context_length = context_length or self.context_length
+        ram_info = system_info["ram"]
+        return plan_capacity(
+            params_b,
+            self.get_hardware_rates(system_info["cpu"]),
+            system_info.get("gpus") or [system_info["gpu"]],
+            self.usable_ram_gb(ram_info.effective_gb, ram_info.available_gb),
+            request_rate,
+            context_length,
+            prompt_tokens if prompt_tokens is not None else context_length // 2,
+            output_tokens,
+            quant_bits=self.default_quantization_bits,
+            kv_cache_bits=self.kv_cache_bits,
+            max_latency_s=max_latency_s
+        )
+
+    def fits_on_disk(self, model_size: str, storage_info: StorageInfo) -> bool:
+        """Whether downloading the model leaves the disk with at least disk_reserve_gb free"""
+        if storage_info.free_gb is None:
+            return True
+        return self.estimate_model_bytes(model_size) / GIB <= storage_info.free_gb - self.disk_reserve_gb
+
+    def estimate_time_to_first_answer(self, model_bytes: int, installed: InstalledModel = None,
+                                      measured_load_s: float = None) -> Dict[str, float]:
+        """Estimate seconds spent downloading and loading a model before it can answer"""
+        download_s = 0.0 if installed else model_bytes / (self.download_mb_s * 1e6)
+        # A cold load streams the whole model file from disk
+        if measured_load_s is not None:
+            cold_load_s = measured_load_s
+        else:
+            cold_load_s = model_bytes / (self.disk_read_mb_s * 1e6)
+        load_s = 0.0 if installed and installed.loaded else cold_load_s
+        return {
+            "download_s": download_s,
+            "load_s": load_s,
+            "cold_load_s": cold_load_s,
+            "total_s": download_s + load_s
+        }
+
+    def apply_inventory_boost(self, total_score: float, installed: InstalledModel = None) -> float:
+        """Raise the score of installed/loaded models while keeping it within 0-1"""
+        if not installed:
+            return total_score
+        boost = self.loaded_boost if installed.loaded else self.installed_boost
+        return total_score + boost * (1.0 - total_score)
+
     def recommend_models(self,
                          system_info: Dict[str, Any],
                          models: List[Dict],
                          preferred_type: str = None,
-                         max_results: int = 10) -> List[Dict]:
+                         max_results: int = 10,
+                         inventory: ModelInventory = None,
+                         min_tokens_per_sec: float = None) -> List[Dict]:
         """
         Recommend best models based on system specifications
 
@@ -144,6 +305,8 @@ class ModelRecommendationEngine:
             models: List of available models
             preferred_type: Preferred model type (e.g., 'general', 'code', 'vision')
             max_results: Maximum number of recommendations to return
+            inventory: Locally installed models to prefer (optional)
+            min_tokens_per_sec: Drop models predicted to generate slower than this (optional)
 
         Returns:
             List of recommended models with scores
@@ -155,6 +318,7 @@ class ModelRecommendationEngine:
 
         if not all([cpu_info, gpu_info, ram_info, storage_info]):
             raise ValueError("Incomplete system information provided")
+        gpus = system_info.get("gpus") or [gpu_info]
 
         recommendations = []
 
@@ -170,13 +334,20 @@ class ModelRecommendationEngine:
 
                 # Calculate individual scores
                 memory_score = self.calculate_memory_score(
-                    model_size, ram_info.total_gb, gpu_info.vram_gb
+                    model_size, ram_info.effective_gb, gpu_info.vram_gb, gpus, ram_info.available_gb
                 )
 
+                throughput = self.predict_throughput(cpu_info, gpu_info, model_size, gpus)
                 performance_score = self.calculate_performance_score(
-                    cpu_info, gpu_info, model_size
+                    cpu_info, gpu_info, model_size, gpus, throughput
                 )
 
+                # Measured speed on this hardware takes precedence over the prediction
+                measurement = self.find_measurement(model["name"], model_size)
+                if measurement:
+                    throughput = self.measured_throughput(measurement, throughput)
+                    performance_score = self.performance_score_from_tps(throughput.generation_tokens_per_sec)
+
                 popularity_score = self.calculate_popularity_score(
                     model.get("stats", {}).get("pulls", 0)
                 )
@@ -197,6 +368,16 @@ class ModelRecommendationEngine:
                 if memory_score < 0.2:
                     continue
 
+                if min_tokens_per_sec and not self._meets_speed(throughput, min_tokens_per_sec):
+                    continue
+
+                installed = inventory.find(model["name"], model_size) if inventory else None
+                if not installed and not self.fits_on_disk(model_size, storage_info):
+                    continue
+
+                total_score = self.apply_inventory_boost(total_score, installed)
+                model_bytes = installed.size_bytes if installed else self.estimate_model_bytes(model_size)
+
                 recommendations.append({
                     "model": model,
                     "total_score": total_score,
@@ -207,7 +388,14 @@ class ModelRecommendationEngine:
                         "type_match": type_match_score
                     },
                     "model_size": model_size,
-                    "compatibility": self._get_compatibility_status(memory_score, performance_score)
+                    "compatibility": self._get_compatibility_status(memory_score, performance_score),
+                    "installed": installed,
+                    "throughput": throughput,
+                    "measurement": measurement,
+                    "time_to_first_answer": self.estimate_time_to_first_answer(
+                        model_bytes, installed, measurement.load_s if measurement else None
+                    ),
+                    "runtime": self.recommend_runtime_settings(cpu_info, model_size, throughput, gpus)
                 })
 
             except Exception as e:
@@ -218,6 +406,215 @@ class ModelRecommendationEngine:
         recommendations.sort(key=lambda x: x["total_score"], reverse=True)
         return recommendations[:max_results]
 
+    def build_feature_table(self, models: List[Dict]) -> ModelFeatureTable:
+        """Precompute the columnar features used by the vectorized scorer"""
+        return ModelFeatureTable(models, self.extract_model_size)
+
+    def calculate_popularity_scores(self, pulls: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_popularity_score"""
+        return np.select(
+            [pulls >= 10_000_000, pulls >= 1_000_000, pulls >= 100_000, pulls >= 10_000, pulls != 0],
+            [1.0, 0.8, 0.6, 0.4, 0.2],
+            default=0.1
+        )
+
+    def recommend_all(self,
+                      system_info: Dict[str, Any],
+                      table: ModelFeatureTable,
+                      preferred_types: List[str],
+                      max_results: int = 10,
+                      inventory: ModelInventory = None,
+                      min_tokens_per_sec: float = None) -> Dict[str, List[Dict]]:
+        """
+        Vectorized equivalent of recommend_models for several categories at once
+
+        Args:
+            system_info: Dictionary containing CPU, GPU, RAM, Storage info
+            table: Feature table from build_feature_table
+            preferred_types: Model types to rank for (e.g. ['general llm', 'code'])
+            max_results: Maximum number of recommendations per type
+            inventory: Locally installed models to prefer (optional)
+            min_tokens_per_sec: Drop models predicted to generate slower than this (optional)
+
+        Returns:
+            Mapping of preferred type to its recommendations, ordered as recommend_models would
+        """
+        cpu_info = system_info.get("cpu")
+        gpu_info = system_info.get("gpu")
+        ram_info = system_info.get("ram")
+        storage_info = system_info.get("storage")
+
+        if not all([cpu_info, gpu_info, ram_info, storage_info]):
+            raise ValueError("Incomplete system information provided")
+        gpus = system_info.get("gpus") or [gpu_info]
+
+        # Hardware-dependent scores only vary with the model size, so score each distinct size once
+        with span("score_sizes", sizes=len(table.size_labels)):
+            size_memory = np.array([
+                self.calculate_memory_score(size, ram_info.effective_gb, gpu_info.vram_gb, gpus, ram_info.available_gb)
+                for size in table.size_labels
+            ], dtype=np.float64)
+            size_throughput = [self.predict_throughput(cpu_info, gpu_info, size, gpus) for size in table.size_labels]
+            size_performance = np.array([
+                self.calculate_performance_score(cpu_info, gpu_info, size, gpus, throughput)
+                for size, throughput in zip(table.size_labels, size_throughput)
+            ], dtype=np.float64)
+        memory = size_memory[table.size_codes] if len(table) else np.zeros(0)
+        performance = size_performance[table.size_codes] if len(table) else np.zeros(0)
+        popularity = self.calculate_popularity_scores(table.pulls)
+        eligible = table.valid & (memory >= 0.2)
+        if min_tokens_per_sec and len(table):
+            size_fast_enough = np.array([self._meets_speed(t, min_tokens_per_sec) for t in size_throughput], dtype=bool)
+            eligible &= size_fast_enough[table.size_codes]
+
+        # Measured speed on this hardware takes precedence over the prediction
+        measured_rows = {}
+        for row in self._family_rows(table, self.measurements.keys()):
+            measurement = self.find_measurement(table.models[row]["name"], table.model_size(row))
+            if measurement:
+                throughput = self.measured_throughput(measurement, size_throughput[table.size_codes[row]])
+                measured_rows[row] = (measurement, throughput)
+                performance[row] = self.performance_score_from_tps(throughput.generation_tokens_per_sec)
+                if min_tokens_per_sec:
+                    eligible[row] = (table.valid[row] and memory[row] >= 0.2
+                                     and self._meets_speed(throughput, min_tokens_per_sec))
+
+        base_score = (
+                memory * self.weights["memory_fit"] +
+                performance * self.weights["performance"] +
+                popularity * self.weights["popularity"]
+        )
+
+        # Installed variants are rare, so look them up only for families present in the inventory
+        installed_rows = {}
+        if inventory:
+            for row in self._family_rows(table, (m.name for m in inventory.installed())):
+                match = inventory.find(table.models[row]["name"], table.model_size(row))
+                if match:
+                    installed_rows[row] = match
+
+        # Models that are not installed yet have to fit on disk; installed ones already do
+        if len(table):
+            size_fits_disk = np.array([self.fits_on_disk(size, storage_info) for size in table.size_labels], dtype=bool)
+            fits_disk = size_fits_disk[table.size_codes]
+            fits_disk[list(installed_rows)] = True
+            eligible &= fits_disk
+
+        results = {}
+        for preferred_type in preferred_types:
+            with span("rank", category=preferred_type):
+                type_scores = np.array([
+                    self.calculate_type_match_score(model_type, preferred_type) for model_type in table.type_labels
+                ], dtype=np.float64)
+                type_match = type_scores[table.type_codes] if len(table) else np.zeros(0)
+                total = base_score + type_match * self.weights["type_match"]
+                for row, installed in installed_rows.items():
+                    total[row] = self.apply_inventory_boost(total[row], installed)
+
+                results[preferred_type] = [
+                    self._build_recommendation(table, row, total[row], memory[row], performance[row],
+                                               popularity[row], type_match[row], installed_rows.get(row),
+                                               size_throughput[table.size_codes[row]], measured_rows.get(row),
+                                               cpu_info, gpus)
+                    for row in self._top_k(total, eligible, max_results)
+                ]
+        return results
+
+    def recommend_capacity(self,
+                           system_info: Dict[str, Any],
+                           table: ModelFeatureTable,
+                           preferred_type: str,
+                           request_rate: float,
+                           context_length: int = None,
+                           prompt_tokens: int = None,
+                           output_tokens: int = 256,
+                           max_latency_s: float = None,
+                           max_results: int = 5,
+                           inventory: ModelInventory = None) -> List[Dict]:
+        """
+        Plan serving capacity for the best-scoring models of a type
+
+        Args:
+            system_info: Dictionary containing CPU, GPU, RAM, Storage info
+            table: Feature table from build_feature_table
+            preferred_type: Model type to rank for (e.g. 'general llm')
+            request_rate: Target requests per second
+            context_length: Context window of every parallel slot (default: the engine's)
+            prompt_tokens: Average prompt length (default: half the context)
+            output_tokens: Average generated tokens per request
+            max_latency_s: Slowest acceptable end-to-end request time (optional)
+            max_results: Maximum number of candidate models
+            inventory: Locally installed models to prefer (optional)
+
+        Returns:
+            Recommendations with a "capacity" plan, models meeting the target first
+        """
+        recommendations = self.recommend_all(system_info, table, [preferred_type], max_results, inventory)
+        planned = []
+        for rec in recommendations[preferred_type]:
+            rec["capacity"] = self.plan_capacity(system_info, rec["model_size"], request_rate, context_length,
+                                                 prompt_tokens, output_tokens, max_latency_s)
+            if rec["capacity"]:
+                planned.append(rec)
+        planned.sort(key=lambda x: (x["capacity"].meets_target, x["total_score"]), reverse=True)
+        return planned
+
+    def _family_rows(self, table: ModelFeatureTable, local_names) -> List[int]:
+        """Catalog rows whose family matches any local model name such as 'gemma3:4b'"""
+        rows = set()
+        for name in local_names:
+            rows.update(table.family_rows.get(name.lower().partition(":")[0], []))
+        return sorted(rows)
+
+    def _meets_speed(self, throughput: Optional[ThroughputEstimate], min_tokens_per_sec: float) -> bool:
+        return throughput is not None and throughput.generation_tokens_per_sec >= min_tokens_per_sec
+
+    def _top_k(self, scores: np.ndarray, mask: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k best masked scores, ties broken by catalog order like a stable sort"""
+        candidates = np.flatnonzero(mask)
+        if k <= 0 or candidates.size == 0:
+            return candidates[:0]
+
+        candidate_scores = scores[candidates]
+        if candidates.size > k:
+            kth = np.argpartition(-candidate_scores, k - 1)[k - 1]
+            keep = candidate_scores >= candidate_scores[kth]
+            candidates = candidates[keep]
+            candidate_scores = candidate_scores[keep]
+
+        order = np.lexsort((candidates, -candidate_scores))
+        return candidates[order][:k]
+
+    def _build_recommendation(self, table: ModelFeatureTable, row: int, total_score: float,
+                              memory_score: float, performance_score: float, popularity_score: float,
+                              type_match_score: float, installed: InstalledModel = None,
+                              throughput: ThroughputEstimate = None, measured: tuple = None,
+                              cpu_info: CPUInfo = None, gpus: List[GPUInfo] = None) -> Dict:
+        model_size = table.model_size(row)
+        measurement = None
+        if measured:
+            measurement, throughput = measured
+        model_bytes = installed.size_bytes if installed else self.estimate_model_bytes(model_size)
+        return {
+            "model": table.models[row],
+            "total_score": float(total_score),
+            "scores": {
+                "memory_fit": float(memory_score),
+                "performance": float(performance_score),
+                "popularity": float(popularity_score),
+                "type_match": float(type_match_score)
+            },
+            "model_size": model_size,
+            "compatibility": self._get_compatibility_status(memory_score, performance_score),
+            "installed": installed,
+            "throughput": throughput,
+            "measurement": measurement,
+            "time_to_first_answer": self.estimate_time_to_first_answer(
+                model_bytes, installed, measurement.load_s if measurement else None
+            ),
+            "runtime": self.recommend_runtime_settings(cpu_info, model_size, throughput, gpus) if cpu_info else None
+        }
+
     def _get_compatibility_status(self, memory_score: float, performance_score: float) -> str:
         """Determine compatibility status based on scores"""
         if memory_score >= 0.8 and performance_score >= 0.7:
@@ -247,6 +644,11 @@ class ModelRecommendationEngine:
         explanation += f"• Popularity: {scores['popularity']:.2f}/1.0\n"
         explanation += f"• Type Match: {scores['type_match']:.2f}/1.0\n\n"
 
+        throughput = recommendation.get("throughput")
+        if throughput:
+            explanation += (f"**Expected Speed:** ~{throughput.generation_tokens_per_sec:.1f} tokens/sec generation, "
+                            f"~{throughput.prompt_tokens_per_sec:.0f} tokens/sec prompt processing\n\n")
+
         if model.get("description"):
             explanation += f"**Description:** {model['description']}\n\n"
 
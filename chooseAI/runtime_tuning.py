@@ -0,0 +1,58 @@
+from typing import Optional
+from chooseAI.models.cpu import CPUInfo
+from chooseAI.models.runtime_settings import RuntimeSettings
+from chooseAI.models.throughput import OffloadPlan
+
+# Fraction of a NUMA node's memory a pinned model may fill, leaving room for the OS and page cache
+NUMA_NODE_FILL = 0.8
+# Threads kept when every layer runs on GPUs; the CPU only samples and schedules
+GPU_ONLY_THREADS = 4
+
+
+def node_physical_cores(cpu_info: CPUInfo, node: int) -> int:
+    """Physical cores of one NUMA node, from its logical CPUs and the SMT ratio"""
+    smt = (cpu_info.logical_cores or 1) / (cpu_info.physical_cores or 1)
+    return max(1, int(cpu_info.numa_cpus[node] / max(smt, 1.0)))
+
+
+def pinned_numa_node(cpu_info: CPUInfo, plan: Optional[OffloadPlan] = None, model_gb: float = 0.0) -> Optional[int]:
+    """NUMA node to pin a model to, or None when it runs on GPUs only, on one node, or spans all nodes"""
+    if cpu_info.numa_nodes <= 1 or (plan and plan.num_gpu and not plan.cpu_layers):
+        return None
+    cpu_gb = plan.cpu_gb if plan else model_gb
+    node = max(range(cpu_info.numa_nodes), key=lambda n: cpu_info.numa_memory_gb[n] if cpu_info.numa_memory_gb else 0)
+    node_memory = cpu_info.numa_memory_gb[node] if cpu_info.numa_memory_gb else 0.0
+    return node if cpu_gb <= node_memory * NUMA_NODE_FILL else None
+
+
+def recommend_runtime_settings(cpu_info: CPUInfo, plan: Optional[OffloadPlan] = None,
+                               model_gb: float = 0.0, has_gpu: bool = True) -> RuntimeSettings:
+    """
+    Ollama runtime settings for a model on this CPU
+
+    llama.cpp scales with physical cores, not SMT siblings, and loses bandwidth when a
+    thread reads weights from another NUMA node's memory. A model whose CPU share fits in
+    one node is pinned there; larger ones spread over all nodes.
+
+    Args:
+        cpu_info: CPU with its core counts, limits and NUMA layout
+        plan: Layer split of the model, if it is offloaded to GPUs
+        model_gb: Memory the model needs in system RAM when there is no plan
+        has_gpu: Whether the host has a GPU; num_gpu is left out on CPU-only hosts
+
+    Returns:
+        RuntimeSettings with num_thread, num_gpu and NUMA placement
+    """
+    cores = cpu_info.effective_cores or cpu_info.physical_cores or 1
+    num_gpu = plan.num_gpu if plan and has_gpu else None
+    if plan and plan.num_gpu and not plan.cpu_layers:
+        return RuntimeSettings(num_thread=min(cores, GPU_ONLY_THREADS), num_gpu=num_gpu)
+
+    if cpu_info.numa_nodes <= 1:
+        return RuntimeSettings(num_thread=cores, num_gpu=num_gpu)
+
+    node = pinned_numa_node(cpu_info, plan, model_gb)
+    if node is not None:
+        return RuntimeSettings(num_thread=min(cores, node_physical_cores(cpu_info, node)), num_gpu=num_gpu,
+                               numa_node=node)
+    return RuntimeSettings(num_thread=cores, num_gpu=num_gpu, numa=True)
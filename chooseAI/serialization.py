@@ -0,0 +1,47 @@
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert dataclasses, NumPy scalars and containers into plain JSON types"""
+    if is_dataclass(value) and not isinstance(value, type):
+        return to_jsonable(asdict(value))
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if hasattr(value, "item") and callable(value.item):
+        return value.item()  # NumPy scalar
+    return value
+
+
+def recommendation_to_dict(recommendation: Dict) -> Dict:
+    """Machine-readable form of one recommendation from the engine"""
+    model = recommendation["model"]
+    throughput = recommendation.get("throughput")
+    offload = throughput.offload if throughput else None
+    runtime = recommendation.get("runtime")
+    installed = recommendation.get("installed")
+    return {
+        "name": model["name"].split()[0] if model.get("name") else None,
+        "type": model.get("metadata", {}).get("type"),
+        "size": recommendation["model_size"],
+        "score": float(recommendation["total_score"]),
+        "scores": to_jsonable(recommendation["scores"]),
+        "compatibility": recommendation["compatibility"],
+        "generation_tokens_per_sec": throughput.generation_tokens_per_sec if throughput else None,
+        "prompt_tokens_per_sec": throughput.prompt_tokens_per_sec if throughput else None,
+        "measured": recommendation.get("measurement") is not None,
+        "offload": to_jsonable(offload) if offload else None,
+        "ollama_options": runtime.options() if runtime else None,
+        "numa_launch_prefix": runtime.launch_prefix if runtime else None,
+        "installed": to_jsonable(installed) if installed else None,
+        "time_to_first_answer": to_jsonable(recommendation.get("time_to_first_answer")),
+    }
+
+
+def system_info_to_dict(system_info: Dict) -> Dict:
+    """Machine-readable hardware profile (probe timings and cache bookkeeping left out)"""
+    return {
+        key: to_jsonable(system_info[key]) for key in ("cpu", "gpus", "ram", "storage") if key in system_info
+    }
@@ -0,0 +1,129 @@
+import mmap
+import os
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Dict, Optional
+from chooseAI.models.storage_benchmark import StorageBenchmark
+from chooseAI.host_cache import load_json_cache, save_json_cache
+from chooseAI.ollama_paths import existing_ancestor, ollama_models_dir
+
+CACHE_FILE = "storage_benchmark.json"
+BLOCK_SIZE = 1024 * 1024
+
+
+def _write_test_file(directory: str, size_bytes: int) -> str:
+    """Fill a temporary file with incompressible data and flush it to the device"""
+    fd, path = tempfile.mkstemp(dir=directory, prefix=".chooseai-read-test-")
+    block = os.urandom(BLOCK_SIZE)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for _ in range(size_bytes // BLOCK_SIZE):
+                f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def _open_uncached(path: str):
+    """Open a file for reading past the page cache; returns (fd, method)"""
+    if hasattr(os, "O_DIRECT"):
+        try:
+            return os.open(path, os.O_RDONLY | os.O_DIRECT), "direct"
+        except OSError:
+            pass  # e.g. tmpfs and some network filesystems refuse O_DIRECT
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return fd, "fadvise"
+    try:
+        import fcntl
+        fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        return fd, "nocache"
+    except (ImportError, AttributeError, OSError):
+        return fd, "cached"
+
+
+def _read_all(fd: int) -> int:
+    # Page-aligned buffer, as O_DIRECT requires
+    buffer = mmap.mmap(-1, BLOCK_SIZE)
+    total = 0
+    try:
+        while True:
+            count = os.readv(fd, [buffer]) if hasattr(os, "readv") else len(os.read(fd, BLOCK_SIZE))
+            if count <= 0:
+                return total
+            total += count
+    finally:
+        buffer.close()
+
+
+def measure_read_throughput(directory: str = None, size_mb: int = 256) -> StorageBenchmark:
+    """
+    Measure sequential read throughput of the disk holding the Ollama models directory
+
+    Writes a temporary file next to the models, then reads it back bypassing the page cache
+    (O_DIRECT, falling back to dropping the file's cached pages) as a cold model load would.
+
+    Args:
+        directory: Directory to test (defaults to the Ollama models directory)
+        size_mb: Size of the test file
+
+    Returns:
+        StorageBenchmark with the measured rate
+    """
+    directory = existing_ancestor(directory or ollama_models_dir())
+    path = _write_test_file(directory, size_mb * 1024 * 1024)
+    try:
+        fd, method = _open_uncached(path)
+        try:
+            start = time.perf_counter()
+            bytes_read = _read_all(fd)
+            elapsed = time.perf_counter() - start
+        finally:
+            os.close(fd)
+    finally:
+        os.remove(path)
+
+    return StorageBenchmark(
+        path=directory,
+        read_mb_s=bytes_read / elapsed / 1e6 if elapsed > 0 else 0.0,
+        bytes_read=bytes_read,
+        method=method,
+        duration_s=elapsed,
+        measured_at=time.time()
+    )
+
+
+def _cache_key(fingerprint: str, directory: str) -> str:
+    return f"{fingerprint}:{directory}"
+
+
+def load_cached_storage_benchmark(fingerprint: str, directory: str = None) -> Optional[StorageBenchmark]:
+    """Previously measured read throughput of this directory on this host, if any"""
+    directory = existing_ancestor(directory or ollama_models_dir())
+    entry = (load_json_cache(CACHE_FILE) or {}).get(_cache_key(fingerprint, directory))
+    if not entry:
+        return None
+    try:
+        return StorageBenchmark(**entry)
+    except TypeError:
+        return None  # Written by an incompatible version
+
+
+def get_storage_benchmark(fingerprint: str, directory: str = None, refresh: bool = False) -> StorageBenchmark:
+    """Return cached results for this directory, measuring when missing or refresh is set"""
+    if not refresh:
+        cached = load_cached_storage_benchmark(fingerprint, directory)
+        if cached:
+            return cached
+    benchmark = measure_read_throughput(directory)
+    benchmark.fingerprint = fingerprint
+    cache: Dict = load_json_cache(CACHE_FILE) or {}
+    cache[_cache_key(fingerprint, benchmark.path)] = asdict(benchmark)
+    save_json_cache(CACHE_FILE, cache)
+    return benchmark
@@ -1,10 +1,30 @@
 # systemInfo.py
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict
+from dataclasses import asdict, replace
+from typing import Callable, Dict, List, Optional
 from chooseAI.models.cpu import CPUInfo
 from chooseAI.models.gpu import GPUInfo
 from chooseAI.models.ram import RAMInfo
 from chooseAI.models.storage import StorageInfo
+from chooseAI.fingerprint import host_key
+from chooseAI.host_cache import load_json_cache, save_json_cache
+from chooseAI.tracing import span
+
+STATIC_CACHE_FILE = "static_hardware.json"
+STATIC_CACHE_VERSION = 3
+
+# Seconds each probe may take before its result is replaced by an error placeholder
+PROBE_TIMEOUTS = {
+    "cpu": 10.0,
+    "gpus": 10.0,
+    "ram": 3.0,
+    "storage": 3.0,
+    "free_vram": 5.0,
+}
+# The probes whose results are cached; everything else is probed on every call
+STATIC_PROBES = ("cpu", "gpus")
 
 
 class SystemInformation(ABC):
@@ -24,10 +44,149 @@ class SystemInformation(ABC):
     def get_storage(self) -> StorageInfo:
         pass
 
-    def get_system_info(self) -> Dict:
+    def get_gpus(self) -> List[GPUInfo]:
+        """Every GPU in the system; platforms that can enumerate them override this"""
+        return [self.get_gpu()]
+
+    def get_free_vram_gb(self) -> Optional[Dict[int, float]]:
+        """Free VRAM (GiB) per GPU index right now; None where the platform cannot tell"""
+        return None
+
+    def apply_live_limits(self, cpu: CPUInfo) -> CPUInfo:
+        """Add limits that can change without a reboot (quotas, affinity); applied after the cache"""
+        return cpu
+
+    def get_system_info(self, use_cache: bool = True) -> Dict:
+        """
+        Probe the hardware, running the probes concurrently
+
+        CPU and GPU identity are the expensive probes (cpuinfo, nvidia-smi) and cannot change
+        without a reboot, so they are cached per boot and host. RAM, storage and free VRAM
+        change while the system runs and are probed on every call; free VRAM is re-queried
+        for cached GPUs through get_free_vram_gb.
+
+        Args:
+            use_cache: Reuse static facts from an earlier run in this boot; when False they are
+                probed again and the cache is replaced
+
+        Returns:
+            Dictionary with cpu, gpu (the first GPU), gpus, ram and storage, plus probe_timings
+        """
+        start = time.perf_counter()
+        probes: Dict[str, Callable] = {
+            "cpu": self.get_cpu,
+            "gpus": self.get_gpus,
+            "ram": self.get_ram,
+            "storage": self.get_storage,
+        }
+
+        cache = load_json_cache(STATIC_CACHE_FILE) or {}
+        results = self._static_from_cache(cache) if use_cache else {}
+        pending = {name: probe for name, probe in probes.items() if name not in results}
+        # A fresh GPU probe reports free VRAM itself; cached GPUs need it queried live
+        if "gpus" in results and any(gpu.vram_gb > 0 for gpu in results["gpus"]):
+            pending["free_vram"] = self.get_free_vram_gb
+        timings = {name: 0.0 for name in results}
+
+        # Daemon threads, not a pool: a hung probe (e.g. nvidia-smi) must not delay interpreter exit
+        outcomes = {name: {} for name in pending}
+        done = {name: threading.Event() for name in pending}
+        for name, probe in pending.items():
+            threading.Thread(target=self._run_probe, args=(probe, outcomes[name], done[name]),
+                             name=f"probe-{name}", daemon=True).start()
+        for name in pending:
+            remaining = max(0.0, PROBE_TIMEOUTS[name] - (time.perf_counter() - start))
+            if not done[name].wait(remaining):
+                results[name] = self._probe_failed(name, f"timed out after {PROBE_TIMEOUTS[name]:g}s")
+                timings[name] = PROBE_TIMEOUTS[name]
+            elif "error" in outcomes[name]:
+                results[name] = self._probe_failed(name, str(outcomes[name]["error"]))
+                timings[name] = time.perf_counter() - start
+            else:
+                results[name], timings[name] = outcomes[name]["result"]
+
+        if any(name in pending for name in STATIC_PROBES):
+            self._save_static_cache(results, cache)
+
+        gpus = results["gpus"] or self._probe_failed("gpus", "no GPU information")
+        free_vram = results.pop("free_vram", None)
+        if free_vram:
+            gpus = [replace(gpu, free_vram_gb=free_vram.get(gpu.index)) for gpu in gpus]
         return {
-            "cpu": self.get_cpu(),
-            "gpu": self.get_gpu(),
-            "ram": self.get_ram(),
-            "storage": self.get_storage()
-        }
\ No newline at end of file
+            "cpu": self.apply_live_limits(results["cpu"]),
+            "gpu": gpus[0],
+            "gpus": gpus,
+            "ram": results["ram"],
+            "storage": results["storage"],
+            "probe_timings": {**timings, "total": time.perf_counter() - start},
+            "cached_probes": sorted(set(probes) - set(pending))
+        }
+
+    @classmethod
+    def _run_probe(cls, probe: Callable, outcome: Dict, done: threading.Event):
+        """Thread body: store the timed result or the exception, then signal completion"""
+        try:
+            outcome["result"] = cls._timed(probe)
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    @staticmethod
+    def _timed(probe: Callable):
+        start = time.perf_counter()
+        with span(f"probe.{probe.__name__}"):
+            result = probe()
+        return result, time.perf_counter() - start
+
+    @staticmethod
+    def _probe_failed(name: str, reason: str):
+        """Placeholder result for a probe that failed or timed out, shaped like the platform fallbacks"""
+        if name == "cpu":
+            return CPUInfo(name="Unknown", physical_cores=0, logical_cores=0, clock_speed_ghz=0.0,
+                           error=f"Failed to retrieve CPU info: {reason}")
+        if name == "gpus":
+            return [GPUInfo(name="Unknown", vram_gb=0.0, error=f"Failed to retrieve GPU info: {reason}")]
+        if name == "free_vram":
+            return None  # Cached GPUs then plan with their total VRAM
+        if name == "ram":
+            return RAMInfo(total_gb=0.0, error=f"Failed to retrieve RAM info: {reason}")
+        return StorageInfo(total_gb=0.0, error=f"Failed to retrieve storage info: {reason}")
+
+    @staticmethod
+    def _static_payload(results: Dict) -> Optional[Dict]:
+        """What the cache stores for these probe results; None if they must not be cached"""
+        cpu = results.get("cpu")
+        gpus = results.get("gpus") or []
+        # Never cache failures, so the next run probes again
+        if not cpu or cpu.error or any(gpu.error for gpu in gpus):
+            return None
+        return {
+            "version": STATIC_CACHE_VERSION,
+            "host_key": host_key(),
+            "cpu": asdict(cpu),
+            # Only identity: free VRAM is live and queried on every call
+            "gpus": [{"name": gpu.name, "vram_gb": gpu.vram_gb, "index": gpu.index} for gpu in gpus],
+        }
+
+    def _static_from_cache(self, cache: Dict) -> Dict:
+        if cache.get("version") != STATIC_CACHE_VERSION or cache.get("host_key") != host_key():
+            return {}
+        try:
+            results = {}
+            if cache.get("cpu"):
+                results["cpu"] = CPUInfo(**cache["cpu"])
+            if cache.get("gpus"):
+                results["gpus"] = [GPUInfo(**gpu) for gpu in cache["gpus"]]
+            return results
+        except TypeError:
+            return {}  # Written by an incompatible version
+
+    def _save_static_cache(self, results: Dict, cache: Dict):
+        payload = self._static_payload(results)
+        if payload is None or payload == cache:
+            return
+        try:
+            save_json_cache(STATIC_CACHE_FILE, payload)
+        except OSError:
+            pass  # A read-only home directory only costs the next run its speedup
@@ -0,0 +1,213 @@
+import math
+from itertools import combinations
+from typing import List, Optional, Tuple
+from chooseAI.models.cpu import CPUInfo
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.models.memory_footprint import MemoryFootprint
+from chooseAI.models.throughput import HardwareRates, OffloadPlan, ThroughputEstimate
+from chooseAI.memory_estimator import GIB, estimate_architecture
+from chooseAI.runtime_tuning import node_physical_cores
+
+# Rough memory bandwidth (GB/s) of discrete GPUs by VRAM class, e.g. 8 GB ~ RTX 3060 Ti / 4060 Ti
+GPU_BANDWIDTH_BY_VRAM = [
+    (4, 120.0),
+    (8, 300.0),
+    (12, 400.0),
+    (16, 500.0),
+    (24, 900.0),
+    (48, 1000.0),
+]
+GPU_BANDWIDTH_LARGE = 2000.0
+# Consumer GPUs offer roughly 50 fp16 tensor GFLOPS per GB/s of bandwidth
+GPU_GFLOPS_PER_GB_S = 50.0
+
+# Achievable fraction of peak bandwidth / compute in llama.cpp-style kernels
+BANDWIDTH_EFFICIENCY = 0.7
+COMPUTE_EFFICIENCY = 0.5
+
+# fp32 FLOPs per cycle per core by widest SIMD extension (two FMA pipes); 32 (AVX2) when unknown
+CPU_FLOPS_PER_CYCLE = [
+    ("AVX-512", 64),
+    ("SVE", 32),
+    ("AVX2", 32),
+    ("AVX", 16),
+    ("NEON", 16),
+]
+CPU_FLOPS_PER_CYCLE_DEFAULT = 32
+# Prompt-eval speedup of quantized matmuls from int8 dot-product / tile instructions
+INT8_SPEEDUPS = [
+    ("AMX", 3.0),
+    ("AVX-512 VNNI", 1.5),
+    ("AVX-VNNI", 1.3),
+    ("DOTPROD", 1.3),
+]
+# Share of local bandwidth kept when threads of one model span several NUMA nodes
+NUMA_SPAN_EFFICIENCY = 0.8
+
+# Per-token cost of handing activations from one device to the next in a layer split
+DEVICE_HOP_S = 0.0003
+# Splits are searched exhaustively over subsets of at most this many (fastest) GPUs
+MAX_SPLIT_GPUS = 8
+
+
+def has_discrete_gpu(gpu_info: GPUInfo) -> bool:
+    return gpu_info.vram_gb > 0 and "No GPU" not in gpu_info.name
+
+
+def estimate_hardware_rates(cpu_info: CPUInfo, numa_node: Optional[int] = None) -> HardwareRates:
+    """
+    Estimate CPU memory bandwidth and compute from static specs when nothing was measured
+
+    Args:
+        cpu_info: CPU with its core counts, limits and NUMA layout
+        numa_node: Node the runtime is pinned to; None when threads span every node
+    """
+    # Inside a container only the cores allowed by the CPU quota and affinity mask count
+    cores = cpu_info.effective_cores or cpu_info.physical_cores or 1
+    if numa_node is not None:
+        cores = min(cores, node_physical_cores(cpu_info, numa_node))
+    clock_ghz = cpu_info.clock_speed_ghz or 2.0
+
+    # Desktop dual-channel DDR4/DDR5 sits around 40-80 GB/s, servers scale with channels (and cores)
+    cpu_bandwidth = min(max(8.0 * cores, 20.0), 300.0)
+    # A pinned runtime reads only local memory; one spanning nodes pays for remote reads
+    if numa_node is None and cpu_info.numa_nodes > 1:
+        cpu_bandwidth *= NUMA_SPAN_EFFICIENCY
+
+    # Two FMA units of the widest vector extension, e.g. AVX2 -> 32 fp32 FLOPs per cycle
+    features = set(cpu_info.isa_features)
+    flops_per_cycle = next(
+        (flops for feature, flops in CPU_FLOPS_PER_CYCLE if feature in features), CPU_FLOPS_PER_CYCLE_DEFAULT
+    )
+    int8_speedup = next((speedup for feature, speedup in INT8_SPEEDUPS if feature in features), 1.0)
+    cpu_gflops = cores * clock_ghz * flops_per_cycle * int8_speedup
+
+    return HardwareRates(
+        cpu_bandwidth_gb_s=cpu_bandwidth,
+        cpu_gflops=cpu_gflops
+    )
+
+
+def estimate_gpu_bandwidth(gpu_info: GPUInfo) -> float:
+    """Memory bandwidth (GB/s) of a GPU, guessed from its VRAM class"""
+    for vram_limit, bandwidth in GPU_BANDWIDTH_BY_VRAM:
+        if gpu_info.vram_gb <= vram_limit:
+            return bandwidth
+    return GPU_BANDWIDTH_LARGE
+
+
+def usable_vram_gb(gpu_info: GPUInfo) -> float:
+    """VRAM a new model can use: free VRAM when known, otherwise the total"""
+    if gpu_info.free_vram_gb is not None:
+        return min(gpu_info.free_vram_gb, gpu_info.vram_gb)
+    return gpu_info.vram_gb
+
+
+def gpu_layer_capacity(footprint: MemoryFootprint, gpus: Optional[List[GPUInfo]]) -> Tuple[int, int, float]:
+    """(model layers, layers the GPUs can hold together, GiB per layer)"""
+    layers = max(1, round(estimate_architecture(footprint.parameters_b)[0]))
+    layer_gb = (footprint.weights_gb + footprint.kv_cache_gb) / layers
+    capacity = sum(
+        math.floor(max(0.0, usable_vram_gb(g) - footprint.overhead_gb) / layer_gb)
+        for g in (gpus or []) if has_discrete_gpu(g)
+    )
+    return layers, min(capacity, layers), layer_gb
+
+
+def _split_cost(footprint: MemoryFootprint, rates: HardwareRates, devices: List[Tuple[GPUInfo, int]],
+                cpu_layers: int, layers: int) -> Tuple[float, float]:
+    """Per-token (generation seconds, prompt-eval seconds) of a layer split; devices run one after another"""
+    layer_gb = footprint.weights_gb * GIB / 1e9 / layers
+    layer_gflops = 2 * footprint.parameters_b / layers
+
+    generation_s = cpu_layers * layer_gb / (rates.cpu_bandwidth_gb_s * BANDWIDTH_EFFICIENCY)
+    prompt_s = cpu_layers * layer_gflops / (rates.cpu_gflops * COMPUTE_EFFICIENCY)
+    for gpu, gpu_layers in devices:
+        bandwidth = estimate_gpu_bandwidth(gpu)
+        generation_s += gpu_layers * layer_gb / (bandwidth * BANDWIDTH_EFFICIENCY)
+        prompt_s += gpu_layers * layer_gflops / (bandwidth * GPU_GFLOPS_PER_GB_S * COMPUTE_EFFICIENCY)
+
+    hops = max(0, len(devices) + (1 if cpu_layers else 0) - 1)
+    return generation_s + hops * DEVICE_HOP_S, prompt_s
+
+
+def plan_offload(footprint: MemoryFootprint, rates: HardwareRates,
+                 gpus: Optional[List[GPUInfo]] = None) -> Tuple[OffloadPlan, float, float]:
+    """
+    Find the layer split across GPUs and CPU with the highest generation speed
+
+    Every used GPU holds whole layers (weights plus their share of the KV cache) after
+    reserving runtime buffers; layers that fit nowhere stay in system RAM. Within a set of
+    GPUs the fastest ones are filled first, and every subset of GPUs is tried, since a slow
+    or nearly full card can cost more in hand-offs than it saves.
+
+    Args:
+        footprint: Memory footprint of the model
+        rates: CPU bandwidth and compute
+        gpus: GPUs of the machine (entries without VRAM are ignored)
+
+    Returns:
+        (plan, generation seconds per token, prompt-eval seconds per token)
+    """
+    layers, _, layer_gb = gpu_layer_capacity(footprint, None)
+    candidates = sorted(
+        (g for g in (gpus or []) if has_discrete_gpu(g)), key=estimate_gpu_bandwidth, reverse=True
+    )[:MAX_SPLIT_GPUS]
+
+    best_plan = OffloadPlan(total_layers=layers, cpu_layers=layers, cpu_gb=footprint.total_gb)
+    best_generation, best_prompt = _split_cost(footprint, rates, [], layers, layers)
+
+    for count in range(1, len(candidates) + 1):
+        for subset in combinations(candidates, count):
+            remaining = layers
+            devices = []
+            for gpu in subset:
+                capacity = math.floor(max(0.0, usable_vram_gb(gpu) - footprint.overhead_gb) / layer_gb)
+                assigned = min(capacity, remaining)
+                if assigned > 0:
+                    devices.append((gpu, assigned))
+                    remaining -= assigned
+            if len(devices) < count:
+                continue  # A GPU in this subset holds nothing; a smaller subset covers it
+
+            generation_s, prompt_s = _split_cost(footprint, rates, devices, remaining, layers)
+            if generation_s < best_generation:
+                best_generation, best_prompt = generation_s, prompt_s
+                best_plan = OffloadPlan(
+                    total_layers=layers,
+                    gpu_layers=[n for _, n in devices],
+                    gpu_indices=[gpu.index for gpu, _ in devices],
+                    cpu_layers=remaining,
+                    cpu_gb=remaining * layer_gb + (footprint.overhead_gb if remaining else 0.0)
+                )
+
+    if candidates:
+        ideal_generation, _ = _split_cost(footprint, rates, [(candidates[0], layers)], 0, layers)
+        best_plan.speed_penalty = max(0.0, 1.0 - ideal_generation / best_generation)
+
+    return best_plan, best_generation, best_prompt
+
+
+def predict_throughput(footprint: MemoryFootprint, rates: HardwareRates,
+                       gpus: Optional[List[GPUInfo]] = None) -> ThroughputEstimate:
+    """
+    Predict prompt-eval and generation speed of a model under its best layer split
+
+    Generation reads every weight once per token, so it is bound by memory bandwidth;
+    prompt evaluation batches tokens and is bound by compute (2 FLOPs per parameter).
+
+    Args:
+        footprint: Memory footprint of the model
+        rates: CPU bandwidth and compute
+        gpus: GPUs available for offloading
+
+    Returns:
+        ThroughputEstimate in tokens per second, including the offload plan
+    """
+    plan, generation_s, prompt_s = plan_offload(footprint, rates, gpus)
+    return ThroughputEstimate(
+        prompt_tokens_per_sec=1.0 / prompt_s if prompt_s > 0 else 0.0,
+        generation_tokens_per_sec=1.0 / generation_s if generation_s > 0 else 0.0,
+        gpu_fraction=plan.gpu_fraction,
+        offload=plan
+    )
@@ -0,0 +1,124 @@
+import cProfile
+import functools
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class Tracer:
+    """
+    Collects timing spans and writes them in Chrome trace format (chrome://tracing, Perfetto)
+
+    Disabled by default, in which case span() costs next to nothing. With profile_stages,
+    every top-level span of the main thread also runs under cProfile, so the slowest stage
+    can be dumped for pstats; profiling slows the traced code down noticeably.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.profile_stages = False
+        self.events: List[Dict] = []
+        self.stage_profiles: Dict[str, List] = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, profile_stages: bool = False):
+        self.enabled = True
+        self.profile_stages = profile_stages
+        self.events = []
+        self.stage_profiles = {}
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, **args):
+        if not self.enabled:
+            yield
+            return
+
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        profiler = None
+        if self.profile_stages and depth == 0 and threading.current_thread() is threading.main_thread():
+            profiler = cProfile.Profile()
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+            self._local.depth = depth
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": duration * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {k: str(v) for k, v in args.items()},
+            }
+            with self._lock:
+                self.events.append(event)
+                if profiler:
+                    self.stage_profiles.setdefault(name, []).append((profiler, duration))
+
+    def stage_totals(self) -> Dict[str, float]:
+        """Seconds spent per span name, summed over calls"""
+        totals: Dict[str, float] = {}
+        for event in self.events:
+            totals[event["name"]] = totals.get(event["name"], 0.0) + event["dur"] / 1e6
+        return totals
+
+    def write_chrome_trace(self, path: str):
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def write_hot_stage_stats(self, path: str) -> Optional[str]:
+        """Dump cProfile stats of the top-level stage that took longest; returns its name"""
+        if not self.stage_profiles:
+            return None
+        name = max(self.stage_profiles, key=lambda n: sum(d for _, d in self.stage_profiles[n]))
+        profilers = [p for p, _ in self.stage_profiles[name]]
+        stats = pstats.Stats(profilers[0])
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+        stats.dump_stats(path)
+        return name
+
+
+tracer = Tracer()
+
+
+def span(name: str, **args):
+    """Time a block as a span of the process-wide tracer"""
+    return tracer.span(name, **args)
+
+
+def traced(func):
+    """Record every call of a function or method as a span named after it"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracer.span(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def write_profile(trace_path: Optional[str], stats_path: Optional[str] = None):
+    """Write the requested trace/pstats files and print where the time went"""
+    if trace_path:
+        tracer.write_chrome_trace(trace_path)
+        print(f"\n⏱️  Trace written to {trace_path} (open in chrome://tracing or ui.perfetto.dev)")
+    if stats_path:
+        hot_stage = tracer.write_hot_stage_stats(stats_path)
+        if hot_stage:
+            print(f"   cProfile stats of the slowest stage ({hot_stage}) written to {stats_path}")
+    for name, seconds in sorted(tracer.stage_totals().items(), key=lambda item: -item[1])[:10]:
+        print(f"   {name:<32} {seconds * 1000:8.1f} ms")
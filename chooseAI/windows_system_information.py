@@ -1,10 +1,10 @@
 # windows_system_information.py
 import platform
 import psutil
-import cpuinfo
-import GPUtil
 import shutil
 import sys
+from typing import Dict, List, Optional
+from chooseAI.gpu_memory import nvidia_free_vram_gb
 from chooseAI.systemInfo import SystemInformation
 from chooseAI.models.cpu import CPUInfo
 from chooseAI.models.gpu import GPUInfo
@@ -15,7 +15,10 @@ from chooseAI.models.storage import StorageInfo
 class WindowsSystemInformation(SystemInformation):
     def get_cpu(self) -> CPUInfo:
         try:
-            name = platform.processor() or cpuinfo.get_cpu_info().get("brand_raw", "Unknown")
+            name = platform.processor()
+            if not name:
+                import cpuinfo  # Slow to import, so only when the platform gives no name
+                name = cpuinfo.get_cpu_info().get("brand_raw", "Unknown")
             physical_cores = psutil.cpu_count(logical=False)
             logical_cores = psutil.cpu_count(logical=True)
             clock_speed_ghz = round(psutil.cpu_freq().max / 1000, 2) if psutil.cpu_freq() else 0.0
@@ -36,25 +39,36 @@ class WindowsSystemInformation(SystemInformation):
             )
 
     def get_gpu(self) -> GPUInfo:
+        return self.get_gpus()[0]
+
+    def get_gpus(self) -> List[GPUInfo]:
         try:
+            import GPUtil  # Slow to import; skipped entirely when GPUs come from the cache
             gpus = GPUtil.getGPUs()
             if gpus:
-                gpu = gpus[0]
-                return GPUInfo(
-                    name=gpu.name,
-                    vram_gb=round(gpu.memoryTotal / 1024, 2)
-                )
+                return [
+                    GPUInfo(
+                        name=gpu.name,
+                        vram_gb=round(gpu.memoryTotal / 1024, 2),
+                        free_vram_gb=round(gpu.memoryFree / 1024, 2),
+                        index=i
+                    )
+                    for i, gpu in enumerate(gpus)
+                ]
             else:
-                return GPUInfo(
+                return [GPUInfo(
                     name="No GPU detected",
                     vram_gb=0.0
-                )
+                )]
         except Exception as e:
-            return GPUInfo(
+            return [GPUInfo(
                 name="Unknown",
                 vram_gb=0.0,
                 error=f"Failed to retrieve GPU info: {str(e)}"
-            )
+            )]
+
+    def get_free_vram_gb(self) -> Optional[Dict[int, float]]:
+        return nvidia_free_vram_gb()
 
     def get_ram(self) -> RAMInfo:
         try:
@@ -1,11 +1,90 @@
-import platform
-import os
-from typing import Optional
-from chooseAI.recommendation_engine import ModelRecommendationEngine
-from chooseAI.parse_ollama import fetch_models, get_all_models
-from chooseAI.systemInfo import SystemInformation
-from chooseAI.chooseAI import  ChooseAI
+import argparse
+from chooseAI.chooseAI import ChooseAI
+from chooseAI.tracing import tracer, write_profile
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="ChooseAI - AI Model Recommendation System")
+    parser.add_argument("--min-tps", type=float, default=None,
+                        help="Only recommend models expected to generate at least this many tokens/sec")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Measure memory bandwidth, compute and disk read speed instead of estimating them")
+    parser.add_argument("--refresh-hardware", action="store_true",
+                        help="Ignore cached CPU/GPU facts and probe everything again")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Recompute recommendations instead of reusing cached rankings")
+    parser.add_argument("--profile", metavar="TRACE_JSON",
+                        help="Write a Chrome trace of every pipeline stage to this file")
+    parser.add_argument("--profile-stats", metavar="PSTATS",
+                        help="Also run top-level stages under cProfile and dump the slowest one here")
+    subparsers = parser.add_subparsers(dest="command")
+
+    search_parser = subparsers.add_parser("search", help="Search the model catalog")
+    search_parser.add_argument("query", nargs="+", help='e.g. "find small code models supporting tools"')
+    search_parser.add_argument("--limit", type=int, default=10, help="Maximum number of results")
+
+    calibrate_parser = subparsers.add_parser("calibrate", help="Measure real speed of installed models via Ollama")
+    calibrate_parser.add_argument("models", nargs="*", help="Installed models to measure (default: all)")
+    calibrate_parser.add_argument("--warm", action="store_true", help="Do not unload models before measuring")
+
+    serve_parser = subparsers.add_parser("serve", help="Serve recommendations as JSON over HTTP")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--catalog-refresh-hours", type=float, default=6.0,
+                              help="How often to re-scrape the catalog in the background")
+
+    fleet_parser = subparsers.add_parser("fleet", help="Recommend models for many host profiles at once")
+    fleet_parser.add_argument("input", help="JSONL or CSV host profiles ('-' for stdin)")
+    fleet_parser.add_argument("--output", default="-", help="JSONL or CSV results file ('-' for stdout)")
+    fleet_parser.add_argument("--input-format", choices=["jsonl", "csv"], help="Default: from the file extension")
+    fleet_parser.add_argument("--output-format", choices=["jsonl", "csv"], help="Default: from the file extension")
+    fleet_parser.add_argument("--types", nargs="+", help="Model types to rank for (default: all categories)")
+    fleet_parser.add_argument("--limit", type=int, default=5, help="Recommendations per type")
+    fleet_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    capacity_parser = subparsers.add_parser("capacity", help="Plan parallel requests and loaded models for a request rate")
+    capacity_parser.add_argument("--rps", type=float, required=True, help="Target requests per second")
+    capacity_parser.add_argument("--context", type=int, default=None, help="Context length per request (default: 4096)")
+    capacity_parser.add_argument("--prompt-tokens", type=int, default=None,
+                                 help="Average prompt length (default: half the context)")
+    capacity_parser.add_argument("--output-tokens", type=int, default=256, help="Average generated tokens per request")
+    capacity_parser.add_argument("--max-latency", type=float, default=None,
+                                 help="Slowest acceptable request time in seconds")
+    capacity_parser.add_argument("--type", default="general llm", help="Model type to plan for")
+    capacity_parser.add_argument("--limit", type=int, default=5, help="Candidate models to plan")
+
+    return parser
+
 
 if __name__ == "__main__":
-    choose_ai = ChooseAI()
-    choose_ai.run()
+    args = build_parser().parse_args()
+    if args.profile or args.profile_stats:
+        tracer.enable(profile_stages=bool(args.profile_stats))
+
+    try:
+        choose_ai = ChooseAI(
+            min_tokens_per_sec=args.min_tps,
+            run_benchmark=args.benchmark,
+            refresh_hardware=args.refresh_hardware,
+            use_cache=not args.no_cache
+        )
+
+        if args.command == "search":
+            choose_ai.search(" ".join(args.query), max_results=args.limit)
+        elif args.command == "calibrate":
+            choose_ai.calibrate(args.models, cold=not args.warm)
+        elif args.command == "fleet":
+            choose_ai.fleet(args.input, args.output, categories=args.types, max_results=args.limit,
+                            workers=args.workers, input_format=args.input_format, output_format=args.output_format)
+        elif args.command == "capacity":
+            choose_ai.capacity(args.rps, category_type=args.type, context_length=args.context,
+                               prompt_tokens=args.prompt_tokens, output_tokens=args.output_tokens,
+                               max_latency_s=args.max_latency, max_results=args.limit)
+        elif args.command == "serve":
+            from chooseAI.daemon import run_daemon
+            run_daemon(choose_ai, host=args.host, port=args.port, catalog_refresh_s=args.catalog_refresh_hours * 3600)
+        else:
+            choose_ai.run()
+    finally:
+        if tracer.enabled:
+            write_profile(args.profile, args.profile_stats)
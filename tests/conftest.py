@@ -0,0 +1,17 @@
+import pytest
+from chooseAI.ollama_client import OllamaClient
+from tests.fake_ollama import FakeOllama
+
+
+@pytest.fixture
+def fake_ollama():
+    server = FakeOllama().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def ollama_client(fake_ollama):
+    client = OllamaClient(host=fake_ollama.url, timeout=2.0)
+    yield client
+    client.close()
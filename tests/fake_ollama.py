@@ -0,0 +1,101 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+
+class FakeOllama:
+    """Stand-in for the Ollama REST API on an ephemeral localhost port"""
+
+    def __init__(self):
+        self.models: List[Dict] = []
+        self.running: List[Dict] = []
+        # Returned by /api/generate for a prompt; keyed by model name, "*" for any model
+        self.generate_responses: Dict[str, Dict] = {}
+        # Path -> (status, body) to fail with instead of answering
+        self.errors: Dict[str, Tuple[int, str]] = {}
+        # (method, path, parsed JSON body) of every request, in order
+        self.requests: List[Tuple[str, str, Optional[Dict]]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._stopped = False
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_model(self, name: str, size: int, parameter_size: str = None, quantization: str = "Q4_K_M",
+                  loaded: bool = False, size_vram: int = 0):
+        self.models.append({
+            "name": name,
+            "model": name,
+            "size": size,
+            "details": {"parameter_size": parameter_size, "quantization_level": quantization},
+        })
+        if loaded:
+            self.running.append({"name": name, "model": name, "size": size, "size_vram": size_vram})
+
+    def generate_calls(self, model: str = None) -> List[Dict]:
+        return [body for method, path, body in self.requests
+                if path == "/api/generate" and (model is None or body.get("model") == model)]
+
+    def start(self) -> "FakeOllama":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._stopped:
+            return
+        self._stopped = True
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body):
+                data = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _answer(self, body: Optional[Dict]):
+                fake.requests.append((self.command, self.path, body))
+                if self.path in fake.errors:
+                    self._send(*fake.errors[self.path])
+                elif self.path == "/api/tags":
+                    self._send(200, {"models": fake.models})
+                elif self.path == "/api/ps":
+                    self._send(200, {"models": fake.running})
+                elif self.path == "/api/generate":
+                    self._send(200, self._generate(body or {}))
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def _generate(self, body: Dict) -> Dict:
+                model = body.get("model")
+                # A request with keep_alive=0 and no prompt only unloads the model
+                if body.get("keep_alive") == 0 and "prompt" not in body:
+                    fake.running = [m for m in fake.running if m["name"] != model]
+                    return {"model": model, "done": True, "done_reason": "unload"}
+                if not any(m["name"] == model for m in fake.running):
+                    size = next((m["size"] for m in fake.models if m["name"] == model), 0)
+                    fake.running.append({"name": model, "model": model, "size": size, "size_vram": 0})
+                response = fake.generate_responses.get(model) or fake.generate_responses.get("*") or {}
+                return {"model": model, "response": "", "done": True, **response}
+
+            def do_GET(self):
+                self._answer(None)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self._answer(json.loads(self.rfile.read(length) or b"{}"))
+
+        return Handler
@@ -0,0 +1,17 @@
+from benchmarks.bench_scaling import compare
+
+
+def result(load_ms, load_mb, score_ms=50.0, score_mb=20.0):
+    return {"models": 1000, "load_ms": load_ms, "load_mb": load_mb,
+            "vectorized": {"score_ms": score_ms, "score_mb": score_mb}, "scalar": None}
+
+
+def test_compare_ignores_noise_and_reports_real_regressions():
+    baseline = {"results": [result(load_ms=2.0, load_mb=0.2)]}
+
+    # Sub-10 ms timings and sub-1 MB memory growth are noise, even at +200%
+    assert compare([result(load_ms=6.0, load_mb=0.9)], baseline, 0.2) == []
+    assert compare([result(load_ms=6.0, load_mb=0.2, score_mb=20.9)], baseline, 0.02) == []
+
+    regressions = compare([result(load_ms=2.0, load_mb=1.5, score_ms=80.0)], baseline, 0.2)
+    assert [r.split(":")[0] for r in regressions] == ["1,000 models load_mb", "1,000 models vectorized.score_ms"]
@@ -0,0 +1,14 @@
+import os
+import shutil
+from benchmarks.bench_startup import DEFAULT_CATALOG_DIR, FIRST_RECOMMENDATION_SNIPPET, time_snippet
+from chooseAI.parse_ollama import DB_FILE
+
+
+def test_first_recommendation_leaves_catalog_untouched(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    shutil.copy(os.path.join(DEFAULT_CATALOG_DIR, DB_FILE), tmp_path / DB_FILE)
+    before = (tmp_path / DB_FILE).read_bytes()
+
+    assert time_snippet(FIRST_RECOMMENDATION_SNIPPET, str(tmp_path)) > 0
+
+    assert (tmp_path / DB_FILE).read_bytes() == before
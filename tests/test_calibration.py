@@ -0,0 +1,148 @@
+import sqlite3
+import pytest
+from chooseAI.calibration import CALIBRATION_PROMPT, calibrate_models, load_measurements
+from chooseAI.inventory import ModelInventory, matches_catalog_model
+
+TIMINGS = {
+    "load_duration": 2_500_000_000,
+    "prompt_eval_count": 40,
+    "prompt_eval_duration": 200_000_000,
+    "eval_count": 128,
+    "eval_duration": 4_000_000_000,
+}
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize("name, parameter_size, model_name, model_size, expected", [
+    ("gemma3:4b", "4.3B", "gemma3", "4b", True),
+    ("gemma3:latest", "4.3B", "gemma3", "4b", True),
+    ("gemma3:12b", "12.2B", "gemma3", "4b", False),
+    ("gemma3n:4b", "4.3B", "gemma3", "4b", False),
+    ("mixtral:8x7b", "46.7B", "mixtral", "8x7b", True),
+    ("gemma3:4b", "4.3B", "gemma3", "unknown", False),
+])
+def test_matches_catalog_model(name, parameter_size, model_name, model_size, expected):
+    assert matches_catalog_model(name, parameter_size, model_name, model_size) is expected
+
+
+def test_inventory_find_prefers_loaded_variant(fake_ollama, ollama_client):
+    fake_ollama.add_model("llama3.1:8b-instruct-q8_0", 8_500_000_000, "8.0B", "Q8_0")
+    fake_ollama.add_model("llama3.1:8b", 4_900_000_000, "8.0B", loaded=True)
+    fake_ollama.add_model("llama3.1:70b", 43_000_000_000, "70.6B")
+
+    inventory = ModelInventory(ollama_client).refresh()
+
+    assert inventory.find("llama3.1", "8b").name == "llama3.1:8b"
+    assert inventory.find("llama3.1", "70b").name == "llama3.1:70b"
+    assert inventory.find("llama3.1", "405b") is None
+    assert inventory.find("qwen3", "8b") is None
+
+
+def test_calibration_results_are_persisted(fake_ollama, ollama_client, conn):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B")
+    fake_ollama.generate_responses["*"] = TIMINGS
+    inventory = ModelInventory(ollama_client).refresh()
+
+    results = calibrate_models(inventory.installed(), "host-a", client=ollama_client, conn=conn)
+
+    assert [r.error for r in results] == [None]
+    prompt = [call for call in fake_ollama.generate_calls() if "prompt" in call]
+    assert prompt[0]["prompt"] == CALIBRATION_PROMPT
+
+    stored = load_measurements("host-a", conn=conn)["gemma3:4b"]
+    assert stored.load_s == pytest.approx(2.5)
+    assert stored.prompt_tokens_per_sec == pytest.approx(200.0)
+    assert stored.generation_tokens_per_sec == pytest.approx(32.0)
+    assert stored.parameter_size == "4.3B"
+    assert load_measurements("host-b", conn=conn) == {}
+
+
+def test_cold_calibration_unloads_after_probe(fake_ollama, ollama_client, conn):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B")
+    fake_ollama.generate_responses["*"] = TIMINGS
+    inventory = ModelInventory(ollama_client).refresh()
+
+    calibrate_models(inventory.installed(), "host-a", client=ollama_client, conn=conn)
+
+    calls = fake_ollama.generate_calls("gemma3:4b")
+    assert [("prompt" in c, c.get("keep_alive")) for c in calls] == [(False, 0), (True, None), (False, 0)]
+    assert fake_ollama.running == []
+
+
+def test_previously_loaded_model_stays_loaded(fake_ollama, ollama_client, conn):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B", loaded=True)
+    fake_ollama.generate_responses["*"] = TIMINGS
+    inventory = ModelInventory(ollama_client).refresh()
+
+    calibrate_models(inventory.installed(), "host-a", client=ollama_client, conn=conn)
+
+    calls = fake_ollama.generate_calls("gemma3:4b")
+    assert [("prompt" in c) for c in calls] == [False, True]
+    assert [m["name"] for m in fake_ollama.running] == ["gemma3:4b"]
+
+
+def test_warm_calibration_never_unloads(fake_ollama, ollama_client, conn):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B")
+    fake_ollama.generate_responses["*"] = TIMINGS
+    inventory = ModelInventory(ollama_client).refresh()
+
+    calibrate_models(inventory.installed(), "host-a", client=ollama_client, conn=conn, cold=False)
+
+    assert all("prompt" in c for c in fake_ollama.generate_calls())
+
+
+def test_failed_probe_is_reported_and_not_stored(fake_ollama, ollama_client, conn):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B")
+    inventory = ModelInventory(ollama_client).refresh()
+    fake_ollama.errors["/api/generate"] = (500, '{"error": "model failed to load"}')
+
+    results = calibrate_models(inventory.installed(), "host-a", client=ollama_client, conn=conn)
+
+    assert results[0].error.startswith("Calibration failed")
+    assert load_measurements("host-a", conn=conn) == {}
+
+
+def test_fresh_host_scrapes_catalog_after_calibration_lookup(tmp_path, monkeypatch, capsys, fake_ollama):
+    from benchmarks.bench_scoring import reference_system_info
+    from benchmarks.synthetic_catalog import make_synthetic_catalog, write_catalog_db
+    from chooseAI import chooseAI as cli
+    from chooseAI.parse_ollama import DB_FILE, init_db
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OLLAMA_HOST", fake_ollama.url)
+    scrapes = []
+
+    def fake_scrape():
+        scrapes.append(True)
+        write_catalog_db(make_synthetic_catalog(50, seed=4), init_db())
+
+    monkeypatch.setattr(cli, "fetch_models", fake_scrape)
+    app = cli.ChooseAI()
+    monkeypatch.setattr(app, "fetch_system_info", lambda: setattr(app, "system_info", reference_system_info()))
+
+    assert load_measurements("host-a") == {}
+    assert not (tmp_path / DB_FILE).exists()
+
+    app.run()
+
+    assert scrapes == [True]
+    output = capsys.readouterr().out
+    assert "Error loading models" not in output
+    assert "MODEL RECOMMENDATIONS - GENERAL/CHAT" in output
+
+
+def test_existing_file_without_catalog_is_scraped(tmp_path, monkeypatch):
+    from chooseAI.calibration import init_calibration_db
+    from chooseAI.parse_ollama import catalog_exists, init_db
+
+    monkeypatch.chdir(tmp_path)
+    init_calibration_db().close()  # What `main.py calibrate` leaves on a fresh host
+    assert not catalog_exists()
+    init_db().close()
+    assert catalog_exists()
@@ -0,0 +1,76 @@
+import math
+import pytest
+from chooseAI.capacity import max_loaded_copies, plan_capacity
+from chooseAI.memory_estimator import estimate_memory_footprint
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.models.throughput import HardwareRates
+from chooseAI.throughput import plan_offload
+
+DESKTOP = HardwareRates(cpu_bandwidth_gb_s=60.0, cpu_gflops=1000.0)
+RTX_4090 = [GPUInfo(name="RTX 4090", vram_gb=24.0, free_vram_gb=22.0)]
+RTX_4060 = [GPUInfo(name="RTX 4060", vram_gb=8.0)]
+
+
+def plan(request_rate, gpus=RTX_4090, usable_ram_gb=28.0, max_latency_s=None):
+    return plan_capacity(8.0, DESKTOP, gpus, usable_ram_gb, request_rate, context_length=4096,
+                         prompt_tokens=512, output_tokens=256, max_latency_s=max_latency_s)
+
+
+def test_slots_grow_with_target_rate():
+    low, higher = plan(0.05), plan(0.5)
+
+    assert (low.num_parallel, low.limited_by, low.meets_target) == (1, "target", True)
+    assert higher.num_parallel > low.num_parallel
+    assert higher.meets_target
+    assert higher.memory_gb > low.memory_gb
+    assert higher.aggregate_tokens_per_sec > low.aggregate_tokens_per_sec
+
+
+def test_unreachable_rate_stops_on_compute_and_needs_more_hosts():
+    best = plan(50.0)
+
+    assert best.limited_by == "compute"
+    assert not best.meets_target
+    assert best.hosts_needed == math.ceil(50.0 / best.max_requests_per_sec)
+    assert best.hosts_needed > 1
+
+
+def test_memory_stop_when_kv_cache_pushes_layers_off_the_gpu():
+    best = plan(50.0, gpus=RTX_4060, usable_ram_gb=0.5)
+    one_more = estimate_memory_footprint(8.0, context_length=4096 * (best.num_parallel + 1))
+    spilled, _, _ = plan_offload(one_more, DESKTOP, RTX_4060)
+
+    assert best.limited_by == "memory"
+    assert best.offload.cpu_layers == 0
+    assert spilled.cpu_gb > 0.5
+
+
+def test_latency_stop():
+    single, double = plan(0.05), plan(0.5)
+    limit = (single.latency_s + double.latency_s) / 2
+
+    best = plan(0.5, max_latency_s=limit)
+
+    assert (best.num_parallel, best.limited_by) == (1, "latency")
+    assert best.latency_s <= limit
+    assert plan(0.5, max_latency_s=single.latency_s / 2) is None
+
+
+def test_loaded_models_count_gpu_resident_copies():
+    # One 8B copy takes about 6 GB, so 22 GB of free VRAM holds 3; the 28 GB of RAM adds none
+    best = plan(0.05)
+    assert best.offload.cpu_layers == 0
+    assert best.max_loaded_models == 3
+
+
+def test_loaded_models_bounded_by_ram_on_cpu():
+    footprint = estimate_memory_footprint(8.0)
+    offload, _, _ = plan_offload(footprint, DESKTOP, None)
+
+    assert max_loaded_copies(footprint, offload, None, 28.0) == math.floor(28.0 / footprint.total_gb)
+    assert max_loaded_copies(footprint, offload, None, 1.0) == 1
+
+
+def test_non_positive_rate_is_rejected():
+    with pytest.raises(ValueError):
+        plan(0.0)
@@ -0,0 +1,115 @@
+from collections import namedtuple
+import pytest
+from chooseAI import linux_system_information
+from chooseAI.cgroup_limits import CgroupLimits, parse_proc_cgroup
+from chooseAI.linux_system_information import LinuxSystemInformation
+
+GIB = 1024 ** 3
+V1_UNLIMITED = "9223372036854771712"
+
+
+def write_tree(root, files):
+    for path, content in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content + "\n")
+
+
+def limits(tmp_path, proc_cgroup: str, files) -> CgroupLimits:
+    root = tmp_path / "cgroup"
+    root.mkdir()
+    write_tree(root, files)
+    proc = tmp_path / "proc_cgroup"
+    proc.write_text(proc_cgroup)
+    return CgroupLimits(root=str(root), proc_cgroup=str(proc))
+
+
+def test_parse_proc_cgroup():
+    text = "12:memory:/docker/abc\n4:cpu,cpuacct:/docker/abc\n0::/user.slice\nbroken\n"
+    assert parse_proc_cgroup(text) == {
+        "memory": "/docker/abc", "cpu": "/docker/abc", "cpuacct": "/docker/abc", "": "/user.slice"
+    }
+
+
+def test_v2_limits_take_tightest_ancestor(tmp_path):
+    cgroup = limits(tmp_path, "0::/kubepods/pod1\n", {
+        "cgroup.controllers": "cpu memory",
+        "kubepods/memory.max": str(1 * GIB),
+        "kubepods/cpu.max": "max 100000",
+        "kubepods/pod1/memory.max": str(2 * GIB),
+        "kubepods/pod1/memory.current": str(600 * 1024 ** 2),
+        "kubepods/pod1/memory.stat": "anon 100\ninactive_file 104857600\nactive_file 5",
+        "kubepods/pod1/cpu.max": "150000 100000",
+    })
+
+    assert cgroup.is_v2
+    assert cgroup.memory_limit_bytes() == 1 * GIB
+    assert cgroup.memory_working_set_bytes() == 500 * 1024 ** 2
+    assert cgroup.cpu_quota() == pytest.approx(1.5)
+
+
+def test_v2_unlimited(tmp_path):
+    cgroup = limits(tmp_path, "0::/user.slice\n", {
+        "cgroup.controllers": "cpu memory",
+        "user.slice/memory.max": "max",
+        "user.slice/cpu.max": "max 100000",
+    })
+
+    assert cgroup.memory_limit_bytes() is None
+    assert cgroup.cpu_quota() is None
+    assert cgroup.memory_working_set_bytes() is None
+
+
+def test_v1_limits(tmp_path):
+    cgroup = limits(tmp_path, "12:memory:/docker/abc\n4:cpu,cpuacct:/docker/abc\n", {
+        "memory/memory.limit_in_bytes": V1_UNLIMITED,
+        "memory/docker/abc/memory.limit_in_bytes": str(4 * GIB),
+        "memory/docker/abc/memory.usage_in_bytes": str(3 * GIB),
+        "memory/docker/abc/memory.stat": f"cache 10\ntotal_inactive_file {GIB}",
+        "cpu/cpu.cfs_quota_us": "-1",
+        "cpu/cpu.cfs_period_us": "100000",
+        "cpu/docker/abc/cpu.cfs_quota_us": "200000",
+        "cpu/docker/abc/cpu.cfs_period_us": "100000",
+    })
+
+    assert not cgroup.is_v2
+    assert cgroup.memory_limit_bytes() == 4 * GIB
+    assert cgroup.memory_working_set_bytes() == 2 * GIB
+    assert cgroup.cpu_quota() == pytest.approx(2.0)
+
+
+def test_v1_unlimited_sentinel(tmp_path):
+    cgroup = limits(tmp_path, "12:memory:/\n4:cpu,cpuacct:/\n", {
+        "memory/memory.limit_in_bytes": V1_UNLIMITED,
+        "cpu/cpu.cfs_quota_us": "-1",
+        "cpu/cpu.cfs_period_us": "100000",
+    })
+
+    assert cgroup.memory_limit_bytes() is None
+    assert cgroup.cpu_quota() is None
+
+
+VirtualMemory = namedtuple("VirtualMemory", "total available")
+
+
+@pytest.mark.parametrize("limit_gb, expected", [
+    # Limit 8 GiB with 6 GiB working set: 2 GiB left even though the host has 40 GiB free
+    (8, (64.0, 8.0, 8.0, 2.0)),
+    # A limit above host RAM is no limit
+    (128, (64.0, None, 64.0, 40.0)),
+])
+def test_get_ram_caps_by_cgroup_limit(tmp_path, monkeypatch, limit_gb, expected):
+    cgroup = limits(tmp_path, "0::/ollama\n", {
+        "cgroup.controllers": "memory",
+        "ollama/memory.max": str(limit_gb * GIB),
+        "ollama/memory.current": str(7 * GIB),
+        "ollama/memory.stat": f"inactive_file {GIB}",
+    })
+    monkeypatch.setattr(linux_system_information.psutil, "virtual_memory",
+                        lambda: VirtualMemory(total=64 * GIB, available=40 * GIB))
+    monkeypatch.setattr(linux_system_information, "CgroupLimits", lambda: cgroup)
+
+    ram = LinuxSystemInformation().get_ram()
+
+    assert ram.error is None
+    assert (ram.total_gb, ram.limit_gb, ram.effective_gb, ram.available_gb) == expected
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import os
+import pytest
+from chooseAI import parse_ollama
+from chooseAI.daemon import RecommendationDaemon
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conn = parse_ollama.init_db()
+    conn.execute(
+        "INSERT INTO models (name, description, sizes, tags, pulls, updated, type) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ("qwen-coder", "Code model with tool calling", json.dumps([{"value": 7.0, "unit": "b"}]),
+         json.dumps(["tools"]), 1000, "1 week ago", "code")
+    )
+    conn.commit()
+    conn.close()
+    return tmp_path / parse_ollama.DB_FILE
+
+
+def route(daemon, method, target):
+    return asyncio.run(daemon.route(method, target))
+
+
+def test_search_returns_results(catalog):
+    status, payload = route(RecommendationDaemon(app=None), "GET", "/search?q=code+tools&limit=3")
+    assert status == 200
+    assert [m["name"] for m in payload["results"]] == ["qwen-coder"]
+
+
+def test_search_does_not_write_or_wait_for_a_writer(catalog):
+    before = os.stat(catalog).st_mtime_ns
+    writer = parse_ollama.init_db()
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("UPDATE models SET pulls = 2000")
+    try:
+        status, payload = route(RecommendationDaemon(app=None), "GET", "/search?q=code")
+    finally:
+        writer.rollback()
+        writer.close()
+    assert status == 200 and len(payload["results"]) == 1
+    assert os.stat(catalog).st_mtime_ns == before
+
+
+@pytest.mark.parametrize("limit", ["abc", "-1", "0", "2.5"])
+def test_search_rejects_bad_limit(catalog, limit):
+    status, payload = route(RecommendationDaemon(app=None), "GET", f"/search?q=code&limit={limit}")
+    assert status == 400
+    assert "limit" in payload["error"]
+
+
+def test_refresh_task_is_kept_until_done():
+    daemon = RecommendationDaemon(app=None)
+    release = None
+
+    async def slow_refresh():
+        await release.wait()
+
+    daemon.refresh_catalog = slow_refresh
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        status, _ = await daemon.route("POST", "/refresh")
+        assert status == 202
+        assert len(daemon._background_tasks) == 1
+        release.set()
+        await asyncio.gather(*daemon._background_tasks)
+        await asyncio.sleep(0)
+        assert daemon._background_tasks == set()
+
+    asyncio.run(scenario())
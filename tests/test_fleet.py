@@ -0,0 +1,90 @@
+import csv
+import json
+import pytest
+from benchmarks.synthetic_catalog import make_synthetic_catalog
+from chooseAI import fleet
+from chooseAI.fleet import run_fleet
+
+WORKSTATION = {
+    "cpu": {"name": "Ryzen 9", "physical_cores": 16, "logical_cores": 32, "clock_speed_ghz": 4.5},
+    "gpus": [{"name": "RTX 4090", "vram_gb": 24.0, "index": 0}],
+    "ram": {"total_gb": 64.0},
+    "storage": {"total_gb": 2000.0, "free_gb": 1000.0},
+}
+LAPTOP = {
+    "cpu": {"name": "Core i5", "physical_cores": 4, "logical_cores": 8, "clock_speed_ghz": 2.4},
+    "gpus": [],
+    "ram": {"total_gb": 16.0},
+}
+
+CSV_HEADER = "host,cpu_name,physical_cores,logical_cores,clock_speed_ghz,gpu_name,vram_gb,ram_gb,storage_gb\n"
+
+
+@pytest.fixture
+def models():
+    return make_synthetic_catalog(80, seed=5)
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.mark.parametrize("read_ahead", [1, fleet.READ_AHEAD])
+def test_jsonl_dedup_order_and_errors(tmp_path, models, monkeypatch, read_ahead):
+    monkeypatch.setattr(fleet, "READ_AHEAD", read_ahead)
+    source = tmp_path / "hosts.jsonl"
+    source.write_text("\n".join([
+        json.dumps({"host": "ws-1", **WORKSTATION}),
+        json.dumps({"host": "laptop-1", **LAPTOP}),
+        "{not json",
+        json.dumps({"host": "ws-2", **WORKSTATION}),
+        "[1, 2]",
+        "null",
+        json.dumps({"host": "no-cpu", "ram": {"total_gb": 8.0}}),
+    ]) + "\n")
+    output = tmp_path / "out.jsonl"
+
+    stats = run_fleet(str(source), str(output), categories=["code"], max_results=3, models=models, workers=1)
+
+    assert stats == {"hosts": 7, "profiles_scored": 2, "errors": 4}
+    records = read_jsonl(output)
+    assert [r["host"] for r in records] == ["ws-1", "laptop-1", "line-3", "ws-2", "line-5", "line-6", "no-cpu"]
+    ws1, laptop, bad_json, ws2, array, null, no_cpu = records
+    assert ws1["profile"] == ws2["profile"] != laptop["profile"]
+    assert ws1["recommendations"] == ws2["recommendations"]
+    assert len(ws1["recommendations"]["code"]) == 3
+    assert bad_json["error"].startswith("Invalid JSON")
+    assert array["error"] == "Invalid profile: expected a JSON object, got list"
+    assert null["error"] == "Invalid profile: expected a JSON object, got NoneType"
+    assert no_cpu["error"].startswith("Invalid profile")
+
+
+def test_csv_input_and_output(tmp_path, models):
+    source = tmp_path / "hosts.csv"
+    source.write_text(CSV_HEADER + "".join([
+        "ws-1,Ryzen 9,16,32,4.5,RTX 4090,24,64,2000\n",
+        "ws-2,Ryzen 9,16,32,4.5,RTX 4090,24,64,2000\n",
+        "broken,Core i5,4,8,2.4,,,lots,500\n",
+        "dual,Xeon,32,64,3.0,A100;A100,80;80,512,4000\n",
+    ]))
+    output = tmp_path / "out.csv"
+
+    stats = run_fleet(str(source), str(output), categories=["general llm", "code"], max_results=2,
+                      models=models, workers=1)
+
+    assert stats == {"hosts": 4, "profiles_scored": 2, "errors": 1}
+    rows = read_csv(output)
+    assert [r["host"] for r in rows] == ["ws-1"] * 4 + ["ws-2"] * 4 + ["broken"] + ["dual"] * 4
+    assert [(r["category"], r["rank"]) for r in rows[:4]] == [("general llm", "1"), ("general llm", "2"),
+                                                             ("code", "1"), ("code", "2")]
+    strip = lambda r: {k: v for k, v in r.items() if k != "host"}
+    assert [strip(r) for r in rows[:4]] == [strip(r) for r in rows[4:8]]
+    broken = rows[8]
+    assert broken["error"].startswith("Invalid profile") and broken["model"] == ""
+    assert rows[9]["profile"] != rows[0]["profile"]
@@ -0,0 +1,50 @@
+from chooseAI import micro_benchmark
+from chooseAI.micro_benchmark import BANDWIDTH_MAX_TOTAL_MB, bandwidth_working_set_mb
+
+
+def test_working_set_scales_with_llc_within_limits():
+    assert bandwidth_working_set_mb(l3_cache_kb=32 * 1024) == 256
+    assert bandwidth_working_set_mb(l3_cache_kb=2 * 1024) == 64
+    assert bandwidth_working_set_mb(l3_cache_kb=512 * 1024) == BANDWIDTH_MAX_TOTAL_MB
+    # A container with 2 GB available gets at most a tenth of it
+    assert bandwidth_working_set_mb(l3_cache_kb=512 * 1024, available_ram_gb=2.0) == 204.8
+
+
+def test_total_bandwidth_allocation_is_capped(monkeypatch):
+    sizes = []
+
+    def fake_worker(size_mb, budget_s):
+        sizes.append(size_mb)
+        return lambda: 10.0
+
+    monkeypatch.setattr(micro_benchmark, "_bandwidth_worker", fake_worker)
+    monkeypatch.setattr(micro_benchmark, "measure_gemm_gflops", lambda budget_s: 100.0)
+
+    benchmark = micro_benchmark.run_micro_benchmark(threads=128, budget_s=0.01, l3_cache_kb=256 * 1024)
+
+    single, parallel = sizes[0], sizes[1:]
+    assert single * 2 == BANDWIDTH_MAX_TOTAL_MB
+    assert len(parallel) == benchmark.threads == 128
+    assert sum(parallel) * 2 == BANDWIDTH_MAX_TOTAL_MB
+
+
+def test_threads_are_reduced_when_buffers_would_be_too_small(monkeypatch):
+    monkeypatch.setattr(micro_benchmark, "_bandwidth_worker", lambda size_mb, budget_s: (lambda: 1.0))
+    monkeypatch.setattr(micro_benchmark, "measure_gemm_gflops", lambda budget_s: 100.0)
+
+    benchmark = micro_benchmark.run_micro_benchmark(threads=256, budget_s=0.01, available_ram_gb=0.5)
+
+    assert benchmark.threads == 25
+
+
+def test_cached_entries_from_older_versions_still_load(monkeypatch):
+    entry = {
+        "memory_bandwidth_gb_s": 50.0, "single_core_bandwidth_gb_s": 15.0, "fp32_gflops": 400.0,
+        "int8_gops": 20.0, "single_core_gflops": 10.0, "all_core_gflops": 80.0, "threads": 8,
+        "duration_s": 3.0, "fingerprint": "abc", "measured_at": 1.0,
+    }
+    monkeypatch.setattr(micro_benchmark, "load_json_cache", lambda name: {"abc": entry})
+
+    benchmark = micro_benchmark.load_cached_benchmark("abc")
+
+    assert (benchmark.memory_bandwidth_gb_s, benchmark.fp32_gflops, benchmark.threads) == (50.0, 400.0, 8)
@@ -0,0 +1,95 @@
+import math
+import pytest
+from chooseAI.memory_estimator import estimate_memory_footprint
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.models.throughput import HardwareRates
+from chooseAI.throughput import gpu_layer_capacity, plan_offload, predict_throughput
+
+DESKTOP = HardwareRates(cpu_bandwidth_gb_s=60.0, cpu_gflops=1000.0)
+# A many-channel server whose RAM outruns a small, old GPU
+SERVER = HardwareRates(cpu_bandwidth_gb_s=200.0, cpu_gflops=4000.0)
+
+
+@pytest.fixture
+def footprint_8b():
+    return estimate_memory_footprint(8.0)
+
+
+def layers_that_fit(footprint, vram_gb: float) -> int:
+    layers, _, layer_gb = gpu_layer_capacity(footprint, None)
+    return min(layers, math.floor((vram_gb - footprint.overhead_gb) / layer_gb))
+
+
+@pytest.mark.parametrize("gpus", [None, [], [GPUInfo(name="No GPU detected", vram_gb=0.0)]])
+def test_no_gpu_runs_everything_on_cpu(footprint_8b, gpus):
+    layers, gpu_layers, _ = gpu_layer_capacity(footprint_8b, gpus)
+    assert gpu_layers == 0
+
+    plan, generation_s, _ = plan_offload(footprint_8b, DESKTOP, gpus)
+    assert (plan.num_gpu, plan.cpu_layers, plan.gpu_fraction) == (0, layers, 0.0)
+    assert plan.cpu_gb == pytest.approx(footprint_8b.total_gb)
+    assert plan.speed_penalty == 0.0
+    assert generation_s > 0
+
+
+def test_full_fit_on_one_gpu(footprint_8b):
+    gpus = [GPUInfo(name="RTX 4090", vram_gb=24.0)]
+    layers, gpu_layers, _ = gpu_layer_capacity(footprint_8b, gpus)
+    assert gpu_layers == layers
+
+    plan, _, _ = plan_offload(footprint_8b, DESKTOP, gpus)
+    assert plan.gpu_layers == [layers]
+    assert (plan.cpu_layers, plan.cpu_gb, plan.speed_penalty) == (0, 0.0, 0.0)
+
+
+def test_partial_fit_spills_to_cpu(footprint_8b):
+    gpus = [GPUInfo(name="GTX 1650", vram_gb=4.0)]
+    expected = layers_that_fit(footprint_8b, 4.0)
+
+    plan, generation_s, _ = plan_offload(footprint_8b, DESKTOP, gpus)
+    _, cpu_only_s, _ = plan_offload(footprint_8b, DESKTOP, None)
+
+    assert 0 < expected < plan.total_layers
+    assert plan.gpu_layers == [expected]
+    assert plan.cpu_layers == plan.total_layers - expected
+    assert 0 < plan.cpu_gb < footprint_8b.total_gb
+    assert 0 < plan.speed_penalty < 1
+    assert generation_s < cpu_only_s
+    assert predict_throughput(footprint_8b, DESKTOP, gpus).gpu_fraction == pytest.approx(plan.gpu_fraction)
+
+
+def test_subset_search_drops_slow_gpu():
+    footprint = estimate_memory_footprint(14.0)
+    slow = GPUInfo(name="GTX 1050 Ti", vram_gb=4.0, index=0)
+    fast = GPUInfo(name="RTX 3060 Ti", vram_gb=8.0, index=1)
+    fast_layers = layers_that_fit(footprint, 8.0)
+
+    plan, _, _ = plan_offload(footprint, SERVER, [slow, fast])
+
+    assert plan.gpu_indices == [1]
+    assert plan.gpu_layers == [fast_layers]
+    assert plan.cpu_layers == plan.total_layers - fast_layers
+
+
+def test_both_gpus_used_when_cpu_is_slower():
+    footprint = estimate_memory_footprint(14.0)
+    slow = GPUInfo(name="GTX 1050 Ti", vram_gb=4.0, index=0)
+    fast = GPUInfo(name="RTX 3060 Ti", vram_gb=8.0, index=1)
+
+    plan, _, _ = plan_offload(footprint, DESKTOP, [slow, fast])
+
+    # The fastest card is filled first
+    assert plan.gpu_indices == [1, 0]
+    assert plan.cpu_layers == 0
+
+
+def test_free_vram_limits_offload(footprint_8b):
+    busy = GPUInfo(name="RTX 4090", vram_gb=24.0, free_vram_gb=3.0)
+    expected = layers_that_fit(footprint_8b, 3.0)
+
+    _, gpu_layers, _ = gpu_layer_capacity(footprint_8b, [busy])
+    plan, _, _ = plan_offload(footprint_8b, DESKTOP, [busy])
+
+    assert gpu_layers == expected < plan.total_layers
+    assert plan.gpu_layers == [expected]
+    assert plan.cpu_layers == plan.total_layers - expected
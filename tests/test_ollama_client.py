@@ -0,0 +1,85 @@
+import pytest
+import requests
+from chooseAI.ollama_client import OllamaClient, resolve_ollama_host
+from chooseAI.inventory import ModelInventory
+
+
+def test_resolve_ollama_host(monkeypatch):
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    assert resolve_ollama_host() == "http://127.0.0.1:11434"
+    monkeypatch.setenv("OLLAMA_HOST", "0.0.0.0:11500")
+    assert resolve_ollama_host() == "http://0.0.0.0:11500"
+    assert resolve_ollama_host("https://ollama.lan/") == "https://ollama.lan"
+    # Without a scheme or port, Ollama's default port applies
+    monkeypatch.setenv("OLLAMA_HOST", "0.0.0.0")
+    assert resolve_ollama_host() == "http://0.0.0.0:11434"
+    assert resolve_ollama_host("localhost") == "http://localhost:11434"
+    assert resolve_ollama_host("localhost/") == "http://localhost:11434"
+    assert resolve_ollama_host("[::1]") == "http://[::1]:11434"
+    assert resolve_ollama_host("ollama.lan:8080") == "http://ollama.lan:8080"
+    # An explicit scheme keeps its own default port, as in Ollama
+    assert resolve_ollama_host("http://localhost") == "http://localhost"
+
+
+def test_list_models_and_running(fake_ollama, ollama_client):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B", loaded=True, size_vram=3_000_000_000)
+    fake_ollama.add_model("qwen2.5-coder:7b", 4_700_000_000, "7.6B")
+
+    assert [m["name"] for m in ollama_client.list_models()] == ["gemma3:4b", "qwen2.5-coder:7b"]
+    running = ollama_client.list_running()
+    assert [m["name"] for m in running] == ["gemma3:4b"]
+    assert running[0]["size_vram"] == 3_000_000_000
+
+
+def test_unload_sends_keep_alive_zero(fake_ollama, ollama_client):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B", loaded=True)
+
+    ollama_client.unload("gemma3:4b")
+
+    assert fake_ollama.generate_calls() == [{"model": "gemma3:4b", "keep_alive": 0}]
+    assert ollama_client.list_running() == []
+
+
+def test_http_error_raises(fake_ollama, ollama_client):
+    fake_ollama.errors["/api/tags"] = (500, '{"error": "boom"}')
+    with pytest.raises(requests.HTTPError):
+        ollama_client.list_models()
+
+
+def test_invalid_json_raises(fake_ollama, ollama_client):
+    fake_ollama.errors["/api/ps"] = (200, "not json")
+    with pytest.raises(ValueError):
+        ollama_client.list_running()
+
+
+def test_unreachable_server_raises(fake_ollama):
+    url = fake_ollama.url
+    fake_ollama.stop()
+    client = OllamaClient(host=url, timeout=0.5)
+    with pytest.raises(requests.ConnectionError):
+        client.list_models()
+
+
+def test_inventory_records_sizes_quantization_and_loaded(fake_ollama, ollama_client):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B", "Q4_K_M", loaded=True, size_vram=3_000_000_000)
+    fake_ollama.add_model("llama3.1:8b-instruct-q8_0", 8_500_000_000, "8.0B", "Q8_0")
+
+    inventory = ModelInventory(ollama_client).refresh()
+
+    assert inventory.error is None
+    gemma = inventory.models["gemma3:4b"]
+    assert (gemma.size_bytes, gemma.quantization, gemma.loaded, gemma.size_vram_bytes) == \
+        (3_300_000_000, "Q4_K_M", True, 3_000_000_000)
+    llama = inventory.models["llama3.1:8b-instruct-q8_0"]
+    assert (llama.parameter_size, llama.quantization, llama.loaded) == ("8.0B", "Q8_0", False)
+    assert [m.name for m in inventory.loaded()] == ["gemma3:4b"]
+
+
+def test_inventory_reports_errors(fake_ollama, ollama_client):
+    fake_ollama.add_model("gemma3:4b", 3_300_000_000, "4.3B")
+    fake_ollama.errors["/api/ps"] = (503, '{"error": "starting"}')
+
+    inventory = ModelInventory(ollama_client).refresh()
+
+    assert inventory.models == {}
+    assert inventory.error.startswith("Failed to query local Ollama")
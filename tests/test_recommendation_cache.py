@@ -0,0 +1,77 @@
+import sqlite3
+import pytest
+from benchmarks.bench_scoring import CATEGORIES, reference_system_info
+from benchmarks.synthetic_catalog import make_synthetic_catalog, write_catalog_db
+from chooseAI import recommendation_cache
+from chooseAI.chooseAI import ChooseAI
+from chooseAI.parse_ollama import DB_FILE, init_db
+from chooseAI.recommendation_cache import RecommendationCache
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_catalog_db(make_synthetic_catalog(100, seed=3), init_db())
+
+
+def recommend(use_cache=True):
+    app = ChooseAI(use_cache=use_cache)
+    app.system_info = reference_system_info()
+    results = app.get_all_recommendations(CATEGORIES)
+    rankings = {c: [(r["model"]["name"], r["total_score"], r["throughput"]) for r in recs]
+                for c, recs in results.items()}
+    return app, rankings
+
+
+def stats():
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        return conn.execute("SELECT hits, misses FROM recommendation_cache_stats").fetchone()
+    finally:
+        conn.close()
+
+
+def test_hit_returns_stored_rankings_without_loading_catalog(catalog):
+    _, fresh = recommend(use_cache=False)
+    first, stored = recommend()
+    second, cached = recommend()
+
+    assert first.feature_table is not None
+    assert second.feature_table is None
+    assert stored == fresh
+    assert cached == fresh
+    assert stats() == (len(CATEGORIES), len(CATEGORIES))
+
+
+def test_catalog_change_invalidates(catalog):
+    recommend()
+    conn = sqlite3.connect(DB_FILE)
+    conn.execute("UPDATE models SET pulls = 1 WHERE name = 'model-0'")
+    conn.commit()
+    conn.close()
+
+    app, _ = recommend()
+
+    assert app.feature_table is not None
+    assert stats() == (0, 2 * len(CATEGORIES))
+
+
+def test_entries_are_capped(catalog, monkeypatch):
+    monkeypatch.setattr(recommendation_cache, "MAX_CACHE_ENTRIES", 3)
+    cache = RecommendationCache()
+    for i in range(5):
+        cache.put(f"key-{i}", "code", [])
+    keys = [k for k, in cache.conn.execute("SELECT key FROM recommendation_cache ORDER BY created_at, rowid")]
+    cache.close()
+
+    assert keys == ["key-2", "key-3", "key-4"]
+
+
+def test_lookups_write_nothing_until_close(catalog):
+    recommend()
+    cache = RecommendationCache()
+    cache.get("missing")
+    assert stats() == (0, len(CATEGORIES))
+    assert cache.lifetime_stats() == {"hits": 0, "misses": len(CATEGORIES) + 1}
+    cache.close()
+    assert stats() == (0, len(CATEGORIES) + 1)
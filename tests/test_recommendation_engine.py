@@ -0,0 +1,36 @@
+from benchmarks.bench_scoring import CATEGORIES, ranking, reference_system_info
+from benchmarks.synthetic_catalog import make_synthetic_catalog
+from chooseAI import recommendation_engine
+from chooseAI.recommendation_engine import ModelRecommendationEngine
+
+
+def test_scalar_and_vectorized_paths_agree():
+    engine = ModelRecommendationEngine()
+    system_info = reference_system_info()
+    models = make_synthetic_catalog(300, seed=1)
+    table = engine.build_feature_table(models)
+
+    vectorized = engine.recommend_all(system_info, table, CATEGORIES, 10)
+    for category in CATEGORIES:
+        assert ranking(engine.recommend_models(system_info, models, category, 10)) == ranking(vectorized[category])
+
+
+def test_throughput_is_predicted_once_per_model(monkeypatch):
+    calls = []
+    original = recommendation_engine.predict_throughput
+
+    def counting_predict_throughput(*args, **kwargs):
+        calls.append(args[0].parameters_b)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(recommendation_engine, "predict_throughput", counting_predict_throughput)
+    engine = ModelRecommendationEngine()
+    models = make_synthetic_catalog(50, seed=2)
+
+    engine.recommend_models(reference_system_info(), models, "code", 5)
+    assert len(calls) == len(models)
+
+    calls.clear()
+    table = engine.build_feature_table(models)
+    engine.recommend_all(reference_system_info(), table, ["code"], 5)
+    assert len(calls) == len(table.size_labels)
@@ -0,0 +1,64 @@
+import pytest
+from chooseAI.models.cpu import CPUInfo
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.recommendation_engine import ModelRecommendationEngine
+from chooseAI.throughput import NUMA_SPAN_EFFICIENCY, estimate_hardware_rates
+
+NO_GPU = GPUInfo(name="No GPU detected", vram_gb=0.0)
+
+
+@pytest.fixture
+def numa_cpu():
+    # Two nodes of 16 cores (32 threads) and 64 GB each
+    return CPUInfo(name="Server CPU", physical_cores=32, logical_cores=64, clock_speed_ghz=3.0,
+                   numa_cpus=[32, 32], numa_memory_gb=[64.0, 64.0])
+
+
+def test_pinned_node_uses_local_bandwidth(numa_cpu):
+    spanning = estimate_hardware_rates(numa_cpu)
+    pinned = estimate_hardware_rates(numa_cpu, numa_node=0)
+
+    assert spanning.cpu_bandwidth_gb_s == pytest.approx(8.0 * 32 * NUMA_SPAN_EFFICIENCY)
+    assert pinned.cpu_bandwidth_gb_s == pytest.approx(8.0 * 16)
+    assert pinned.cpu_gflops == pytest.approx(spanning.cpu_gflops / 2)
+
+
+def test_throughput_matches_emitted_numa_settings(numa_cpu):
+    engine = ModelRecommendationEngine()
+
+    small = engine.predict_throughput(numa_cpu, NO_GPU, "8b", [NO_GPU])
+    small_settings = engine.recommend_runtime_settings(numa_cpu, "8b", small, [NO_GPU])
+    assert small_settings.numa_node == 0
+    assert small_settings.num_thread == 16
+    pinned_rates = estimate_hardware_rates(numa_cpu, numa_node=0)
+    expected = engine.estimate_footprint("8b").weights_gb * (1024 ** 3) / 1e9 / (pinned_rates.cpu_bandwidth_gb_s * 0.7)
+    assert 1 / small.generation_tokens_per_sec == pytest.approx(expected)
+
+    # 405B does not fit in one node's 64 GB, so it spans both and pays the remote-read penalty
+    large = engine.predict_throughput(numa_cpu, NO_GPU, "405b", [NO_GPU])
+    large_settings = engine.recommend_runtime_settings(numa_cpu, "405b", large, [NO_GPU])
+    assert large_settings.numa and large_settings.numa_node is None
+    spanning_rates = estimate_hardware_rates(numa_cpu)
+    expected = engine.estimate_footprint("405b").weights_gb * (1024 ** 3) / 1e9 / (spanning_rates.cpu_bandwidth_gb_s * 0.7)
+    assert 1 / large.generation_tokens_per_sec == pytest.approx(expected)
+
+
+def test_cpu_only_host_omits_num_gpu():
+    engine = ModelRecommendationEngine()
+    cpu = CPUInfo(name="Laptop CPU", physical_cores=8, logical_cores=16, clock_speed_ghz=3.0)
+
+    throughput = engine.predict_throughput(cpu, NO_GPU, "8b", [NO_GPU])
+    options = engine.recommend_runtime_settings(cpu, "8b", throughput, [NO_GPU]).options()
+
+    assert options == {"num_thread": 8}
+
+
+def test_gpu_host_keeps_num_gpu():
+    engine = ModelRecommendationEngine()
+    cpu = CPUInfo(name="Desktop CPU", physical_cores=8, logical_cores=16, clock_speed_ghz=3.0)
+    gpus = [GPUInfo(name="RTX 4090", vram_gb=24.0)]
+
+    throughput = engine.predict_throughput(cpu, gpus[0], "8b", gpus)
+    options = engine.recommend_runtime_settings(cpu, "8b", throughput, gpus).options()
+
+    assert options["num_gpu"] == throughput.offload.total_layers
@@ -0,0 +1,43 @@
+import json
+import pytest
+from chooseAI import parse_ollama
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conn = parse_ollama.init_db()
+    models = [
+        ("qwen-coder", "Code model with tool calling", [7.0], ["tools"], "code"),
+        ("starcoder", "Code completion", [8.0, 15.0], [], "code"),
+        ("llama-chat", "General chat with tools", [3.0], ["tools"], "general llm"),
+        ("llama-big", "General chat", [70.0], [], "general llm"),
+    ]
+    for name, description, sizes, tags, model_type in models:
+        conn.execute(
+            "INSERT INTO models (name, description, sizes, tags, pulls, updated, type) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (name, description, json.dumps([{"value": s, "unit": "b"} for s in sizes]), json.dumps(tags),
+             1000, "1 week ago", model_type)
+        )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def names(results):
+    return {m["name"] for m in results}
+
+
+def test_every_term_must_match(conn):
+    assert names(parse_ollama.search_models("code models supporting tools", conn=conn)) == {"qwen-coder"}
+
+
+def test_falls_back_to_any_term(conn):
+    assert names(parse_ollama.search_models("completion vision", conn=conn)) == {"starcoder"}
+    assert parse_ollama.search_models("vision", conn=conn) == []
+
+
+def test_size_buckets_do_not_overlap(conn):
+    assert names(parse_ollama.search_models("small code", conn=conn)) == {"qwen-coder"}
+    assert names(parse_ollama.search_models("medium code", conn=conn)) == {"starcoder"}
+    assert names(parse_ollama.search_models("huge", conn=conn)) == {"llama-big"}
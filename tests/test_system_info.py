@@ -0,0 +1,146 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import pytest
+from chooseAI import systemInfo
+from chooseAI.gpu_memory import parse_nvidia_free_vram
+from chooseAI.models.cpu import CPUInfo
+from chooseAI.models.gpu import GPUInfo
+from chooseAI.models.ram import RAMInfo
+from chooseAI.models.storage import StorageInfo
+from chooseAI.systemInfo import STATIC_CACHE_FILE, SystemInformation
+
+
+class FakeSystemInformation(SystemInformation):
+    def __init__(self):
+        self.calls = []
+        self.free_vram = 20.0
+        self.cpu_name = "Test CPU"
+
+    def get_cpu(self) -> CPUInfo:
+        self.calls.append("cpu")
+        return CPUInfo(name=self.cpu_name, physical_cores=8, logical_cores=16, clock_speed_ghz=3.5)
+
+    def get_gpu(self) -> GPUInfo:
+        return self.get_gpus()[0]
+
+    def get_gpus(self):
+        self.calls.append("gpus")
+        return [GPUInfo(name="Test GPU", vram_gb=24.0, free_vram_gb=self.free_vram)]
+
+    def get_free_vram_gb(self):
+        self.calls.append("free_vram")
+        return {0: self.free_vram}
+
+    def get_ram(self) -> RAMInfo:
+        self.calls.append("ram")
+        return RAMInfo(total_gb=32.0, available_gb=20.0)
+
+    def get_storage(self) -> StorageInfo:
+        self.calls.append("storage")
+        return StorageInfo(total_gb=1000.0, free_gb=500.0)
+
+
+@pytest.fixture
+def cache_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    writes = []
+    save = systemInfo.save_json_cache
+
+    def counting_save(name, data):
+        writes.append(data)
+        save(name, data)
+
+    monkeypatch.setattr(systemInfo, "save_json_cache", counting_save)
+    return writes
+
+
+def test_first_run_probes_everything_and_caches_identity_only(cache_writes, tmp_path):
+    info = FakeSystemInformation().get_system_info()
+
+    assert info["cached_probes"] == []
+    assert info["gpu"].free_vram_gb == 20.0
+    with open(tmp_path / "chooseAI" / STATIC_CACHE_FILE) as f:
+        cached = json.load(f)
+    assert cached["gpus"] == [{"name": "Test GPU", "vram_gb": 24.0, "index": 0}]
+    assert len(cache_writes) == 1
+
+
+def test_cached_run_queries_free_vram_live(cache_writes):
+    FakeSystemInformation().get_system_info()
+    handler = FakeSystemInformation()
+    handler.free_vram = 6.5
+
+    info = handler.get_system_info()
+
+    assert info["cached_probes"] == ["cpu", "gpus"]
+    assert sorted(handler.calls) == ["free_vram", "ram", "storage"]
+    assert info["gpu"].free_vram_gb == 6.5
+    assert info["gpus"][0].vram_gb == 24.0
+
+
+def test_cached_run_does_not_rewrite_cache(cache_writes):
+    for _ in range(3):
+        FakeSystemInformation().get_system_info()
+    assert len(cache_writes) == 1
+
+
+def test_refresh_replaces_stale_cache(cache_writes):
+    FakeSystemInformation().get_system_info()
+    handler = FakeSystemInformation()
+    handler.cpu_name = "Upgraded CPU"
+
+    info = handler.get_system_info(use_cache=False)
+
+    assert info["cpu"].name == "Upgraded CPU"
+    assert FakeSystemInformation().get_system_info()["cpu"].name == "Upgraded CPU"
+    assert len(cache_writes) == 2
+
+
+def test_unchanged_refresh_does_not_rewrite_cache(cache_writes):
+    FakeSystemInformation().get_system_info()
+    FakeSystemInformation().get_system_info(use_cache=False)
+    assert len(cache_writes) == 1
+
+
+class HungGPUSystemInformation(FakeSystemInformation):
+    def get_gpus(self):
+        time.sleep(3)
+        return super().get_gpus()
+
+
+def test_hung_probe_times_out(cache_writes, monkeypatch):
+    monkeypatch.setitem(systemInfo.PROBE_TIMEOUTS, "gpus", 0.2)
+    start = time.perf_counter()
+
+    info = HungGPUSystemInformation().get_system_info()
+
+    assert time.perf_counter() - start < 1.0
+    assert "timed out after 0.2s" in info["gpu"].error
+    assert info["cpu"].name == "Test CPU"
+    assert cache_writes == []
+
+
+def test_hung_probe_does_not_delay_process_exit(tmp_path):
+    script = (
+        "from chooseAI import systemInfo\n"
+        "from tests.test_system_info import HungGPUSystemInformation\n"
+        "systemInfo.PROBE_TIMEOUTS['gpus'] = 0.2\n"
+        "print(HungGPUSystemInformation().get_system_info()['gpu'].error)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True,
+                            env={**os.environ, "XDG_CACHE_HOME": str(tmp_path)}, timeout=30)
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr
+    assert "timed out" in result.stdout
+    # The probe sleeps 3 s; exiting well before that means the thread was abandoned
+    assert elapsed < 2.5
+
+
+def test_parse_nvidia_free_vram():
+    assert parse_nvidia_free_vram("0, 20480\n1, 1024\n\nbad line\n") == {0: 20.0, 1: 1.0}
@@ -0,0 +1,62 @@
+import json
+import pstats
+import threading
+import time
+from chooseAI.tracing import Tracer
+
+
+def busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.span("load"):
+        pass
+    assert tracer.events == []
+
+
+def test_chrome_trace_and_hot_stage(tmp_path):
+    tracer = Tracer()
+    tracer.enable(profile_stages=True)
+
+    with tracer.span("load", models=3):
+        with tracer.span("parse"):
+            busy(0.01)
+    for _ in range(2):
+        with tracer.span("score"):
+            busy(0.03)
+
+    def in_thread():
+        with tracer.span("probe"):
+            busy(0.001)
+
+    worker = threading.Thread(target=in_thread)
+    worker.start()
+    worker.join()
+
+    trace_path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(str(trace_path))
+    with open(trace_path) as f:
+        trace = json.load(f)
+
+    events = trace["traceEvents"]
+    assert sorted(e["name"] for e in events) == \
+        ["load", "parse", "probe", "score", "score"]
+    assert all(e["ph"] == "X" and e["ts"] >= 0 and e["dur"] >= 0 for e in events)
+    assert [e["ts"] for e in events] == sorted(e["ts"] for e in events)
+    by_name = {e["name"]: e for e in events}
+    assert by_name["load"]["args"] == {"models": "3"}
+    # The nested span lies within its parent
+    load, parse = by_name["load"], by_name["parse"]
+    assert load["ts"] <= parse["ts"] and parse["ts"] + parse["dur"] <= load["ts"] + load["dur"]
+
+    # Only top-level spans of the main thread are profiled
+    assert set(tracer.stage_profiles) == {"load", "score"}
+    assert len(tracer.stage_profiles["score"]) == 2
+
+    stats_path = tmp_path / "hot.pstats"
+    assert tracer.write_hot_stage_stats(str(stats_path)) == "score"
+    assert any(func[2] == "busy" for func in pstats.Stats(str(stats_path)).stats)